@@ -0,0 +1,141 @@
+"""Latency of the skill analytics endpoint against computing it on request.
+
+Run from the ``backend`` directory:
+
+    python -m benchmarks.analytics_benchmark
+    python -m benchmarks.analytics_benchmark --consultants 50000 --database /tmp/analytics-bench.db
+
+Builds the matching benchmark's corpus (``--consultants`` consultants with
+skill and project blocks, indexed through ``term_index``, so the analytics
+triggers fill the aggregate tables as block writes do). Then times reading the
+analytics, computing the same figures by parsing every block, a single block
+edit (postings, term vector and aggregates) and a full rebuild. Reads should
+stay flat as ``--consultants`` grows. The exit code is 1 when the analytics
+read median exceeds ``--budget-ms``.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.matching_benchmark import BACKEND_DIR, build_database
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DEFAULT_RESULTS_PATH = BENCHMARK_DIR / "results" / "analytics.json"
+
+
+def _timed(function, iterations: int) -> dict:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[math.ceil(len(timings) * 0.95) - 1], 3),
+    }
+
+
+def _on_request(conn) -> None:
+    """What the endpoint would do without the aggregates: parse every active block."""
+    from src.core.database import list_from_rows
+    from src.services.term_index import posting_rows
+
+    skill_levels: Counter = Counter()
+    technology_years: Counter = Counter()
+    cursor = conn.execute("SELECT * FROM blocks WHERE is_active = 1 AND block_type IN ('project', 'skill')")
+    while blocks := list_from_rows(cursor.fetchmany(1000)):
+        postings = (row for block in blocks for row in posting_rows(block))
+        for term, _, consultant_id, kind, _, label, year, is_title_part in postings:
+            if is_title_part:
+                continue
+            if kind == "skill":
+                skill_levels[(term, label, consultant_id)] += 1
+            else:
+                technology_years[(term, year)] += 1
+
+
+def run(iterations: int, limit: int) -> dict:
+    from src.core.database import get_db, list_from_rows
+    from src.services import analytics_service, term_index
+
+    results = {}
+    with get_db() as conn:
+        results["consultants"] = conn.execute("SELECT COUNT(*) FROM consultants").fetchone()[0]
+        results["blocks"] = conn.execute("SELECT COUNT(*) FROM blocks WHERE is_active = 1").fetchone()[0]
+        results["analytics"] = _timed(
+            lambda: asyncio.run(analytics_service.get_skill_analytics(conn, limit)), iterations
+        )
+        results["on_request"] = _timed(lambda: _on_request(conn), max(iterations // 10, 1))
+
+        skill = list_from_rows(conn.execute(
+            "SELECT * FROM blocks WHERE block_type = 'skill' ORDER BY id DESC LIMIT 1"
+        ).fetchall())[0]
+        levels = iter(["Expert", "Basic"] * iterations)
+
+        def edit() -> None:
+            skill["proficiency_level"] = next(levels)
+            conn.execute("UPDATE blocks SET proficiency_level = ? WHERE id = ?", (skill["proficiency_level"], skill["id"]))
+            term_index.index_blocks(conn, [skill])
+
+        results["block_edit"] = _timed(edit, iterations)
+        results["rebuild"] = _timed(lambda: analytics_service.rebuild(conn), 3)
+        conn.rollback()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark skill analytics latency.")
+    parser.add_argument("--consultants", type=int, default=10_000, help="Consultants in the synthetic corpus.")
+    parser.add_argument("--database", type=Path, help="Reuse (or create) this database instead of a temporary one.")
+    parser.add_argument("--iterations", type=int, default=50, help="Timed analytics reads and block edits.")
+    parser.add_argument("--limit", type=int, default=50, help="Skills and technologies returned, as the endpoint default.")
+    parser.add_argument("--budget-ms", type=float, default=10.0, help="Allowed median latency of an analytics read.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS_PATH, help="Where to write results JSON.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.database or Path(tmp) / "analytics.db"
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+        sys.path.insert(0, str(BACKEND_DIR))
+        index_seconds = None
+        if not path.exists():
+            index_seconds = build_database(path, args.consultants)
+            print(f"Indexed {args.consultants} consultants in {index_seconds:.1f} s")
+        results = run(args.iterations, args.limit)
+
+    print(f"{results['consultants']} consultants, {results['blocks']} blocks")
+    for name in ("analytics", "on_request", "block_edit", "rebuild"):
+        print(f"{name:<12} median {results[name]['median_ms']:>10.3f} ms  p95 {results[name]['p95_ms']:>10.3f} ms")
+    report = {
+        "benchmark": "analytics",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "index_seconds": index_seconds,
+        "budget_ms": args.budget_ms,
+        **results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Results written to {args.output}")
+
+    if results["analytics"]["median_ms"] > args.budget_ms:
+        print(f"Over the {args.budget_ms:g} ms budget: analytics")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+"""Rows rewritten by block moves, including moves right after creating blocks.
+
+Run from the ``backend`` directory:
+
+    python -m benchmarks.block_order_benchmark
+    python -m benchmarks.block_order_benchmark --blocks 200 --rounds 50
+
+Migrates a fresh database with one consultant holding ``--blocks`` blocks, then
+repeats rounds of: create a block without an order, move the last block to the
+top, move another block right after the new one. Rebalances the moves ask for
+run between rounds, as the reorder route schedules them. The exit code is 1
+when any move rewrote more than one row.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = BENCHMARK_DIR.parent
+DEFAULT_RESULTS_PATH = BENCHMARK_DIR / "results" / "block_order.json"
+
+
+def _orders(conn, consultant_id: int) -> dict[int, int]:
+    cursor = conn.execute('SELECT id, "order" FROM blocks WHERE consultant_id = ? AND is_active = 1', (consultant_id,))
+    return {row["id"]: row["order"] for row in cursor.fetchall()}
+
+
+def _display_ids(conn, consultant_id: int) -> list[int]:
+    cursor = conn.execute(
+        'SELECT id FROM blocks WHERE consultant_id = ? AND is_active = 1 ORDER BY "order", created_at DESC',
+        (consultant_id,),
+    )
+    return [row["id"] for row in cursor.fetchall()]
+
+
+def run(blocks: int, rounds: int) -> dict:
+    from src.core.database import get_db
+    from src.schemas.block import BlockMove, SkillBlockCreate
+    from src.services import block_service
+
+    with get_db() as conn:
+        consultant_id = conn.execute(
+            """INSERT INTO consultants (first_name, last_name, email, title, created_by_admin_id)
+               VALUES ('Bench', 'Order', 'bench.order@example.com', 'Consultant', 1) RETURNING id"""
+        ).fetchone()[0]
+        asyncio.run(block_service.create_blocks(
+            conn, consultant_id, [SkillBlockCreate(title=f"Skill {index}") for index in range(blocks)]
+        ))
+
+    rows_per_move: list[int] = []
+    timings: list[float] = []
+    rebalances = 0
+    for round_number in range(rounds):
+        with get_db() as conn:
+            created = asyncio.run(block_service.create_block(
+                conn, consultant_id, SkillBlockCreate(title=f"New skill {round_number}")
+            ))
+            display = _display_ids(conn, consultant_id)
+            needs_rebalance = False
+            for move in (BlockMove(id=display[-1]), BlockMove(id=display[-2], after_id=created["id"])):
+                before = _orders(conn, consultant_id)
+                started = time.perf_counter()
+                needs_rebalance = asyncio.run(block_service.move_blocks(conn, consultant_id, [move])) or needs_rebalance
+                timings.append((time.perf_counter() - started) * 1000)
+                after = _orders(conn, consultant_id)
+                rows_per_move.append(sum(after[block_id] != order for block_id, order in before.items()))
+        if needs_rebalance:
+            with get_db() as conn:
+                asyncio.run(block_service.rebalance_block_orders(conn, consultant_id))
+            rebalances += 1
+
+    return {
+        "blocks": blocks,
+        "rounds": rounds,
+        "moves": len(rows_per_move),
+        "max_rows_per_move": max(rows_per_move, default=0),
+        "moves_rewriting_many": sum(rows > 1 for rows in rows_per_move),
+        "rebalances": rebalances,
+        "move_median_ms": round(statistics.median(timings), 3) if timings else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Check and time single-row block moves.")
+    parser.add_argument("--blocks", type=int, default=100, help="Blocks the consultant starts with.")
+    parser.add_argument("--rounds", type=int, default=30, help="Create-then-move rounds.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS_PATH, help="Where to write results JSON.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "block-order.db"
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+        subprocess.run(
+            [sys.executable, "-m", "alembic", "upgrade", "head"],
+            cwd=BACKEND_DIR, env=os.environ.copy(), check=True, capture_output=True,
+        )
+        sys.path.insert(0, str(BACKEND_DIR))
+        results = run(args.blocks, args.rounds)
+
+    print(
+        f"{results['moves']} moves, at most {results['max_rows_per_move']} rows each, "
+        f"{results['rebalances']} rebalances, median {results['move_median_ms']} ms"
+    )
+    report = {
+        "benchmark": "block_order",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        **results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Results written to {args.output}")
+
+    if results["moves_rewriting_many"]:
+        print(f"{results['moves_rewriting_many']} moves rewrote more than one row")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
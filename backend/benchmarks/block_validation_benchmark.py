@@ -0,0 +1,113 @@
+"""Compare block create validation through the plain and the discriminated union.
+
+Run from the ``backend`` directory:
+
+    python -m benchmarks.block_validation_benchmark
+    python -m benchmarks.block_validation_benchmark --payloads 5000 --invalid-share 0.2
+
+"plain" is the undiscriminated ``ProjectBlockCreate | SkillBlockCreate | ...``
+union that tries members in turn; "discriminated" is ``BlockCreate``, which
+dispatches on ``block_type``. Each case validates a mixed list in one call and
+then item by item (catching errors), as a bulk or import path would.
+"""
+
+import argparse
+import json
+import platform
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic import TypeAdapter, ValidationError
+
+from benchmarks.synthetic import build_block_payloads
+from src.schemas.block import (
+    BlockCreate,
+    CertificationBlockCreate,
+    MiscBlockCreate,
+    ProjectBlockCreate,
+    SkillBlockCreate,
+)
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DEFAULT_RESULTS_PATH = BENCHMARK_DIR / "results" / "block_validation.json"
+
+PLAIN_BLOCK_CREATE = ProjectBlockCreate | SkillBlockCreate | CertificationBlockCreate | MiscBlockCreate
+
+
+def _best_seconds(function, iterations: int) -> float:
+    """Return the fastest of ``iterations`` timed calls after one warm-up call."""
+    function()
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def _validate_each(adapter: TypeAdapter, payloads: list[dict]) -> int:
+    """Validate payloads one by one and return the number of rejected payloads."""
+    rejected = 0
+    for payload in payloads:
+        try:
+            adapter.validate_python(payload)
+        except ValidationError as exc:
+            exc.errors()
+            rejected += 1
+    return rejected
+
+
+def run_case(variant: str, annotation, payloads: list[dict], iterations: int) -> dict:
+    """Time list and per-item validation of ``payloads`` against one union variant."""
+    item_adapter = TypeAdapter(annotation)
+    list_adapter = TypeAdapter(list[annotation])
+    valid = [payload for payload in payloads if payload["title"]]
+
+    list_seconds = _best_seconds(lambda: list_adapter.validate_python(valid), iterations)
+    each_seconds = _best_seconds(lambda: _validate_each(item_adapter, payloads), iterations)
+    return {
+        "variant": variant,
+        "list_payloads": len(valid),
+        "list_payloads_per_second": round(len(valid) / list_seconds),
+        "each_payloads": len(payloads),
+        "rejected": _validate_each(item_adapter, payloads),
+        "each_payloads_per_second": round(len(payloads) / each_seconds),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark block create validation throughput.")
+    parser.add_argument("--payloads", type=int, default=2000, help="Mixed block payloads per run.")
+    parser.add_argument("--invalid-share", type=float, default=0.1, help="Share of payloads that fail validation.")
+    parser.add_argument("--iterations", type=int, default=10, help="Timed runs per variant.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS_PATH, help="Where to write results JSON.")
+    args = parser.parse_args(argv)
+
+    payloads = build_block_payloads(args.payloads, args.invalid_share)
+    results = []
+    for variant, annotation in (("plain", PLAIN_BLOCK_CREATE), ("discriminated", BlockCreate)):
+        result = run_case(variant, annotation, payloads, args.iterations)
+        results.append(result)
+        print(
+            f"{variant:<14} list {result['list_payloads_per_second']:>9}/s  "
+            f"item by item {result['each_payloads_per_second']:>9}/s  "
+            f"({result['rejected']} of {result['each_payloads']} rejected)"
+        )
+
+    report = {
+        "benchmark": "block_validation",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "invalid_share": args.invalid_share,
+        "cases": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
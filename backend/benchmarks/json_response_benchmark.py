@@ -0,0 +1,104 @@
+"""Compare FastAPI response-model serialization with the service row encoder.
+
+Run from the ``backend`` directory:
+
+    python -m benchmarks.json_response_benchmark
+    python -m benchmarks.json_response_benchmark --rows 500 5000 --iterations 20
+
+The baseline is what FastAPI does for a ``response_model``: validate every row
+into the model (running its input validators) and dump the result to JSON. Both
+paths must produce identical bytes; the run fails otherwise.
+"""
+
+import argparse
+import json
+import platform
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic import TypeAdapter
+
+from benchmarks.synthetic import build_block_rows, build_consultant_rows, build_profile_summary_rows
+from src.api.serialization import response_adapter
+from src.schemas import BlockResponse, ConsultantResponse, ProfileSummaryResponse
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DEFAULT_ROWS = [50, 500, 5000]
+DEFAULT_RESULTS_PATH = BENCHMARK_DIR / "results" / "json_response.json"
+
+CASES = {
+    "consultants": (ConsultantResponse, build_consultant_rows),
+    "blocks": (BlockResponse, build_block_rows),
+    "profile_summaries": (ProfileSummaryResponse, build_profile_summary_rows),
+}
+
+
+def _best_seconds(function, iterations: int) -> float:
+    """Return the fastest of ``iterations`` timed calls after one warm-up call."""
+    function()
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run_case(name: str, rows: int, iterations: int) -> dict:
+    """Time both serialization paths for ``rows`` rows of one listing."""
+    model, build_rows = CASES[name]
+    content = build_rows(rows)
+    baseline = TypeAdapter(list[model])
+    adapter = response_adapter(model)
+
+    expected = baseline.dump_json(baseline.validate_python(content))
+    if adapter.dump_json(adapter.validate_python(content)) != expected:
+        raise RuntimeError(f"{name}: row encoder output differs from the response model output.")
+
+    baseline_seconds = _best_seconds(lambda: baseline.dump_json(baseline.validate_python(content)), iterations)
+    encoder_seconds = _best_seconds(lambda: adapter.dump_json(adapter.validate_python(content)), iterations)
+    return {
+        "case": name,
+        "rows": rows,
+        "output_bytes": len(expected),
+        "response_model_ms": round(baseline_seconds * 1000, 3),
+        "row_encoder_ms": round(encoder_seconds * 1000, 3),
+        "speedup": round(baseline_seconds / encoder_seconds, 2),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark JSON encoding of list endpoint responses.")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="Row counts per listing.")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES), help="Listings to run.")
+    parser.add_argument("--iterations", type=int, default=30, help="Timed runs per case and path.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS_PATH, help="Where to write results JSON.")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in args.cases:
+        for rows in args.rows:
+            result = run_case(name, rows, args.iterations)
+            results.append(result)
+            print(
+                f"{name:<18} {rows:>6} rows  response_model {result['response_model_ms']:>9.3f} ms  "
+                f"row encoder {result['row_encoder_ms']:>9.3f} ms  {result['speedup']:>6.2f}x  "
+                f"{result['output_bytes'] / 1024:>9.1f} KiB"
+            )
+
+    report = {
+        "benchmark": "json_response",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cases": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,189 @@
+"""Latency of ranking consultants against staffing requirements.
+
+Run from the ``backend`` directory:
+
+    python -m benchmarks.matching_benchmark
+    python -m benchmarks.matching_benchmark --consultants 2000 --database /tmp/matching-bench.db
+
+Builds a migrated database with ``--consultants`` consultants, each with skill
+and project blocks over a Zipf-distributed technology vocabulary, and indexes
+them through ``term_index`` so the term vectors are built by the same
+incremental path block writes use. Then times the matching service for
+requirement sets of different sizes. The exit code is 1 when a median exceeds
+``--budget-ms``.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from itertools import accumulate
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = BENCHMARK_DIR.parent
+DEFAULT_RESULTS_PATH = BENCHMARK_DIR / "results" / "matching.json"
+
+TECHNOLOGY_COUNT = 400
+SKILLS_PER_CONSULTANT = (4, 12)
+PROJECTS_PER_CONSULTANT = (3, 15)
+TECHNOLOGIES_PER_PROJECT = (3, 8)
+LEVELS = ("Basic", "Intermediate", "Advanced", "Expert")
+INDEX_BATCH_CONSULTANTS = 500
+
+# Requirement sets by size; the common technologies match most consultants.
+REQUIREMENTS = {
+    "3_terms": [
+        {"term": "tech0", "weight": 3, "required": True},
+        {"term": "tech1"},
+        {"term": "tech5", "weight": 2},
+    ],
+    "10_terms": [
+        {"term": f"tech{rank}", "weight": 1 + rank % 3, "required": rank < 2} for rank in range(0, 40, 4)
+    ],
+    "25_terms_min_level": [
+        {"term": f"tech{rank}", "min_level": "advanced" if rank < 3 else None} for rank in range(25)
+    ],
+}
+
+
+def iter_consultant_blocks(consultant_id: int, rng: random.Random, cum_weights: list[float]):
+    """Yield (consultant_id, block_type, title, technologies, proficiency, start, end, ongoing, months) rows."""
+    technologies = [f"tech{rank}" for rank in range(TECHNOLOGY_COUNT)]
+    for title in set(rng.choices(technologies, cum_weights=cum_weights, k=rng.randint(*SKILLS_PER_CONSULTANT))):
+        yield consultant_id, "skill", title, None, rng.choice(LEVELS), None, None, 0, None
+    for index in range(rng.randint(*PROJECTS_PER_CONSULTANT)):
+        start = date(2008, 1, 1) + timedelta(days=rng.randint(0, 6000))
+        months = rng.randint(2, 36)
+        ongoing = int(rng.random() < 0.1)
+        used = sorted(set(rng.choices(technologies, cum_weights=cum_weights, k=rng.randint(*TECHNOLOGIES_PER_PROJECT))))
+        end = None if ongoing else (start + timedelta(days=30 * months)).isoformat()
+        yield consultant_id, "project", f"Project {index}", json.dumps(used), None, start.isoformat(), end, ongoing, months
+
+
+def build_database(path: Path, consultants: int, seed: int = 1234) -> float:
+    """Migrate a fresh database, insert the corpus and index it; return the indexing seconds."""
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{path}"}
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"], cwd=BACKEND_DIR, env=env, check=True, capture_output=True
+    )
+    from src.core.database import get_db, list_from_rows
+    from src.services import term_index
+
+    rng = random.Random(seed)
+    cum_weights = list(accumulate(1 / (rank + 1) for rank in range(TECHNOLOGY_COUNT)))
+    index_seconds = 0.0
+    for batch_start in range(0, consultants, INDEX_BATCH_CONSULTANTS):
+        with get_db() as conn:
+            batch = range(batch_start, min(batch_start + INDEX_BATCH_CONSULTANTS, consultants))
+            conn.executemany(
+                """INSERT INTO consultants (first_name, last_name, email, title, created_by_admin_id)
+                   VALUES ('Bench', ?, ?, 'Consultant', 1)""",
+                [(f"Consultant {index}", f"bench.{index}@example.com") for index in batch],
+            )
+            first_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0] - len(batch) + 1
+            rows = [row for offset in range(len(batch)) for row in iter_consultant_blocks(first_id + offset, rng, cum_weights)]
+            conn.executemany(
+                """INSERT INTO blocks (consultant_id, block_type, title, technologies, proficiency_level,
+                                       start_date, end_date, is_ongoing, duration_months)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+            blocks = list_from_rows(conn.execute(
+                "SELECT * FROM blocks WHERE consultant_id >= ?", (first_id,)
+            ).fetchall())
+            started = time.perf_counter()
+            term_index.index_blocks(conn, blocks)
+            index_seconds += time.perf_counter() - started
+    return index_seconds
+
+
+def run_requirements(iterations: int, limit: int) -> tuple[float, list[dict]]:
+    """Time loading the match index, then every requirement set through the matching service."""
+    from src.core.database import get_db
+    from src.services import matching_service
+
+    results = []
+    with get_db() as conn:
+        started = time.perf_counter()
+        matching_service.match_index.load(conn)
+        load_ms = (time.perf_counter() - started) * 1000
+        ranked_consultants = conn.execute("SELECT COUNT(DISTINCT consultant_id) FROM consultant_terms").fetchone()[0]
+        for name, requirements in REQUIREMENTS.items():
+            match = lambda: asyncio.run(matching_service.match_consultants(conn, requirements, limit))
+            response = match()
+            timings = []
+            for _ in range(iterations):
+                started = time.perf_counter()
+                match()
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            results.append({
+                "requirements": name,
+                "terms": len(requirements),
+                "consultants": ranked_consultants,
+                "returned": len(response),
+                "median_ms": round(statistics.median(timings), 3),
+                "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+            })
+    return round(load_ms, 1), results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark consultant matching latency.")
+    parser.add_argument("--consultants", type=int, default=10_000, help="Consultants in the synthetic corpus.")
+    parser.add_argument("--database", type=Path, help="Reuse (or create) this database instead of a temporary one.")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed runs per requirement set.")
+    parser.add_argument("--limit", type=int, default=20, help="Consultants returned, as the endpoint default.")
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="Allowed median latency per requirement set.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS_PATH, help="Where to write results JSON.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.database or Path(tmp) / "matching.db"
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+        sys.path.insert(0, str(BACKEND_DIR))
+        index_seconds = None
+        if not path.exists():
+            index_seconds = build_database(path, args.consultants)
+            print(f"Indexed {args.consultants} consultants in {index_seconds:.1f} s")
+        load_ms, results = run_requirements(args.iterations, args.limit)
+
+    print(f"Match index loaded in {load_ms:.0f} ms")
+    for result in results:
+        print(
+            f"{result['requirements']:<20} {result['consultants']:>6} consultants  "
+            f"median {result['median_ms']:>8.3f} ms  p95 {result['p95_ms']:>8.3f} ms"
+        )
+    report = {
+        "benchmark": "matching",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "consultants": args.consultants,
+        "index_seconds": index_seconds,
+        "index_load_ms": load_ms,
+        "budget_ms": args.budget_ms,
+        "results": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Results written to {args.output}")
+
+    over_budget = [result["requirements"] for result in results if result["median_ms"] > args.budget_ms]
+    if over_budget:
+        print(f"Over the {args.budget_ms:g} ms budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
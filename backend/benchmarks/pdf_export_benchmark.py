@@ -0,0 +1,200 @@
+"""Benchmark and regression check for PDF profile export.
+
+Run from the ``backend`` directory:
+
+    python -m benchmarks.pdf_export_benchmark
+    python -m benchmarks.pdf_export_benchmark --sizes 5 50 --update-baseline
+    python -m benchmarks.pdf_export_benchmark --threshold 0.25
+
+Each size is rendered in a fresh process so peak RSS reflects that case only.
+The exit code is 1 when any metric regresses beyond the threshold compared
+with the stored baseline (``benchmarks/baselines/pdf_export.json``, committed
+with the repository), and 2 when the baseline is missing.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import re
+import resource
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DEFAULT_SIZES = [5, 50, 200, 1000]
+DEFAULT_RESULTS_PATH = BENCHMARK_DIR / "results" / "pdf_export.json"
+DEFAULT_BASELINE_PATH = BENCHMARK_DIR / "baselines" / "pdf_export.json"
+PDF_PAGE_RE = re.compile(rb"/Type\s*/Page(?![s\w])")
+
+# Metrics where a higher value is a regression, checked against the baseline.
+REGRESSION_METRICS = ("render_seconds_median", "peak_rss_mb", "output_bytes")
+
+
+def _peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 2)
+
+
+def count_pdf_pages(pdf_bytes: bytes) -> int:
+    """Count page objects in an uncompressed-xref PDF such as ReportLab output."""
+    return len(PDF_PAGE_RE.findall(pdf_bytes))
+
+
+def _run_case(block_count: int, iterations: int, render_options: dict, queue) -> None:
+    """Render one synthetic snapshot size and report metrics to the parent process."""
+    from benchmarks.synthetic import build_profile_snapshot
+    from src.services.profile_export_service import export_profile_to_pdf
+
+    profile_data = build_profile_snapshot(block_count)
+    snapshot_bytes = len(json.dumps(profile_data))
+
+    # Warm up imports, font metrics and style construction outside the timed runs.
+    pdf_bytes, _ = export_profile_to_pdf(profile_data=profile_data, **render_options)
+
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        pdf_bytes, _ = export_profile_to_pdf(profile_data=profile_data, **render_options)
+        timings.append(time.perf_counter() - started)
+
+    median = statistics.median(timings)
+    pages = count_pdf_pages(pdf_bytes)
+    queue.put({
+        "blocks": block_count,
+        "snapshot_bytes": snapshot_bytes,
+        "iterations": iterations,
+        "render_seconds_median": round(median, 4),
+        "render_seconds_min": round(min(timings), 4),
+        "peak_rss_mb": _peak_rss_mb(),
+        "output_bytes": len(pdf_bytes),
+        "pages": pages,
+        "pages_per_second": round(pages / median, 2) if median > 0 else None,
+    })
+
+
+def run_benchmark(
+    sizes: list[int],
+    iterations: int,
+    render_options: dict | None = None,
+    environment: dict[str, str] | None = None,
+) -> list[dict]:
+    """Run every size in its own spawned process and collect the case results.
+
+    ``environment`` overrides settings (e.g. PDF_FONT_FAMILY) for the spawned processes only.
+    """
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for block_count in sizes:
+        queue = context.Queue()
+        process = context.Process(target=_run_case, args=(block_count, iterations, render_options or {}, queue))
+        previous_environment = {key: os.environ.get(key) for key in environment or {}}
+        os.environ.update(environment or {})
+        try:
+            process.start()
+        finally:
+            for key, value in previous_environment.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+        process.join()
+        if process.exitcode != 0:
+            raise RuntimeError(f"Benchmark case with {block_count} blocks failed.")
+        result = queue.get()
+        results.append(result)
+        print(
+            f"{block_count:>5} blocks  {result['render_seconds_median']:>8.3f}s  "
+            f"{result['pages']:>4} pages  {result['pages_per_second']:>8} pages/s  "
+            f"{result['output_bytes'] / 1024:>9.1f} KiB  {result['peak_rss_mb']:>7.1f} MiB RSS"
+        )
+    return results
+
+
+def compare_with_baseline(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    """Return human-readable regressions where a metric grew beyond the threshold."""
+    baseline_cases = {case["blocks"]: case for case in baseline.get("cases", [])}
+    regressions = []
+    for case in results:
+        reference = baseline_cases.get(case["blocks"])
+        if not reference:
+            continue
+        for metric in REGRESSION_METRICS:
+            previous = reference.get(metric)
+            current = case.get(metric)
+            if not previous or current is None:
+                continue
+            change = (current - previous) / previous
+            if change > threshold:
+                regressions.append(
+                    f"{case['blocks']} blocks: {metric} {previous} -> {current} (+{change:.0%})"
+                )
+    return regressions
+
+
+def build_report(results: list[dict], threshold: float) -> dict:
+    """Wrap case results with environment metadata."""
+    return {
+        "benchmark": "pdf_export",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "threshold": threshold,
+        "cases": results,
+    }
+
+
+def _write_json(path: Path, payload: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark PDF profile export.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Block counts to render.")
+    parser.add_argument("--iterations", type=int, default=3, help="Timed renders per size.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS_PATH, help="Where to write results JSON.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH, help="Baseline JSON to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed relative growth before failing.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline.")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.sizes, args.iterations)
+    report = build_report(results, args.threshold)
+    _write_json(args.output, report)
+    print(f"Results written to {args.output}")
+
+    if args.update_baseline:
+        _write_json(args.baseline, report)
+        print(f"Baseline updated at {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(
+            f"WARNING: no baseline at {args.baseline}, nothing was checked; "
+            "run with --update-baseline to create one.",
+            file=sys.stderr,
+        )
+        return 2
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare_with_baseline(results, baseline, args.threshold)
+    if regressions:
+        print("Regressions beyond threshold:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+
+    print("No regressions beyond threshold.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+"""Compare PDF export with a TTF font family against the built-in Helvetica baseline.
+
+Run from the ``backend`` directory:
+
+    python -m benchmarks.pdf_font_benchmark --font-family Inter --font-dir ./fonts
+    python -m benchmarks.pdf_font_benchmark   # uses ReportLab's bundled Vera family
+
+Reports render time and output size for both variants at each size, showing
+the cost of subset-embedding the TTF family.
+"""
+
+import argparse
+import shutil
+import tempfile
+from pathlib import Path
+
+import reportlab
+
+from benchmarks.pdf_export_benchmark import BENCHMARK_DIR, _write_json, run_benchmark
+
+DEFAULT_SIZES = [5, 50, 200]
+DEFAULT_RESULTS_PATH = BENCHMARK_DIR / "results" / "pdf_font.json"
+
+# ReportLab ships Bitstream Vera; copied under the naming scheme PDF_FONT_DIR expects.
+BUNDLED_VERA_FACES = {
+    "Regular": "Vera.ttf",
+    "Bold": "VeraBd.ttf",
+    "Italic": "VeraIt.ttf",
+    "BoldItalic": "VeraBI.ttf",
+}
+
+
+def _prepare_bundled_family(target_dir: Path) -> tuple[str, str]:
+    """Copy ReportLab's bundled Vera fonts into ``target_dir`` and return (family, font_dir)."""
+    source_dir = Path(reportlab.__file__).resolve().parent / "fonts"
+    for suffix, filename in BUNDLED_VERA_FACES.items():
+        shutil.copyfile(source_dir / filename, target_dir / f"Vera-{suffix}.ttf")
+    return "Vera", str(target_dir)
+
+
+def compare(builtin: list[dict], custom: list[dict]) -> list[dict]:
+    """Pair cases by size and compute relative time and size overheads."""
+    custom_by_size = {case["blocks"]: case for case in custom}
+    rows = []
+    for base in builtin:
+        other = custom_by_size[base["blocks"]]
+        rows.append({
+            "blocks": base["blocks"],
+            "helvetica_seconds": base["render_seconds_median"],
+            "ttf_seconds": other["render_seconds_median"],
+            "time_ratio": round(other["render_seconds_median"] / base["render_seconds_median"], 3),
+            "helvetica_bytes": base["output_bytes"],
+            "ttf_bytes": other["output_bytes"],
+            "size_ratio": round(other["output_bytes"] / base["output_bytes"], 3),
+        })
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark TTF font embedding against Helvetica.")
+    parser.add_argument("--font-family", help="Family name in --font-dir (defaults to bundled Vera).")
+    parser.add_argument("--font-dir", help="Directory with <family>-Regular.ttf and optional faces.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Block counts to render.")
+    parser.add_argument("--iterations", type=int, default=3, help="Timed renders per size.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS_PATH, help="Where to write results JSON.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        if args.font_family:
+            family, font_dir = args.font_family, str(Path(args.font_dir or ".").resolve())
+        else:
+            family, font_dir = _prepare_bundled_family(Path(scratch_dir))
+
+        print("Helvetica (built-in):")
+        builtin = run_benchmark(args.sizes, args.iterations, environment={"PDF_FONT_FAMILY": ""})
+        print(f"{family} (TTF subset):")
+        custom = run_benchmark(
+            args.sizes,
+            args.iterations,
+            environment={"PDF_FONT_FAMILY": family, "PDF_FONT_DIR": font_dir},
+        )
+
+    rows = compare(builtin, custom)
+    for row in rows:
+        print(
+            f"{row['blocks']:>5} blocks  time x{row['time_ratio']:<6}  size x{row['size_ratio']:<6}  "
+            f"({row['helvetica_bytes'] / 1024:.1f} KiB -> {row['ttf_bytes'] / 1024:.1f} KiB)"
+        )
+
+    _write_json(args.output, {
+        "benchmark": "pdf_font",
+        "font_family": family,
+        "comparison": rows,
+        "helvetica": builtin,
+        "ttf": custom,
+    })
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
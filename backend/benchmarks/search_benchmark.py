@@ -0,0 +1,231 @@
+"""Latency of full-text search over a large block corpus.
+
+Run from the ``backend`` directory:
+
+    python -m benchmarks.search_benchmark
+    python -m benchmarks.search_benchmark --blocks 100000 --database /tmp/search-bench.db
+
+Builds a migrated database with ``--blocks`` blocks (inserted through the
+search triggers, so the indexing cost is reported too), then times the search
+service for queries of different selectivity. Block text is drawn from a
+Zipf-distributed vocabulary so rare terms, client names and phrases match few
+blocks while the most common words match a large share of them. The exit code
+is 1 when the slowest query's median exceeds ``--budget-ms`` or when a query
+returns no blocks although blocks of its types match.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from itertools import accumulate
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = BENCHMARK_DIR.parent
+DEFAULT_RESULTS_PATH = BENCHMARK_DIR / "results" / "search.json"
+
+VOCABULARY_SIZE = 20_000
+CLIENT_COUNT = 5_000
+CONSULTANTS = 2_000
+INSERT_BATCH = 10_000
+
+# Domain words placed at fixed vocabulary ranks (0 is the most frequent word).
+RANKED_WORDS = {
+    "platform": 3, "migration": 40, "payment": 150, "kubernetes": 400, "sap": 900, "kalomi": 2_000, "ledger": 5_000,
+}
+
+QUERIES = {
+    "common_word": "platform",
+    "two_words": "payment migration",
+    "phrase": '"payment migration"',
+    "prefix": "migr*",
+    "client_name": "Kalomi Insurance",
+    "rare_word": "ledger",
+    "rare_projects_only": ("sap", ["project"]),
+    "broad_misc_only": ("migration", ["misc"]),
+}
+
+SYLLABLES = "ka lo mi ne ru sa ti vo ze ba de fi gu ho ja ke li mo nu pa".split()
+CLIENT_SUFFIXES = ("Group", "AG", "GmbH", "Inc", "Bank", "Insurance")
+
+
+def _vocabulary(rng: random.Random) -> list[str]:
+    words = set(RANKED_WORDS)
+    vocabulary = []
+    while len(vocabulary) < VOCABULARY_SIZE - len(RANKED_WORDS):
+        word = "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4)))
+        if word not in words:
+            words.add(word)
+            vocabulary.append(word)
+    for word, rank in sorted(RANKED_WORDS.items(), key=lambda item: item[1]):
+        vocabulary.insert(rank, word)
+    return vocabulary
+
+
+def iter_block_values(count: int, seed: int = 1234):
+    """Yield (consultant_id, block_type, title, client_name, description, organization, misc) tuples."""
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng)
+    cum_weights = list(accumulate(1 / (rank + 1) ** 1.05 for rank in range(len(vocabulary))))
+
+    # Client names share a handful of suffixes, as "ACME Bank" and "Delta Bank" do.
+    clients = [
+        f"{vocabulary[rank].title()} {rng.choice(CLIENT_SUFFIXES)}" for rank in rng.sample(range(100, 10_000), CLIENT_COUNT)
+    ]
+    clients.append("Kalomi Insurance")
+
+    def text(words: int) -> str:
+        return " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=words)).capitalize()
+
+    for index in range(count):
+        consultant_id = index % CONSULTANTS + 1
+        roll = rng.random()
+        if roll < 0.55:
+            yield (
+                consultant_id, "project", text(rng.randint(2, 6)), rng.choice(clients),
+                text(rng.randint(20, 80)), None, None,
+            )
+        elif roll < 0.85:
+            yield consultant_id, "skill", text(rng.randint(1, 3)), None, None, None, None
+        elif roll < 0.95:
+            yield consultant_id, "certification", text(rng.randint(3, 6)), None, None, text(2), None
+        else:
+            yield consultant_id, "misc", text(rng.randint(2, 5)), None, None, None, text(rng.randint(10, 40))
+
+
+def build_database(path: Path, blocks: int) -> float:
+    """Migrate a fresh database at ``path`` and insert the corpus; return the insert seconds."""
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{path}"}
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"], cwd=BACKEND_DIR, env=env, check=True, capture_output=True
+    )
+    import sqlite3
+
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        """INSERT INTO consultants (first_name, last_name, email, title, summary, created_by_admin_id)
+           VALUES ('Bench', ?, ?, 'Consultant', ?, 1)""",
+        [(f"Consultant {index}", f"bench.{index}@example.com", f"Summary {index}") for index in range(CONSULTANTS)],
+    )
+    first_consultant = conn.execute("SELECT MIN(id) FROM consultants WHERE email LIKE 'bench.%'").fetchone()[0]
+    started = time.perf_counter()
+    batch = []
+    for order, values in enumerate(iter_block_values(blocks)):
+        consultant_id, *rest = values
+        batch.append((consultant_id + first_consultant - 1, *rest, order * 1024))
+        if len(batch) == INSERT_BATCH:
+            _insert_blocks(conn, batch)
+            batch.clear()
+    if batch:
+        _insert_blocks(conn, batch)
+    insert_seconds = time.perf_counter() - started
+    conn.execute("INSERT INTO block_search (block_search) VALUES ('optimize')")
+    conn.commit()
+    conn.close()
+    return insert_seconds
+
+
+def _insert_blocks(conn, batch: list[tuple]) -> None:
+    conn.executemany(
+        """INSERT INTO blocks (consultant_id, block_type, title, client_name, project_description,
+                               issuing_organization, misc_content, "order")
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        batch,
+    )
+    conn.commit()
+
+
+def run_queries(path: Path, iterations: int, limit: int) -> list[dict]:
+    """Time every query through the search service; return per-query median and p95."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    sys.path.insert(0, str(BACKEND_DIR))
+    from src.core.database import get_db
+    from src.services import search_service
+
+    results = []
+    with get_db() as conn:
+        for name, query in QUERIES.items():
+            text, kinds = query if isinstance(query, tuple) else (query, None)
+            search = lambda: asyncio.run(search_service.search(conn, text, kinds, limit))
+            response = search()
+            timings = []
+            for _ in range(iterations):
+                started = time.perf_counter()
+                search()
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            block_types = [kind for kind in kinds or search_service.BLOCK_TYPES if kind != "consultant"]
+            matches = conn.execute(
+                f"""SELECT COUNT(*) FROM block_search JOIN blocks ON blocks.id = block_search.rowid
+                    WHERE block_search MATCH ? AND blocks.block_type IN ({', '.join(['?'] * len(block_types))})""",
+                (search_service.build_match_query(text), *block_types),
+            ).fetchone()[0]
+            results.append({
+                "query": name,
+                "text": text,
+                "matching_blocks": matches,
+                "returned": len(response["blocks"]) + len(response["consultants"]),
+                "returned_blocks": len(response["blocks"]),
+                "median_ms": round(statistics.median(timings), 3),
+                "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+            })
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark full-text search latency.")
+    parser.add_argument("--blocks", type=int, default=1_000_000, help="Blocks in the synthetic corpus.")
+    parser.add_argument("--database", type=Path, help="Reuse (or create) this database instead of a temporary one.")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed runs per query.")
+    parser.add_argument("--limit", type=int, default=20, help="Results per kind, as the endpoint default.")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="Allowed median latency per query.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS_PATH, help="Where to write results JSON.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.database or Path(tmp) / "search.db"
+        insert_seconds = None
+        if not path.exists():
+            insert_seconds = build_database(path, args.blocks)
+            print(f"Indexed {args.blocks} blocks in {insert_seconds:.1f} s ({args.blocks / insert_seconds:,.0f} blocks/s)")
+        results = run_queries(path, args.iterations, args.limit)
+
+    for result in results:
+        print(
+            f"{result['query']:<20} {result['matching_blocks']:>8} matches  "
+            f"median {result['median_ms']:>8.3f} ms  p95 {result['p95_ms']:>8.3f} ms"
+        )
+    report = {
+        "benchmark": "search",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "blocks": args.blocks,
+        "insert_seconds": insert_seconds,
+        "budget_ms": args.budget_ms,
+        "queries": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Results written to {args.output}")
+
+    over_budget = [result["query"] for result in results if result["median_ms"] > args.budget_ms]
+    if over_budget:
+        print(f"Over the {args.budget_ms:g} ms budget: {', '.join(over_budget)}")
+    missing = [result["query"] for result in results if result["matching_blocks"] and not result["returned_blocks"]]
+    if missing:
+        print(f"No blocks returned despite matches: {', '.join(missing)}")
+    return 1 if over_budget or missing else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
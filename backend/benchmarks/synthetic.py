@@ -0,0 +1,182 @@
+"""Deterministic synthetic profile snapshots for benchmarks."""
+
+import json
+import random
+from datetime import date, timedelta
+
+from src.services.profile_service import serialize_block
+
+WORDS = (
+    "platform migration cloud data pipeline delivery architecture stakeholder governance "
+    "kubernetes terraform observability latency throughput analytics warehouse streaming "
+    "modernization integration security compliance automation reliability rollout backlog"
+).split()
+TECHNOLOGIES = [
+    "AWS", "Azure", "GCP", "Kubernetes", "Terraform", "PostgreSQL", "Redis", "Kafka", "Spark",
+    "Python", "Java", "Go", "TypeScript", "React", "Vue", "Snowflake", "dbt", "Airflow",
+    "Docker", "Helm", "Prometheus", "Grafana", "SAP", "Databricks", "FastAPI", "GraphQL",
+]
+SKILL_LEVELS = ["Expert", "Advanced", "Proficient", "Basic", "Senior", "Junior", None]
+
+# Share of each block type in a synthetic profile (projects dominate real profiles).
+BLOCK_TYPE_MIX = (("project", 0.55), ("skill", 0.30), ("certification", 0.10), ("misc", 0.05))
+
+
+def _sentence(rng: random.Random, word_count: int) -> str:
+    words = [rng.choice(WORDS) for _ in range(word_count)]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraphs(rng: random.Random, sentence_count: int) -> str:
+    sentences = [_sentence(rng, rng.randint(8, 22)) for _ in range(sentence_count)]
+    lines = []
+    for index in range(0, len(sentences), 4):
+        lines.append(" ".join(sentences[index:index + 4]))
+    return "\n".join(lines)
+
+
+def _synthetic_block_row(rng: random.Random, block_id: int, block_type: str) -> dict:
+    """Build a block row shaped like a ``blocks`` table record."""
+    row = {"id": block_id, "block_type": block_type, "title": _sentence(rng, rng.randint(2, 6))[:-1]}
+    if block_type == "project":
+        start = date(2010, 1, 1) + timedelta(days=rng.randint(0, 5000))
+        months = rng.randint(2, 48)
+        row.update({
+            "client_name": f"{rng.choice(WORDS).title()} {rng.choice(['Group', 'AG', 'GmbH', 'Inc'])}",
+            "project_description": _paragraphs(rng, rng.randint(6, 24)),
+            "role": rng.choice(["Lead Engineer", "Architect", "Consultant", "Tech Lead"]),
+            "technologies": '["' + '", "'.join(rng.sample(TECHNOLOGIES, rng.randint(3, 10))) + '"]',
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=30 * months)).isoformat(),
+            "is_ongoing": rng.random() < 0.1,
+            "duration_months": months,
+        })
+    elif block_type == "skill":
+        row["title"] = f"{rng.choice(TECHNOLOGIES)} {rng.choice(WORDS)}"
+        row["proficiency_level"] = rng.choice(SKILL_LEVELS)
+    elif block_type == "certification":
+        issued = date(2015, 1, 1) + timedelta(days=rng.randint(0, 3000))
+        row.update({
+            "issuing_organization": rng.choice(["AWS", "Microsoft", "Google", "CNCF", "HashiCorp"]),
+            "issue_date": issued.isoformat(),
+            "expiry_date": (issued + timedelta(days=1095)).isoformat(),
+            "credential_id": f"CRED-{block_id:06d}",
+            "credential_url": f"https://example.com/credentials/{block_id}",
+        })
+    else:
+        row["misc_content"] = _paragraphs(rng, rng.randint(2, 8))
+    return row
+
+
+def build_block_rows(count: int, consultant_id: int = 1, seed: int = 1234) -> list[dict]:
+    """Return ``count`` raw ``blocks`` rows as the block service reads them from SQLite."""
+    rng = random.Random(seed + count)
+    block_types = [block_type for block_type, _ in BLOCK_TYPE_MIX]
+    weights = [weight for _, weight in BLOCK_TYPE_MIX]
+    rows = []
+    for block_id in range(1, count + 1):
+        row = _synthetic_block_row(rng, block_id, rng.choices(block_types, weights)[0])
+        if "is_ongoing" in row:
+            row["is_ongoing"] = int(row["is_ongoing"])
+        row.update({
+            "consultant_id": consultant_id,
+            "order": block_id,
+            "is_active": 1,
+            "created_at": "2026-01-15 09:00:00",
+            "updated_at": "2026-01-15 09:00:00",
+        })
+        rows.append(row)
+    return rows
+
+
+def build_block_payloads(count: int, invalid_share: float = 0.0, seed: int = 1234) -> list[dict]:
+    """Return ``count`` mixed block create payloads; ``invalid_share`` of them fail validation."""
+    rng = random.Random(seed + count)
+    block_types = [block_type for block_type, _ in BLOCK_TYPE_MIX]
+    weights = [weight for _, weight in BLOCK_TYPE_MIX]
+    payloads = []
+    for block_id in range(1, count + 1):
+        payload = _synthetic_block_row(rng, block_id, rng.choices(block_types, weights)[0])
+        del payload["id"]
+        if "technologies" in payload:
+            payload["technologies"] = json.loads(payload["technologies"])
+        if rng.random() < invalid_share:
+            # Empty titles and malformed dates are the usual rejected edits.
+            payload["title"] = ""
+            if "start_date" in payload:
+                payload["start_date"] = "not a date"
+        payloads.append(payload)
+    return payloads
+
+
+def build_consultant_rows(count: int, seed: int = 1234) -> list[dict]:
+    """Return ``count`` consultants as the consultant service returns them."""
+    rng = random.Random(seed + count)
+    return [
+        {
+            "id": consultant_id,
+            "first_name": "Bench",
+            "last_name": f"Consultant {consultant_id}",
+            "email": f"bench.{consultant_id}@example.com",
+            "title": "Principal Data and Platform Consultant",
+            "summary": _sentence(rng, 24),
+            "photo_url": None,
+            "role": "Principal Consultant",
+            "focus_areas": rng.sample(TECHNOLOGIES, 4),
+            "years_experience": rng.randint(1, 30),
+            "motto": _sentence(rng, 8),
+            "created_by_admin_id": 1,
+            "created_at": "2026-01-15 09:00:00",
+            "updated_at": "2026-01-15 09:00:00",
+        }
+        for consultant_id in range(1, count + 1)
+    ]
+
+
+def build_profile_summary_rows(count: int, seed: int = 1234) -> list[dict]:
+    """Return ``count`` profile listing rows in summary view as the profile service returns them."""
+    rng = random.Random(seed + count)
+    rows = []
+    for profile_id in range(1, count + 1):
+        block_type_counts = {block_type: rng.randint(0, 12) for block_type, _ in BLOCK_TYPE_MIX}
+        rows.append({
+            "id": profile_id,
+            "consultant_id": rng.randint(1, 50),
+            "profile_name": f"Profile {profile_id}",
+            "created_by_admin_id": 1,
+            "created_at": "2026-01-15T09:00:00+00:00",
+            "updated_at": "2026-01-15T09:00:00+00:00",
+            "block_count": sum(block_type_counts.values()),
+            "block_type_counts": block_type_counts,
+        })
+    return rows
+
+
+def build_profile_snapshot(block_count: int, seed: int = 1234) -> dict:
+    """Return a profile snapshot with ``block_count`` blocks in the stored snapshot format."""
+    rng = random.Random(seed + block_count)
+    snapshot = {
+        "consultant": {
+            "first_name": "Bench",
+            "last_name": f"Consultant {block_count}",
+            "title": "Principal Data and Platform Consultant",
+            "email": f"bench.{block_count}@example.com",
+            "photo_url": None,
+        },
+        "blocks_by_type": {},
+        "generated_at": "2026-01-15T09:00:00+00:00",
+        "general_customizations": {
+            "role": "Principal Consultant",
+            "focus_areas": rng.sample(TECHNOLOGIES, 6),
+            "years_experience": 14,
+            "motto": _sentence(rng, 12),
+        },
+    }
+
+    block_types = [block_type for block_type, _ in BLOCK_TYPE_MIX]
+    weights = [weight for _, weight in BLOCK_TYPE_MIX]
+    for block_id in range(1, block_count + 1):
+        block_type = rng.choices(block_types, weights)[0]
+        block = serialize_block(_synthetic_block_row(rng, block_id, block_type))
+        snapshot["blocks_by_type"].setdefault(block_type, []).append(block)
+    return snapshot
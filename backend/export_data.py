@@ -0,0 +1,48 @@
+"""CLI entrypoint to export the dataset as NDJSON (gzip-compressed for .gz paths) for backups."""
+
+import argparse
+import os
+from pathlib import Path
+
+from src.services.export_service import EXPORT_TABLES, iter_export, resolve_record_types
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export consultants, blocks, profiles and access links as NDJSON.")
+    parser.add_argument("output", type=Path, help="Output file; a .gz suffix writes gzip-compressed NDJSON.")
+    parser.add_argument(
+        "--record-types",
+        help=f"Comma-separated record types to export (default: all of {', '.join(EXPORT_TABLES)}).",
+    )
+    args = parser.parse_args()
+
+    requested = None
+    if args.record_types:
+        requested = [name.strip() for name in args.record_types.split(",") if name.strip()]
+    try:
+        tables = resolve_record_types(requested)
+    except ValueError as exc:
+        raise SystemExit(f"[ERROR] {exc}") from exc
+
+    counts: dict[str, int] = {}
+
+    def progress(record_type: str, rows: int) -> None:
+        counts[record_type] = rows
+
+    # Written next to the target and renamed into place, so a failed run never leaves a partial backup.
+    partial = args.output.with_name(args.output.name + ".partial")
+    try:
+        with partial.open("wb") as output:
+            for chunk in iter_export(tables, compress=args.output.suffix == ".gz", progress=progress):
+                output.write(chunk)
+    except Exception:
+        partial.unlink(missing_ok=True)
+        raise
+    os.replace(partial, args.output)
+
+    summary = ", ".join(f"{counts.get(table.record_type, 0)} {table.record_type}" for table in tables)
+    print(f"[OK] Exported {summary} records to {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
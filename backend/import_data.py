@@ -0,0 +1,61 @@
+"""CLI entrypoint to bulk import consultants and blocks from a JSON Lines or CSV file.
+
+Writes go straight to the configured database; a running server with the
+in-memory read model enabled picks them up on its next restart.
+"""
+
+import argparse
+from pathlib import Path
+
+from src.core.database import get_db
+from src.services.import_service import DEFAULT_CHUNK_SIZE, IMPORT_FORMATS, ImportReport, import_records
+
+FORMAT_SUFFIXES = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv"}
+
+
+def _print_progress(report: ImportReport) -> None:
+    print(
+        f"[INFO] {report.records} records read: {report.consultants_created} consultants, "
+        f"{report.blocks_created} blocks created, {report.error_count} errors."
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import consultants and blocks from JSON Lines or CSV.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="Input format (default: from the file suffix).")
+    parser.add_argument("--admin", default="admin", help="Username recorded as the creator of imported consultants.")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Records per transaction.")
+    args = parser.parse_args()
+
+    if not args.path.is_file():
+        raise SystemExit(f"[ERROR] Import file not found: {args.path}")
+    fmt = args.format or FORMAT_SUFFIXES.get(args.path.suffix.lower())
+    if fmt is None:
+        raise SystemExit(f"[ERROR] Cannot infer the format of {args.path}; pass --format.")
+
+    with get_db() as conn:
+        admin = conn.execute("SELECT id FROM admins WHERE username = ?", (args.admin,)).fetchone()
+    if admin is None:
+        raise SystemExit(f"[ERROR] Admin not found: {args.admin}")
+
+    with args.path.open(encoding="utf-8-sig", newline="") as stream:
+        try:
+            report = import_records(stream, fmt, admin["id"], args.chunk_size, progress=_print_progress)
+        except ValueError as exc:
+            raise SystemExit(f"[ERROR] {exc}") from exc
+
+    for error in report.errors:
+        print(f"[ERROR] line {error['line']}: {error['message']}")
+    if report.error_count > len(report.errors):
+        print(f"[ERROR] ... and {report.error_count - len(report.errors)} more errors.")
+    print(
+        f"[OK] Imported {report.consultants_created} consultants and {report.blocks_created} blocks "
+        f"from {report.records} records."
+    )
+    if report.error_count:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
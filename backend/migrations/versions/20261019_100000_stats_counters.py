@@ -0,0 +1,150 @@
+"""stats_counters
+
+Revision ID: 004_stats_counters
+Revises: 003_remove_skill_category
+Create Date: 2026-10-19 10:00:00
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "004_stats_counters"
+down_revision = "003_remove_skill_category"
+branch_labels = None
+depends_on = None
+
+
+# Monday of the ISO week containing the given timestamp expression.
+def _week_start(expression: str) -> str:
+    return f"date({expression}, 'weekday 0', '-6 days')"
+
+
+def _bump(counter: str, delta: int) -> str:
+    return (
+        f"INSERT INTO stats_counters (name, value) VALUES ({counter}, {delta}) "
+        f"ON CONFLICT(name) DO UPDATE SET value = value + ({delta});"
+    )
+
+
+def _bump_week(expression: str, delta: int) -> str:
+    return (
+        f"INSERT INTO profile_weekly_counts (week_start, count) VALUES ({_week_start(expression)}, {delta}) "
+        f"ON CONFLICT(week_start) DO UPDATE SET count = count + ({delta});"
+    )
+
+
+TRIGGERS = {
+    "trg_stats_consultants_insert": f"""
+        AFTER INSERT ON consultants BEGIN
+            {_bump("'consultants'", 1)}
+        END
+    """,
+    "trg_stats_consultants_delete": f"""
+        AFTER DELETE ON consultants BEGIN
+            {_bump("'consultants'", -1)}
+        END
+    """,
+    "trg_stats_profiles_insert": f"""
+        AFTER INSERT ON profiles BEGIN
+            {_bump("'profiles'", 1)}
+            {_bump_week("NEW.created_at", 1)}
+        END
+    """,
+    "trg_stats_profiles_delete": f"""
+        AFTER DELETE ON profiles BEGIN
+            {_bump("'profiles'", -1)}
+            {_bump_week("OLD.created_at", -1)}
+        END
+    """,
+    "trg_stats_access_links_insert": f"""
+        AFTER INSERT ON access_links BEGIN
+            {_bump("'access_links'", 1)}
+        END
+    """,
+    "trg_stats_access_links_delete": f"""
+        AFTER DELETE ON access_links BEGIN
+            {_bump("'access_links'", -1)}
+        END
+    """,
+    # Block counters only include active blocks, matching what the block endpoints return.
+    "trg_stats_blocks_insert": f"""
+        AFTER INSERT ON blocks WHEN NEW.is_active = 1 BEGIN
+            {_bump("'blocks'", 1)}
+            {_bump("'blocks:' || NEW.block_type", 1)}
+        END
+    """,
+    "trg_stats_blocks_delete": f"""
+        AFTER DELETE ON blocks WHEN OLD.is_active = 1 BEGIN
+            {_bump("'blocks'", -1)}
+            {_bump("'blocks:' || OLD.block_type", -1)}
+        END
+    """,
+    "trg_stats_blocks_update_old": f"""
+        AFTER UPDATE OF is_active, block_type ON blocks WHEN OLD.is_active = 1 BEGIN
+            {_bump("'blocks'", -1)}
+            {_bump("'blocks:' || OLD.block_type", -1)}
+        END
+    """,
+    "trg_stats_blocks_update_new": f"""
+        AFTER UPDATE OF is_active, block_type ON blocks WHEN NEW.is_active = 1 BEGIN
+            {_bump("'blocks'", 1)}
+            {_bump("'blocks:' || NEW.block_type", 1)}
+        END
+    """,
+}
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS stats_counters (
+            name VARCHAR(100) PRIMARY KEY,
+            value INTEGER DEFAULT 0 NOT NULL
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS profile_weekly_counts (
+            week_start DATE PRIMARY KEY,
+            count INTEGER DEFAULT 0 NOT NULL
+        )
+        """
+    )
+
+    # Backfill from existing rows before the triggers take over.
+    op.execute("DELETE FROM stats_counters")
+    op.execute("DELETE FROM profile_weekly_counts")
+    op.execute(
+        """
+        INSERT INTO stats_counters (name, value)
+        SELECT 'consultants', COUNT(*) FROM consultants
+        UNION ALL SELECT 'profiles', COUNT(*) FROM profiles
+        UNION ALL SELECT 'access_links', COUNT(*) FROM access_links
+        UNION ALL SELECT 'blocks', COUNT(*) FROM blocks WHERE is_active = 1
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO stats_counters (name, value)
+        SELECT 'blocks:' || block_type, COUNT(*) FROM blocks WHERE is_active = 1 GROUP BY block_type
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO profile_weekly_counts (week_start, count)
+        SELECT {_week_start("created_at")}, COUNT(*) FROM profiles GROUP BY 1
+        """
+    )
+
+    for name, body in TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.execute("DROP TABLE IF EXISTS profile_weekly_counts")
+    op.execute("DROP TABLE IF EXISTS stats_counters")
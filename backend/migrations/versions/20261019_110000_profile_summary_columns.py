@@ -0,0 +1,72 @@
+"""profile_summary_columns
+
+Revision ID: 005_profile_summary_columns
+Revises: 004_stats_counters
+Create Date: 2026-10-19 11:00:00
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "005_profile_summary_columns"
+down_revision = "004_stats_counters"
+branch_labels = None
+depends_on = None
+
+
+# Covering indexes for the summary listings: every summary column is part of the
+# index, so history pages never read the table rows that hold the snapshot blobs.
+SUMMARY_INDEXES = {
+    "idx_profiles_summary_by_consultant": (
+        "consultant_id, created_at DESC, id, profile_name, created_by_admin_id, updated_at, "
+        "block_count, block_type_counts"
+    ),
+    "idx_profiles_summary_by_created": (
+        "created_at DESC, id, consultant_id, profile_name, created_by_admin_id, updated_at, "
+        "block_count, block_type_counts"
+    ),
+}
+
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return any(column["name"] == column_name for column in inspector.get_columns(table_name))
+
+
+def upgrade() -> None:
+    if not _has_column("profiles", "block_count"):
+        op.execute("ALTER TABLE profiles ADD COLUMN block_count INTEGER DEFAULT 0 NOT NULL")
+    if not _has_column("profiles", "block_type_counts"):
+        op.execute("ALTER TABLE profiles ADD COLUMN block_type_counts TEXT DEFAULT '{}' NOT NULL")
+
+    # Backfill from the stored snapshots.
+    op.execute(
+        """
+        UPDATE profiles
+        SET block_type_counts = COALESCE((
+                SELECT json_group_object(key, json_array_length(value))
+                FROM json_each(profiles.profile_data, '$.blocks_by_type')
+            ), '{}'),
+            block_count = COALESCE((
+                SELECT SUM(json_array_length(value))
+                FROM json_each(profiles.profile_data, '$.blocks_by_type')
+            ), 0)
+        WHERE json_valid(profile_data)
+        """
+    )
+
+    for name, columns in SUMMARY_INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON profiles({columns})")
+
+
+def downgrade() -> None:
+    for name in SUMMARY_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    # Plain DROP COLUMN (SQLite 3.35+) keeps the stats triggers on profiles, which a
+    # batch table rebuild would silently discard.
+    for column in ("block_type_counts", "block_count"):
+        if _has_column("profiles", column):
+            op.execute(f"ALTER TABLE profiles DROP COLUMN {column}")
@@ -0,0 +1,104 @@
+"""resource_versions
+
+Revision ID: 006_resource_versions
+Revises: 005_profile_summary_columns
+Create Date: 2026-10-19 12:00:00
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "006_resource_versions"
+down_revision = "005_profile_summary_columns"
+branch_labels = None
+depends_on = None
+
+
+def _bump(scope: str) -> str:
+    return (
+        f"INSERT INTO resource_versions (scope, version) VALUES ({scope}, 1) "
+        "ON CONFLICT(scope) DO UPDATE SET version = version + 1;"
+    )
+
+
+# Scopes are bumped on every write (never reset), so a (scope, version) pair never repeats.
+#   consultants / consultant:<id>                 consultant list / one consultant
+#   blocks:<consultant_id>                        a consultant's block list
+#   profiles / profiles:<consultant_id> / profile:<id>
+TRIGGERS = {
+    "trg_versions_consultants_insert": f"""
+        AFTER INSERT ON consultants BEGIN
+            {_bump("'consultants'")}
+            {_bump("'consultant:' || NEW.id")}
+        END
+    """,
+    "trg_versions_consultants_update": f"""
+        AFTER UPDATE ON consultants BEGIN
+            {_bump("'consultants'")}
+            {_bump("'consultant:' || NEW.id")}
+        END
+    """,
+    "trg_versions_consultants_delete": f"""
+        AFTER DELETE ON consultants BEGIN
+            {_bump("'consultants'")}
+            {_bump("'consultant:' || OLD.id")}
+        END
+    """,
+    "trg_versions_blocks_insert": f"""
+        AFTER INSERT ON blocks BEGIN
+            {_bump("'blocks:' || NEW.consultant_id")}
+        END
+    """,
+    "trg_versions_blocks_update": f"""
+        AFTER UPDATE ON blocks BEGIN
+            {_bump("'blocks:' || NEW.consultant_id")}
+        END
+    """,
+    "trg_versions_blocks_delete": f"""
+        AFTER DELETE ON blocks BEGIN
+            {_bump("'blocks:' || OLD.consultant_id")}
+        END
+    """,
+    "trg_versions_profiles_insert": f"""
+        AFTER INSERT ON profiles BEGIN
+            {_bump("'profiles'")}
+            {_bump("'profiles:' || NEW.consultant_id")}
+            {_bump("'profile:' || NEW.id")}
+        END
+    """,
+    "trg_versions_profiles_update": f"""
+        AFTER UPDATE ON profiles BEGIN
+            {_bump("'profiles'")}
+            {_bump("'profiles:' || NEW.consultant_id")}
+            {_bump("'profile:' || NEW.id")}
+        END
+    """,
+    "trg_versions_profiles_delete": f"""
+        AFTER DELETE ON profiles BEGIN
+            {_bump("'profiles'")}
+            {_bump("'profiles:' || OLD.consultant_id")}
+            {_bump("'profile:' || OLD.id")}
+        END
+    """,
+}
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS resource_versions (
+            scope VARCHAR(100) PRIMARY KEY,
+            version INTEGER DEFAULT 0 NOT NULL
+        )
+        """
+    )
+    for name, body in TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.execute("DROP TABLE IF EXISTS resource_versions")
@@ -0,0 +1,48 @@
+"""sparse_block_order
+
+Revision ID: 007_sparse_block_order
+Revises: 006_resource_versions
+Create Date: 2026-10-19 13:00:00
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "007_sparse_block_order"
+down_revision = "006_resource_versions"
+branch_labels = None
+depends_on = None
+
+
+# Matches block_service.ORDER_STEP.
+ORDER_STEP = 1024
+
+
+def _renumber(expression: str) -> str:
+    """Renumber each consultant's blocks in display order; ``expression`` maps the 1-based position to a key."""
+    return f"""
+        UPDATE blocks
+        SET "order" = {expression}
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY consultant_id ORDER BY "order", created_at DESC
+            ) AS position
+            FROM blocks
+        ) AS ranked
+        WHERE ranked.id = blocks.id
+    """
+
+
+def upgrade() -> None:
+    # Space existing keys ORDER_STEP apart (ties resolved as displayed) so moves find a gap.
+    op.execute(_renumber(f"ranked.position * {ORDER_STEP}"))
+    # Serves the neighbour lookups of moves and the ordered block listings.
+    op.execute('CREATE INDEX IF NOT EXISTS idx_blocks_consultant_order ON blocks(consultant_id, "order")')
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_blocks_consultant_order")
+    # Back to dense keys within the previous 0..10000 range.
+    op.execute(_renumber("ranked.position - 1"))
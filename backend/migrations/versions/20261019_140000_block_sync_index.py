@@ -0,0 +1,25 @@
+"""block_sync_index
+
+Revision ID: 008_block_sync_index
+Revises: 007_sparse_block_order
+Create Date: 2026-10-19 14:00:00
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "008_block_sync_index"
+down_revision = "007_sparse_block_order"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Delta syncs read a consultant's blocks changed since a cursor, tombstones included.
+    op.execute("CREATE INDEX IF NOT EXISTS idx_blocks_consultant_updated ON blocks(consultant_id, updated_at)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_blocks_consultant_updated")
@@ -0,0 +1,128 @@
+"""block_terms
+
+Revision ID: 009_block_terms
+Revises: 008_block_sync_index
+Create Date: 2026-10-19 15:00:00
+
+"""
+
+import json
+import re
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "009_block_terms"
+down_revision = "008_block_sync_index"
+branch_labels = None
+depends_on = None
+
+
+# Canonicalization as term_index applied it when this revision was written.
+# Skill ranks follow the levels profiles display (Basic=1 .. Expert=4).
+_LEVEL_TOKENS = (
+    (4, ("expert", "master", "principal", "lead")),
+    (3, ("advanced", "senior")),
+    (1, ("basic", "beginner", "novice", "junior")),
+)
+TERM_ALIASES = {
+    "k8s": "kubernetes",
+    "golang": "go",
+    "js": "javascript",
+    "ts": "typescript",
+    "postgres": "postgresql",
+    "node": "node.js",
+    "nodejs": "node.js",
+}
+_SKILL_TITLE_SEPARATORS = re.compile(r"\s*(?:[,/&;+]|\band\b)\s*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _canonical_term(text: str) -> str:
+    term = _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", str(text)).casefold()).strip()
+    return TERM_ALIASES.get(term, term)
+
+
+def _level_rank(level: str | None) -> int:
+    text = str(level or "").strip().lower()
+    for rank, tokens in _LEVEL_TOKENS:
+        if text and any(token in text for token in tokens):
+            return rank
+    return 2
+
+
+def _technologies(value: str | None) -> list[str]:
+    """Technology names of a project: a JSON array or comma-separated text."""
+    text = (value or "").strip()
+    if text.startswith("[") and text.endswith("]"):
+        try:
+            parsed = json.loads(text)
+        except json.JSONDecodeError:
+            parsed = None
+        if isinstance(parsed, list):
+            return [str(item).strip() for item in parsed if str(item).strip()]
+        if parsed is not None:
+            return []
+    return [item.strip() for item in text.split(",") if item.strip()]
+
+
+def _postings(block: dict) -> list[dict]:
+    if block["block_type"] == "project":
+        kind, level = "technology", None
+        names = _technologies(block["technologies"])
+    else:
+        kind = "skill"
+        level = _level_rank(block["proficiency_level"])
+        title = block["title"] or ""
+        names = [title, *_SKILL_TITLE_SEPARATORS.split(title)]
+    terms = dict.fromkeys(term for term in map(_canonical_term, names) if term)
+    return [
+        {"term": term, "block_id": block["id"], "consultant_id": block["consultant_id"], "kind": kind, "level": level}
+        for term in terms
+    ]
+
+
+def upgrade() -> None:
+    # One posting per (term, block); the primary key serves term lookups.
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS block_terms (
+            term TEXT NOT NULL,
+            block_id INTEGER NOT NULL,
+            consultant_id INTEGER NOT NULL,
+            kind VARCHAR(20) NOT NULL,
+            level INTEGER,
+            PRIMARY KEY (term, block_id),
+            FOREIGN KEY (block_id) REFERENCES blocks(id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+        """
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS idx_block_terms_block ON block_terms(block_id)")
+
+    # Backfill with the same canonicalization the services apply on write.
+    bind = op.get_bind()
+    blocks = bind.execute(
+        sa.text(
+            """
+            SELECT id, consultant_id, block_type, title, technologies, proficiency_level
+            FROM blocks WHERE is_active = 1 AND block_type IN ('project', 'skill')
+            """
+        )
+    ).mappings()
+    postings = [posting for block in blocks for posting in _postings(block)]
+    if postings:
+        bind.execute(
+            sa.text(
+                "INSERT OR IGNORE INTO block_terms (term, block_id, consultant_id, kind, level) "
+                "VALUES (:term, :block_id, :consultant_id, :kind, :level)"
+            ),
+            postings,
+        )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_block_terms_block")
+    op.execute("DROP TABLE IF EXISTS block_terms")
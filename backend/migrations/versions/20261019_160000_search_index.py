@@ -0,0 +1,108 @@
+"""search_index
+
+Revision ID: 010_search_index
+Revises: 009_block_terms
+Create Date: 2026-10-19 16:00:00
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "010_search_index"
+down_revision = "009_block_terms"
+branch_labels = None
+depends_on = None
+
+
+# Searchable columns, in FTS column order (search_service weights BM25 in the same order).
+BLOCK_COLUMNS = ("title", "client_name", "project_description", "issuing_organization", "misc_content")
+CONSULTANT_COLUMNS = ("first_name", "last_name", "title", "role", "summary")
+
+# External-content tables: the index reads text back from blocks/consultants instead of
+# storing a copy. Prefix indexes keep "migr*" style queries off the full term scan.
+FTS_OPTIONS = "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'"
+
+
+def _values(prefix: str, columns: tuple[str, ...]) -> str:
+    return ", ".join(f"{prefix}.{column}" for column in columns)
+
+
+def _add(table: str, columns: tuple[str, ...], row: str) -> str:
+    return f"INSERT INTO {table} (rowid, {', '.join(columns)}) SELECT {row}.id, {_values(row, columns)}"
+
+
+def _remove(table: str, columns: tuple[str, ...], row: str) -> str:
+    # External-content deletes must repeat the indexed values being removed.
+    return (
+        f"INSERT INTO {table} ({table}, rowid, {', '.join(columns)}) "
+        f"SELECT 'delete', {row}.id, {_values(row, columns)}"
+    )
+
+
+# Only active blocks are searchable; soft deletes and restores flip is_active.
+TRIGGERS = {
+    "trg_search_blocks_insert": f"""
+        AFTER INSERT ON blocks WHEN NEW.is_active = 1 BEGIN
+            {_add("block_search", BLOCK_COLUMNS, "NEW")};
+        END
+    """,
+    "trg_search_blocks_delete": f"""
+        AFTER DELETE ON blocks WHEN OLD.is_active = 1 BEGIN
+            {_remove("block_search", BLOCK_COLUMNS, "OLD")};
+        END
+    """,
+    "trg_search_blocks_update": f"""
+        AFTER UPDATE OF is_active, {', '.join(BLOCK_COLUMNS)} ON blocks BEGIN
+            {_remove("block_search", BLOCK_COLUMNS, "OLD")} WHERE OLD.is_active = 1;
+            {_add("block_search", BLOCK_COLUMNS, "NEW")} WHERE NEW.is_active = 1;
+        END
+    """,
+    "trg_search_consultants_insert": f"""
+        AFTER INSERT ON consultants BEGIN
+            {_add("consultant_search", CONSULTANT_COLUMNS, "NEW")};
+        END
+    """,
+    "trg_search_consultants_delete": f"""
+        AFTER DELETE ON consultants BEGIN
+            {_remove("consultant_search", CONSULTANT_COLUMNS, "OLD")};
+        END
+    """,
+    "trg_search_consultants_update": f"""
+        AFTER UPDATE OF {', '.join(CONSULTANT_COLUMNS)} ON consultants BEGIN
+            {_remove("consultant_search", CONSULTANT_COLUMNS, "OLD")};
+            {_add("consultant_search", CONSULTANT_COLUMNS, "NEW")};
+        END
+    """,
+}
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS block_search USING fts5(
+            {', '.join(BLOCK_COLUMNS)}, content = 'blocks', content_rowid = 'id', {FTS_OPTIONS}
+        )
+        """
+    )
+    op.execute(
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS consultant_search USING fts5(
+            {', '.join(CONSULTANT_COLUMNS)}, content = 'consultants', content_rowid = 'id', {FTS_OPTIONS}
+        )
+        """
+    )
+    # Backfill from existing rows before the triggers take over ('rebuild' would also index inactive blocks).
+    op.execute(f"{_add('block_search', BLOCK_COLUMNS, 'blocks')} FROM blocks WHERE blocks.is_active = 1")
+    op.execute("INSERT INTO consultant_search (consultant_search) VALUES ('rebuild')")
+
+    for name, body in TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.execute("DROP TABLE IF EXISTS consultant_search")
+    op.execute("DROP TABLE IF EXISTS block_search")
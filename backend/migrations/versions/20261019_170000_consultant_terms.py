@@ -0,0 +1,88 @@
+"""consultant_terms
+
+Revision ID: 011_consultant_terms
+Revises: 010_search_index
+Create Date: 2026-10-19 17:00:00
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "011_consultant_terms"
+down_revision = "010_search_index"
+branch_labels = None
+depends_on = None
+
+
+# Term vectors aggregated from the postings, as term_index did when this revision was written.
+CONSULTANT_TERMS_BACKFILL = """
+    INSERT INTO consultant_terms
+        (term, consultant_id, skill_level, project_count, project_months, ongoing_since, last_used)
+    SELECT bt.term, bt.consultant_id,
+           MAX(CASE WHEN bt.kind = 'skill' THEN COALESCE(bt.level, 1) END),
+           SUM(bt.kind = 'technology'),
+           SUM(CASE WHEN bt.kind = 'technology' AND NOT {open_ended} THEN
+               COALESCE(
+                   b.duration_months,
+                   CAST((julianday(b.end_date) - julianday(b.start_date)) / 30.44 AS INTEGER),
+                   0
+               ) ELSE 0 END),
+           MIN(CASE WHEN bt.kind = 'technology' AND {open_ended} THEN date(b.start_date) END),
+           MAX(CASE WHEN bt.kind = 'technology' THEN
+               CASE WHEN b.is_ongoing THEN '9999-12-31'
+                    ELSE COALESCE(b.end_date, date(b.start_date, '+' || b.duration_months || ' months'), b.start_date)
+               END END)
+    FROM block_terms AS bt JOIN blocks AS b ON b.id = bt.block_id
+    GROUP BY bt.term, bt.consultant_id
+""".format(open_ended="(b.duration_months IS NULL AND b.end_date IS NULL AND b.start_date IS NOT NULL)")
+
+
+def upgrade() -> None:
+    # One row per (term, consultant): the sparse term vectors scored by matching.
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS consultant_terms (
+            term TEXT NOT NULL,
+            consultant_id INTEGER NOT NULL,
+            skill_level INTEGER,
+            project_count INTEGER DEFAULT 0 NOT NULL,
+            project_months INTEGER DEFAULT 0 NOT NULL,
+            ongoing_since DATE,
+            last_used DATE,
+            PRIMARY KEY (term, consultant_id),
+            FOREIGN KEY (consultant_id) REFERENCES consultants(id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+        """
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS idx_consultant_terms_consultant ON consultant_terms(consultant_id)")
+
+    # Consultants whose vectors changed, in commit order, for in-process match indexes to catch up on.
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS consultant_term_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            consultant_id INTEGER NOT NULL
+        )
+        """
+    )
+    # Vectors of deleted consultants go by cascade, without a service refresh.
+    op.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_consultant_term_changes_delete
+        AFTER DELETE ON consultants BEGIN
+            INSERT INTO consultant_term_changes (consultant_id) VALUES (OLD.id);
+        END
+        """
+    )
+
+    op.execute("DELETE FROM consultant_terms")
+    op.execute(CONSULTANT_TERMS_BACKFILL)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_consultant_term_changes_delete")
+    op.execute("DROP TABLE IF EXISTS consultant_term_changes")
+    op.execute("DROP INDEX IF EXISTS idx_consultant_terms_consultant")
+    op.execute("DROP TABLE IF EXISTS consultant_terms")
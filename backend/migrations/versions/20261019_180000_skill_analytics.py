@@ -0,0 +1,230 @@
+"""skill_analytics
+
+Revision ID: 012_skill_analytics
+Revises: 011_consultant_terms
+Create Date: 2026-10-19 18:00:00
+
+"""
+
+import re
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "012_skill_analytics"
+down_revision = "011_consultant_terms"
+branch_labels = None
+depends_on = None
+
+
+AGGREGATE_TABLES = ("skill_counts", "skill_level_counts", "technology_counts", "technology_year_counts")
+
+# Aggregates computed from the postings, as analytics_service did when this revision was written.
+AGGREGATE_BACKFILL = (
+    """INSERT INTO skill_counts (term, consultants)
+       SELECT term, COUNT(DISTINCT consultant_id) FROM block_terms
+       WHERE kind = 'skill' AND NOT is_title_part GROUP BY term""",
+    """INSERT INTO skill_level_counts (term, level, consultants)
+       SELECT term, label, COUNT(DISTINCT consultant_id) FROM block_terms
+       WHERE kind = 'skill' AND NOT is_title_part GROUP BY term, label""",
+    """INSERT INTO technology_counts (term, projects)
+       SELECT term, COUNT(*) FROM block_terms WHERE kind = 'technology' GROUP BY term""",
+    """INSERT INTO technology_year_counts (term, year, projects)
+       SELECT term, COALESCE(year, 0), COUNT(*) FROM block_terms WHERE kind = 'technology' GROUP BY 1, 2""",
+)
+
+
+# Skill title canonicalization as term_index applied it when this revision was written.
+TERM_ALIASES = {
+    "k8s": "kubernetes",
+    "golang": "go",
+    "js": "javascript",
+    "ts": "typescript",
+    "postgres": "postgresql",
+    "node": "node.js",
+    "nodejs": "node.js",
+}
+_WHITESPACE = re.compile(r"\s+")
+
+# Skill blocks whose title postings are flagged per batch.
+BACKFILL_BATCH_ROWS = 1000
+
+
+def _canonical_term(text: str) -> str:
+    term = _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", str(text)).casefold()).strip()
+    return TERM_ALIASES.get(term, term)
+
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return any(column["name"] == column_name for column in inspector.get_columns(table_name))
+
+
+# Whether the consultant holds no other skill posting for the term (at the level, when given).
+def _no_other_skill_posting(row: str, level: bool = False) -> str:
+    condition = (
+        f"SELECT 1 FROM block_terms WHERE consultant_id = {row}.consultant_id AND term = {row}.term "
+        f"AND kind = 'skill' AND NOT is_title_part AND block_id <> {row}.block_id"
+    )
+    if level:
+        condition += f" AND label = {row}.label"
+    return f"NOT EXISTS ({condition})"
+
+
+def _add(table: str, keys: dict[str, str], column: str, when: str = "1") -> str:
+    key_columns = ", ".join(keys)
+    return (
+        f"INSERT INTO {table} ({key_columns}, {column}) SELECT {', '.join(keys.values())}, 1 WHERE {when} "
+        f"ON CONFLICT({key_columns}) DO UPDATE SET {column} = {column} + 1;"
+    )
+
+
+def _remove(table: str, keys: dict[str, str], column: str, when: str = "1") -> str:
+    match = " AND ".join(f"{key} = {value}" for key, value in keys.items())
+    return (
+        f"UPDATE {table} SET {column} = {column} - 1 WHERE {match} AND {when};"
+        f"DELETE FROM {table} WHERE {match} AND {column} <= 0;"
+    )
+
+
+# Postings are only inserted and deleted (a block edit replaces them), never updated.
+# Parts split off a skill title are left out; only the whole title is counted.
+TRIGGERS = {
+    "trg_analytics_skill_postings_insert": f"""
+        AFTER INSERT ON block_terms WHEN NEW.kind = 'skill' AND NOT NEW.is_title_part BEGIN
+            {_add("skill_counts", {"term": "NEW.term"}, "consultants", _no_other_skill_posting("NEW"))}
+            {_add("skill_level_counts", {"term": "NEW.term", "level": "NEW.label"}, "consultants",
+                  _no_other_skill_posting("NEW", level=True))}
+        END
+    """,
+    "trg_analytics_skill_postings_delete": f"""
+        AFTER DELETE ON block_terms WHEN OLD.kind = 'skill' AND NOT OLD.is_title_part BEGIN
+            {_remove("skill_counts", {"term": "OLD.term"}, "consultants", _no_other_skill_posting("OLD"))}
+            {_remove("skill_level_counts", {"term": "OLD.term", "level": "OLD.label"}, "consultants",
+                     _no_other_skill_posting("OLD", level=True))}
+        END
+    """,
+    "trg_analytics_technology_postings_insert": f"""
+        AFTER INSERT ON block_terms WHEN NEW.kind = 'technology' BEGIN
+            {_add("technology_counts", {"term": "NEW.term"}, "projects")}
+            {_add("technology_year_counts", {"term": "NEW.term", "year": "COALESCE(NEW.year, 0)"}, "projects")}
+        END
+    """,
+    "trg_analytics_technology_postings_delete": f"""
+        AFTER DELETE ON block_terms WHEN OLD.kind = 'technology' BEGIN
+            {_remove("technology_counts", {"term": "OLD.term"}, "projects")}
+            {_remove("technology_year_counts", {"term": "OLD.term", "year": "COALESCE(OLD.year, 0)"}, "projects")}
+        END
+    """,
+}
+
+
+def upgrade() -> None:
+    # Analytics attributes of a posting: the skill's display level, the project's
+    # start year and whether the term is only a part of the skill title.
+    if not _has_column("block_terms", "label"):
+        op.execute("ALTER TABLE block_terms ADD COLUMN label VARCHAR(20)")
+    if not _has_column("block_terms", "year"):
+        op.execute("ALTER TABLE block_terms ADD COLUMN year INTEGER")
+    if not _has_column("block_terms", "is_title_part"):
+        op.execute("ALTER TABLE block_terms ADD COLUMN is_title_part BOOLEAN DEFAULT 0 NOT NULL")
+    # Serves the triggers' "other posting of this consultant" checks and consultant vector refreshes.
+    op.execute("CREATE INDEX IF NOT EXISTS idx_block_terms_consultant ON block_terms(consultant_id, term)")
+
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS skill_counts (
+            term TEXT PRIMARY KEY,
+            consultants INTEGER DEFAULT 0 NOT NULL
+        ) WITHOUT ROWID
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS skill_level_counts (
+            term TEXT NOT NULL,
+            level VARCHAR(20) NOT NULL,
+            consultants INTEGER DEFAULT 0 NOT NULL,
+            PRIMARY KEY (term, level)
+        ) WITHOUT ROWID
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS technology_counts (
+            term TEXT PRIMARY KEY,
+            projects INTEGER DEFAULT 0 NOT NULL
+        ) WITHOUT ROWID
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS technology_year_counts (
+            term TEXT NOT NULL,
+            year INTEGER NOT NULL,
+            projects INTEGER DEFAULT 0 NOT NULL,
+            PRIMARY KEY (term, year)
+        ) WITHOUT ROWID
+        """
+    )
+    # Top-N reads walk these instead of sorting the tables.
+    op.execute("CREATE INDEX IF NOT EXISTS idx_skill_counts_rank ON skill_counts(consultants DESC, term)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_technology_counts_rank ON technology_counts(projects DESC, term)")
+
+    # Fill in the postings' analytics attributes, then aggregate them. Skill ranks
+    # already follow the display levels; a project's year is its start (else end) year.
+    op.execute(
+        """
+        UPDATE block_terms
+        SET label = CASE level WHEN 4 THEN 'Expert' WHEN 3 THEN 'Advanced' WHEN 1 THEN 'Basic' ELSE 'Proficient' END
+        WHERE kind = 'skill'
+        """
+    )
+    op.execute(
+        """
+        UPDATE block_terms
+        SET year = (
+            SELECT CAST(substr(COALESCE(NULLIF(start_date, ''), end_date), 1, 4) AS INTEGER)
+            FROM blocks WHERE blocks.id = block_terms.block_id
+        )
+        WHERE kind = 'technology'
+        """
+    )
+    bind = op.get_bind()
+    last_id = 0
+    while rows := bind.execute(
+        sa.text(
+            "SELECT id, title FROM blocks WHERE block_type = 'skill' AND id > :last_id ORDER BY id LIMIT :batch"
+        ),
+        {"last_id": last_id, "batch": BACKFILL_BATCH_ROWS},
+    ).fetchall():
+        bind.execute(
+            sa.text(
+                "UPDATE block_terms SET is_title_part = (term <> :title) WHERE block_id = :id AND kind = 'skill'"
+            ),
+            [{"id": row.id, "title": _canonical_term(row.title or "")} for row in rows],
+        )
+        last_id = rows[-1].id
+    for table in AGGREGATE_TABLES:
+        op.execute(f"DELETE FROM {table}")
+    for query in AGGREGATE_BACKFILL:
+        op.execute(query)
+
+    for name, body in TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.execute("DROP INDEX IF EXISTS idx_technology_counts_rank")
+    op.execute("DROP INDEX IF EXISTS idx_skill_counts_rank")
+    for table in reversed(AGGREGATE_TABLES):
+        op.execute(f"DROP TABLE IF EXISTS {table}")
+    op.execute("DROP INDEX IF EXISTS idx_block_terms_consultant")
+    for column in ("is_title_part", "year", "label"):
+        if _has_column("block_terms", column):
+            op.execute(f"ALTER TABLE block_terms DROP COLUMN {column}")
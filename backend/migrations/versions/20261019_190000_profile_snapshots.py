@@ -0,0 +1,140 @@
+"""profile_snapshots
+
+Revision ID: 013_profile_snapshots
+Revises: 012_skill_analytics
+Create Date: 2026-10-19 19:00:00
+
+"""
+
+import hashlib
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "013_profile_snapshots"
+down_revision = "012_skill_analytics"
+branch_labels = None
+depends_on = None
+
+
+# Profiles whose snapshots are moved per batch; snapshots can be large.
+BACKFILL_BATCH_ROWS = 200
+
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return any(column["name"] == column_name for column in inspector.get_columns(table_name))
+
+
+# Snapshot content is hashed as canonical JSON without its generation time, which stays
+# on the profile; the stored text keeps the key order with a null generated_at placeholder.
+def _split_snapshot(profile_data: str) -> tuple[str, str, str | None]:
+    snapshot = json.loads(profile_data)
+    content = {key: value for key, value in snapshot.items() if key != "generated_at"}
+    digest = hashlib.sha256(json.dumps(content, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+    stored = json.dumps({**snapshot, "generated_at": None}, separators=(",", ":"))
+    return digest, stored, snapshot.get("generated_at")
+
+
+def _release(hash_expression: str) -> str:
+    return (
+        f"UPDATE profile_snapshots SET refcount = refcount - 1 WHERE hash = {hash_expression};"
+        f"DELETE FROM profile_snapshots WHERE hash = {hash_expression} AND refcount <= 0;"
+    )
+
+
+# Reference counts follow the profiles pointing at a snapshot; the last reference
+# going away (including consultant cascades) deletes the snapshot.
+TRIGGERS = {
+    "trg_profile_snapshots_acquire": """
+        AFTER INSERT ON profiles BEGIN
+            UPDATE profile_snapshots SET refcount = refcount + 1 WHERE hash = NEW.snapshot_hash;
+        END
+    """,
+    "trg_profile_snapshots_release": f"""
+        AFTER DELETE ON profiles BEGIN
+            {_release("OLD.snapshot_hash")}
+        END
+    """,
+    "trg_profile_snapshots_replace": f"""
+        AFTER UPDATE OF snapshot_hash ON profiles WHEN OLD.snapshot_hash IS NOT NEW.snapshot_hash BEGIN
+            UPDATE profile_snapshots SET refcount = refcount + 1 WHERE hash = NEW.snapshot_hash;
+            {_release("OLD.snapshot_hash")}
+        END
+    """,
+}
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS profile_snapshots (
+            hash CHAR(64) PRIMARY KEY,
+            data TEXT NOT NULL,
+            refcount INTEGER DEFAULT 0 NOT NULL
+        )
+        """
+    )
+    if not _has_column("profiles", "snapshot_hash"):
+        op.execute("ALTER TABLE profiles ADD COLUMN snapshot_hash CHAR(64)")
+    if not _has_column("profiles", "generated_at"):
+        op.execute("ALTER TABLE profiles ADD COLUMN generated_at VARCHAR(40)")
+
+    # Move every stored snapshot under its content hash, identical snapshots once.
+    if _has_column("profiles", "profile_data"):
+        bind = op.get_bind()
+        last_id = 0
+        while rows := bind.execute(
+            sa.text("SELECT id, profile_data FROM profiles WHERE id > :last_id ORDER BY id LIMIT :batch"),
+            {"last_id": last_id, "batch": BACKFILL_BATCH_ROWS},
+        ).fetchall():
+            snapshots = [
+                dict(zip(("hash", "data", "generated_at"), _split_snapshot(row.profile_data)), id=row.id)
+                for row in rows
+            ]
+            bind.execute(
+                sa.text("INSERT INTO profile_snapshots (hash, data) VALUES (:hash, :data) ON CONFLICT(hash) DO NOTHING"),
+                snapshots,
+            )
+            bind.execute(
+                sa.text("UPDATE profiles SET snapshot_hash = :hash, generated_at = :generated_at WHERE id = :id"),
+                snapshots,
+            )
+            last_id = rows[-1].id
+        # Plain DROP COLUMN keeps the stats and version triggers on profiles.
+        op.execute("ALTER TABLE profiles DROP COLUMN profile_data")
+
+    op.execute(
+        """
+        UPDATE profile_snapshots
+        SET refcount = (SELECT COUNT(*) FROM profiles WHERE profiles.snapshot_hash = profile_snapshots.hash)
+        """
+    )
+    op.execute("DELETE FROM profile_snapshots WHERE refcount = 0")
+
+    for name, body in TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    if not _has_column("profiles", "profile_data"):
+        op.execute("ALTER TABLE profiles ADD COLUMN profile_data TEXT DEFAULT '{}' NOT NULL")
+    op.execute(
+        """
+        UPDATE profiles
+        SET profile_data = (
+            SELECT json_set(data, '$.generated_at', profiles.generated_at)
+            FROM profile_snapshots WHERE hash = profiles.snapshot_hash
+        )
+        WHERE snapshot_hash IN (SELECT hash FROM profile_snapshots)
+        """
+    )
+    for column in ("generated_at", "snapshot_hash"):
+        if _has_column("profiles", column):
+            op.execute(f"ALTER TABLE profiles DROP COLUMN {column}")
+    op.execute("DROP TABLE IF EXISTS profile_snapshots")
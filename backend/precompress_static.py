@@ -0,0 +1,23 @@
+"""CLI entrypoint to write precompressed .br/.gz siblings for the frontend build."""
+
+import argparse
+from pathlib import Path
+
+from src.core.compression import available_encodings, precompress_directory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Precompress static frontend assets.")
+    parser.add_argument("directory", nargs="?", type=Path, default=Path(__file__).resolve().parent / "static")
+    parser.add_argument("--minimum-size", type=int, default=1024, help="Skip files smaller than this (bytes).")
+    args = parser.parse_args()
+
+    if not args.directory.is_dir():
+        raise SystemExit(f"[ERROR] Static directory not found: {args.directory}")
+
+    written = precompress_directory(args.directory, args.minimum_size)
+    print(f"[OK] Wrote {len(written)} precompressed files ({', '.join(available_encodings())}) in {args.directory}.")
+
+
+if __name__ == "__main__":
+    main()
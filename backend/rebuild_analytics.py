@@ -0,0 +1,40 @@
+"""CLI entrypoint to rebuild the skill analytics aggregates, repairing any drift from the blocks.
+
+By default the aggregate tables are recomputed from the term postings; with
+--reindex the postings and consultant term vectors are first re-derived from
+the blocks table as well. Everything is rewritten in one transaction.
+"""
+
+import argparse
+import time
+
+from src.core.database import get_db
+from src.services import analytics_service, term_index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the skill analytics aggregate tables.")
+    parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="Re-derive the term postings and consultant term vectors from the blocks first.",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with get_db() as conn:
+        if args.reindex:
+            postings = term_index.rebuild_postings(conn)
+            print(f"[INFO] Re-indexed {postings} term postings.")
+        analytics_service.rebuild(conn)
+        counts = {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in analytics_service.AGGREGATE_TABLES
+        }
+
+    summary = ", ".join(f"{table}: {count} rows" for table, count in counts.items())
+    print(f"[OK] Rebuilt skill analytics in {time.perf_counter() - started:.1f} s ({summary}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Conditional GET: weak ETags from resource version counters.
+
+Versions are bumped by database triggers on every write, so the ETag is known
+after a single primary-key lookup and a matching ``If-None-Match`` returns 304
+before the listing query or any serialization runs. Routes served from the
+read model take the version from it instead, without a database lookup. The
+ETags are weak because the compression middleware sends the same
+representation as identity, gzip or br bytes.
+"""
+
+import hashlib
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from ..core.database import get_db
+from ..services import version_service
+from ..services.read_model import consultant_read_model
+
+# Clients may keep a copy but must revalidate it on every use.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(scope: str, version: int | str, request: Request) -> str:
+    """Build a weak ETag for one representation (query parameters select the variant)."""
+    variant = hashlib.sha256(f"{scope}|{version}|{request.url.query}".encode("utf-8")).hexdigest()[:16]
+    return f'W/"{version}-{variant}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Evaluate If-None-Match (weak comparison, as RFC 9110 requires for GET)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+class ConditionalGet:
+    """Route dependency that answers If-None-Match from a scope version.
+
+    The version is read before the data, so a concurrent write can only make the
+    ETag older than the body (costing one extra full response), never newer.
+    """
+
+    def __init__(self, request: Request, response: Response):
+        self.request = request
+        self.response = response
+        self.headers: dict[str, str] = {}
+
+    async def check(self, scope: str, read_model: bool = False) -> Response | None:
+        """Stamp ETag headers on the response; return a 304 response when the client copy is current.
+
+        ``read_model`` marks routes serving the scope from the read model while it is enabled.
+        """
+        if read_model and consultant_read_model.enabled:
+            version = consultant_read_model.version(scope)
+        else:
+            with get_db() as conn:
+                version = await version_service.get_version(conn, scope)
+        etag = make_etag(scope, version, self.request)
+        self.headers = cache_headers(etag)
+        if etag_matches(self.request, etag):
+            # The compression middleware only adds Vary to the bodies it compresses.
+            return Response(status_code=304, headers={**self.headers, "Vary": "Accept-Encoding"})
+        self.response.headers.update(self.headers)
+        return None
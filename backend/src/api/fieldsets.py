@@ -0,0 +1,61 @@
+"""Sparse fieldsets (``?fields=a,b``) for list and detail endpoints.
+
+Requested names are validated against the route's response model, pushed down
+into the SQL projection, and serialized through the cached row schema in
+``serialization``.
+"""
+
+from typing import Callable, Mapping
+
+from fastapi import HTTPException, Query, status
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from .serialization import json_response
+
+
+class FieldSelection:
+    """Validated subset of a response model's fields, in model order (None selects all fields)."""
+
+    def __init__(self, model: type[BaseModel], fields: tuple[str, ...] | None = None):
+        self.model = model
+        self.fields = fields
+
+    def response(
+        self,
+        content: dict | list[dict],
+        headers: Mapping[str, str] | None = None,
+        model: type[BaseModel] | None = None,
+    ) -> Response:
+        """Serialize service rows (or a single row), narrowed to the selected fields.
+
+        ``model`` overrides the selection's model for full rows (e.g. a summary view).
+        """
+        if self.fields is None:
+            return json_response(content, model or self.model, headers=headers)
+        return json_response(content, self.model, self.fields, headers)
+
+
+def sparse_fields(model: type[BaseModel]) -> Callable[..., FieldSelection]:
+    """Create a dependency parsing ``fields=`` against ``model``."""
+    allowed = tuple(model.model_fields)
+    description = f"Comma-separated fields to return. Allowed: {', '.join(allowed)}."
+
+    def dependency(fields: str | None = Query(default=None, description=description)) -> FieldSelection:
+        if fields is None:
+            return FieldSelection(model)
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        if not requested:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="fields must name at least one field.",
+            )
+        unknown = requested.difference(allowed)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}. Allowed: {', '.join(allowed)}.",
+            )
+        return FieldSelection(model, tuple(name for name in allowed if name in requested))
+
+    return dependency
@@ -1,13 +1,61 @@
+from datetime import datetime
 from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 
 from ...core.database import get_db
 from ...api.dependencies import get_current_admin, validate_temp_link
-from ...schemas.block import BlockCreate, BlockUpdate, BlockResponse, BlockReorderRequest
-from ...services import block_service
+from ...api.conditional import ConditionalGet
+from ...api.fieldsets import FieldSelection, sparse_fields
+from ...schemas.block import (
+    BlockBatchRequest,
+    BlockBatchResponse,
+    BlockBulkCreate,
+    BlockCreate,
+    BlockUpdate,
+    BlockResponse,
+    BlockReorderRequest,
+)
+from ...services import block_service, version_service
+from ...services.read_model import consultant_read_model
 
 router = APIRouter(prefix="/blocks", tags=["blocks"])
+block_fields = sparse_fields(BlockResponse)
+
+# Cursor for the next delta sync, sent with every block listing.
+SYNC_CURSOR_HEADER = "X-Sync-Cursor"
+SINCE_DESCRIPTION = (
+    f"Sync cursor from a previous {SYNC_CURSOR_HEADER} header: return only blocks changed at or after it, "
+    "deleted blocks included with is_active false. Changes may be sent again; apply them idempotently."
+)
+
+
+async def _list_blocks(
+    consultant_id: int,
+    block_type: str | None,
+    since: datetime | None,
+    fields: FieldSelection,
+    conditional: ConditionalGet,
+):
+    """Serve a full block listing or a delta since a cursor, with the next cursor in a header."""
+    # Narrowed selections still read updated_at for the cursor; serialization drops it again.
+    columns = fields.fields and tuple(dict.fromkeys((*fields.fields, "updated_at")))
+    cursor = None
+    if since is not None:
+        cursor = block_service.sync_cursor_value(since)
+        with get_db() as conn:
+            blocks = await block_service.get_changed_blocks(conn, consultant_id, cursor, block_type, columns)
+    elif consultant_read_model.enabled:
+        blocks = consultant_read_model.get_consultant_blocks(consultant_id, block_type)
+    else:
+        with get_db() as conn:
+            blocks = await block_service.get_consultant_blocks(conn, consultant_id, block_type, columns=columns)
+
+    headers = dict(conditional.headers)
+    next_cursor = block_service.next_sync_cursor(blocks, cursor)
+    if next_cursor:
+        headers[SYNC_CURSOR_HEADER] = next_cursor
+    return fields.response(blocks, headers)
 
 
 # Admin routes (authenticated)
@@ -15,12 +63,18 @@ router = APIRouter(prefix="/blocks", tags=["blocks"])
 async def get_consultant_blocks(
     consultant_id: int,
     block_type: Literal["project", "skill", "misc", "certification"] | None = Query(default=None),
+    since: datetime | None = Query(default=None, description=SINCE_DESCRIPTION),
+    fields: FieldSelection = Depends(block_fields),
+    conditional: ConditionalGet = Depends(),
     _admin: dict = Depends(get_current_admin),
 ):
-    """Get all blocks for a consultant (admin access)"""
-    with get_db() as conn:
-        blocks = await block_service.get_consultant_blocks(conn, consultant_id, block_type)
-    return blocks
+    """Get all blocks for a consultant (admin access), or only those changed since a sync cursor"""
+    not_modified = await conditional.check(
+        version_service.consultant_blocks_scope(consultant_id), read_model=since is None
+    )
+    if not_modified:
+        return not_modified
+    return await _list_blocks(consultant_id, block_type, since, fields, conditional)
 
 
 # Temporary link routes (no auth, token in URL)
@@ -28,12 +82,18 @@ async def get_consultant_blocks(
 async def get_blocks_via_token(
     token: str,
     block_type: Literal["project", "skill", "misc", "certification"] | None = Query(default=None),
+    since: datetime | None = Query(default=None, description=SINCE_DESCRIPTION),
+    fields: FieldSelection = Depends(block_fields),
+    conditional: ConditionalGet = Depends(),
 ):
-    """Get consultant blocks via temporary link"""
+    """Get consultant blocks via temporary link, or only those changed since a sync cursor"""
     link = await validate_temp_link(token)
-    with get_db() as conn:
-        blocks = await block_service.get_consultant_blocks(conn, link['consultant_id'], block_type)
-    return blocks
+    not_modified = await conditional.check(
+        version_service.consultant_blocks_scope(link["consultant_id"]), read_model=since is None
+    )
+    if not_modified:
+        return not_modified
+    return await _list_blocks(link["consultant_id"], block_type, since, fields, conditional)
 
 
 @router.post("/edit/{token}", response_model=BlockResponse, status_code=status.HTTP_201_CREATED)
@@ -48,6 +108,33 @@ async def create_block_via_token(
     return block
 
 
+@router.post("/edit/{token}/bulk", response_model=list[BlockResponse], status_code=status.HTTP_201_CREATED)
+async def create_blocks_via_token(
+    token: str,
+    bulk_data: BlockBulkCreate,
+):
+    """Create several blocks via temp link in one transaction"""
+    link = await validate_temp_link(token)
+    with get_db() as conn:
+        blocks = await block_service.create_blocks(conn, link['consultant_id'], bulk_data.blocks)
+    return blocks
+
+
+@router.post("/edit/{token}/batch", response_model=BlockBatchResponse)
+async def apply_block_batch_via_token(
+    token: str,
+    batch_data: BlockBatchRequest,
+):
+    """Apply mixed create, update and delete operations via temp link in one transaction"""
+    link = await validate_temp_link(token)
+    with get_db() as conn:
+        try:
+            results = await block_service.apply_block_batch(conn, link['consultant_id'], batch_data.operations)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return {"results": results}
+
+
 @router.put("/edit/{token}/{block_id}", response_model=BlockResponse)
 async def update_block_via_token(
     token: str,
@@ -85,13 +172,30 @@ async def delete_block_via_token(
     return None
 
 
+async def _rebalance_block_orders(consultant_id: int) -> None:
+    """Background task: respace a consultant's order keys after moves left small gaps."""
+    with get_db() as conn:
+        await block_service.rebalance_block_orders(conn, consultant_id)
+
+
 @router.post("/edit/{token}/reorder", status_code=status.HTTP_204_NO_CONTENT)
 async def reorder_blocks_via_token(
     token: str,
     reorder_data: BlockReorderRequest,
+    background_tasks: BackgroundTasks,
 ):
-    """Reorder blocks via temp link"""
+    """Reorder blocks via temp link, from explicit orders or "place X after Y" moves"""
     link = await validate_temp_link(token)
-    with get_db() as conn:
-        await block_service.reorder_blocks(conn, link['consultant_id'], reorder_data.block_orders)
+    consultant_id = link['consultant_id']
+    try:
+        with get_db() as conn:
+            if reorder_data.moves is not None:
+                needs_rebalance = await block_service.move_blocks(conn, consultant_id, reorder_data.moves)
+            else:
+                await block_service.reorder_blocks(conn, consultant_id, reorder_data.block_orders)
+                needs_rebalance = False
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if needs_rebalance:
+        background_tasks.add_task(_rebalance_block_orders, consultant_id)
     return None
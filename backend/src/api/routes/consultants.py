@@ -1,13 +1,27 @@
 import sqlite3
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import FileResponse
 
+from ...core.config import settings
 from ...core.database import get_db
 from ...api.dependencies import get_current_admin, validate_temp_link
+from ...api.conditional import ConditionalGet
+from ...api.fieldsets import FieldSelection, sparse_fields
 from ...schemas.consultant import ConsultantCreate, ConsultantUpdate, ConsultantResponse
-from ...services import consultant_service
+from ...services import consultant_service, photo_service, version_service
+from ...services.read_model import consultant_read_model
 
 router = APIRouter(prefix="/consultants", tags=["consultants"])
+consultant_fields = sparse_fields(ConsultantResponse)
+
+PHOTO_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"image/*": {"schema": {"type": "string", "format": "binary"}}},
+    }
+}
 
 
 def _is_unique_email_error(exc: sqlite3.IntegrityError) -> bool:
@@ -16,6 +30,37 @@ def _is_unique_email_error(exc: sqlite3.IntegrityError) -> bool:
     return "consultants.email" in message or "UNIQUE constraint failed: consultants.email" in message
 
 
+async def _store_consultant_photo(request: Request, consultant_id: int) -> dict:
+    """Stream the raw request body into photo storage and point the consultant at it."""
+    with get_db() as conn:
+        consultant = await consultant_service.get_consultant(conn, consultant_id)
+    if not consultant:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Consultant not found")
+
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Photo exceeds the {settings.MAX_UPLOAD_SIZE_MB} MB upload limit.",
+        )
+
+    try:
+        digest = await photo_service.store_photo(request.stream())
+    except photo_service.PhotoTooLargeError as exc:
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    photo_url = request.app.url_path_for("get_consultant_photo", digest=digest, variant="thumb")
+    with get_db() as conn:
+        consultant = await consultant_service.update_consultant(
+            conn, consultant_id, ConsultantUpdate(photo_url=str(photo_url))
+        )
+    if not consultant:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Consultant not found")
+    return consultant
+
+
 @router.post("", response_model=ConsultantResponse, status_code=status.HTTP_201_CREATED)
 async def create_consultant(
     consultant_data: ConsultantCreate,
@@ -36,25 +81,68 @@ async def create_consultant(
 async def list_consultants(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=500),
+    fields: FieldSelection = Depends(consultant_fields),
+    conditional: ConditionalGet = Depends(),
     _admin: dict = Depends(get_current_admin),
 ):
     """List all consultants"""
+    not_modified = await conditional.check(version_service.CONSULTANTS_SCOPE, read_model=True)
+    if not_modified:
+        return not_modified
+    if consultant_read_model.enabled:
+        consultants = consultant_read_model.list_consultants(skip, limit)
+    else:
+        with get_db() as conn:
+            consultants = await consultant_service.get_consultants(
+                conn, skip, limit, columns=fields.fields
+            )
+    return fields.response(consultants, conditional.headers)
+
+
+@router.get("/photos/{digest}/{variant}", name="get_consultant_photo")
+async def get_consultant_photo(digest: str, variant: Literal["thumb", "pdf"]):
+    """Serve a pre-sized consultant photo; content-addressed, so cacheable forever."""
+    path = photo_service.get_variant_path(digest, variant)
+    if not path:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Photo not found")
+    return FileResponse(path, headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+
+@router.get("/read-model/consistency")
+async def check_read_model_consistency(
+    reload: bool = Query(default=False),
+    _admin: dict = Depends(get_current_admin),
+):
+    """Compare the in-memory read model with the database, optionally reloading it on drift."""
     with get_db() as conn:
-        consultants = await consultant_service.get_consultants(conn, skip, limit)
-    return consultants
+        report = consultant_read_model.check_consistency(conn)
+        if reload and consultant_read_model.enabled and not report["consistent"]:
+            consultant_read_model.load(conn)
+            report["reloaded"] = True
+    return report
 
 
 @router.get("/{consultant_id}", response_model=ConsultantResponse)
 async def get_consultant(
     consultant_id: int,
+    fields: FieldSelection = Depends(consultant_fields),
+    conditional: ConditionalGet = Depends(),
     _admin: dict = Depends(get_current_admin)
 ):
     """Get consultant details"""
-    with get_db() as conn:
-        consultant = await consultant_service.get_consultant(conn, consultant_id)
+    not_modified = await conditional.check(version_service.consultant_scope(consultant_id), read_model=True)
+    if not_modified:
+        return not_modified
+    if consultant_read_model.enabled:
+        consultant = consultant_read_model.get_consultant(consultant_id)
+    else:
+        with get_db() as conn:
+            consultant = await consultant_service.get_consultant(
+                conn, consultant_id, columns=fields.fields
+            )
     if not consultant:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Consultant not found")
-    return consultant
+    return fields.response(consultant, conditional.headers)
 
 
 @router.put("/{consultant_id}", response_model=ConsultantResponse)
@@ -76,6 +164,16 @@ async def update_consultant(
     return consultant
 
 
+@router.put("/{consultant_id}/photo", response_model=ConsultantResponse, openapi_extra=PHOTO_UPLOAD_OPENAPI)
+async def upload_consultant_photo(
+    consultant_id: int,
+    request: Request,
+    _admin: dict = Depends(get_current_admin),
+):
+    """Upload a consultant photo as the raw request body (JPEG, PNG or WebP)."""
+    return await _store_consultant_photo(request, consultant_id)
+
+
 @router.delete("/{consultant_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_consultant(
     consultant_id: int,
@@ -91,14 +189,26 @@ async def delete_consultant(
 
 # Temporary link routes (no auth, token in URL)
 @router.get("/edit/{token}", response_model=ConsultantResponse)
-async def get_consultant_via_token(token: str):
+async def get_consultant_via_token(
+    token: str,
+    fields: FieldSelection = Depends(consultant_fields),
+    conditional: ConditionalGet = Depends(),
+):
     """Get consultant data via temporary link"""
     link = await validate_temp_link(token)
-    with get_db() as conn:
-        consultant = await consultant_service.get_consultant(conn, link['consultant_id'])
+    not_modified = await conditional.check(version_service.consultant_scope(link["consultant_id"]), read_model=True)
+    if not_modified:
+        return not_modified
+    if consultant_read_model.enabled:
+        consultant = consultant_read_model.get_consultant(link['consultant_id'])
+    else:
+        with get_db() as conn:
+            consultant = await consultant_service.get_consultant(
+                conn, link['consultant_id'], columns=fields.fields
+            )
     if not consultant:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Consultant not found")
-    return consultant
+    return fields.response(consultant, conditional.headers)
 
 
 @router.put("/edit/{token}", response_model=ConsultantResponse)
@@ -118,3 +228,10 @@ async def update_consultant_via_token(
     if not consultant:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Consultant not found")
     return consultant
+
+
+@router.put("/edit/{token}/photo", response_model=ConsultantResponse, openapi_extra=PHOTO_UPLOAD_OPENAPI)
+async def upload_consultant_photo_via_token(token: str, request: Request):
+    """Upload the consultant photo via temporary link"""
+    link = await validate_temp_link(token)
+    return await _store_consultant_photo(request, link["consultant_id"])
@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from ...api.dependencies import get_current_admin
+from ...services import export_service
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+RECORD_TYPES_DESCRIPTION = (
+    f"Comma-separated record types to export. Allowed: {', '.join(export_service.EXPORT_TABLES)}. "
+    "Defaults to all; 'consultant,block' produces a file the import endpoint accepts."
+)
+
+
+@router.get("", response_class=StreamingResponse)
+async def export_data(
+    record_types: str | None = Query(default=None, description=RECORD_TYPES_DESCRIPTION),
+    compress: bool = Query(default=False, description="Return a gzip-compressed file."),
+    _admin: dict = Depends(get_current_admin),
+):
+    """Stream the dataset as NDJSON from one consistent database snapshot"""
+    requested = None
+    if record_types is not None:
+        requested = [name.strip() for name in record_types.split(",") if name.strip()]
+    try:
+        tables = export_service.resolve_record_types(requested)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    filename = f"prisme-export-{timestamp}.ndjson" + (".gz" if compress else "")
+    return StreamingResponse(
+        export_service.iter_export(tables, compress),
+        media_type="application/gzip" if compress else "application/x-ndjson",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
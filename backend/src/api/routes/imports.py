@@ -0,0 +1,129 @@
+import io
+import json
+import queue
+import tempfile
+import threading
+from typing import Iterator, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from ...api.dependencies import get_current_admin
+from ...core.config import settings
+from ...schemas.imports import ImportReportResponse
+from ...services import import_service
+
+router = APIRouter(prefix="/import", tags=["import"])
+
+# Uploads up to this size are buffered in memory; larger ones spill to a temporary file.
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+IMPORT_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/x-ndjson": {"schema": {"type": "string", "format": "binary"}},
+            "text/csv": {"schema": {"type": "string", "format": "binary"}},
+        },
+    },
+    "responses": {
+        "200": {
+            "content": {
+                "application/x-ndjson": {
+                    "schema": {"type": "string"},
+                    "description": (
+                        "With progress=true: one report line per committed chunk (event \"progress\"), "
+                        "then the final report (event \"report\") or an error (event \"error\")."
+                    ),
+                }
+            }
+        }
+    },
+}
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+        detail=f"Import exceeds the {settings.MAX_IMPORT_SIZE_MB} MB upload limit.",
+    )
+
+
+async def _spool_request(request: Request) -> tempfile.SpooledTemporaryFile:
+    """Buffer the raw request body under the import size limit, rewound for reading."""
+    limit = settings.MAX_IMPORT_SIZE_MB * 1024 * 1024
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > limit:
+        raise _too_large()
+
+    upload = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    size = 0
+    try:
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > limit:
+                raise _too_large()
+            upload.write(chunk)
+    except BaseException:
+        upload.close()
+        raise
+    upload.seek(0)
+    return upload
+
+
+def _event_line(event: str, **payload) -> bytes:
+    return (json.dumps({"event": event, **payload}) + "\n").encode("utf-8")
+
+
+def _report_line(event: str, report: import_service.ImportReport) -> bytes:
+    return _event_line(event, **ImportReportResponse.model_validate(report).model_dump())
+
+
+def _stream_import(upload, fmt: str, admin_id: int, chunk_size: int) -> Iterator[bytes]:
+    """Run the import in a worker thread and yield its progress as NDJSON lines, ending with the report."""
+    lines: queue.Queue = queue.Queue()
+
+    def run() -> None:
+        text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+        try:
+            report = import_service.import_records(
+                text, fmt, admin_id, chunk_size, progress=lambda report: lines.put(_report_line("progress", report))
+            )
+            lines.put(_report_line("report", report))
+        except ValueError as exc:
+            lines.put(_event_line("error", detail=str(exc)))
+        finally:
+            text.detach()
+            upload.close()
+            lines.put(None)
+
+    threading.Thread(target=run, name="import", daemon=True).start()
+    while (line := lines.get()) is not None:
+        yield line
+
+
+@router.post("", response_model=ImportReportResponse, openapi_extra=IMPORT_OPENAPI)
+async def import_data(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query(description="Format of the raw request body."),
+    chunk_size: int = Query(default=import_service.DEFAULT_CHUNK_SIZE, ge=1, le=5000),
+    progress: bool = Query(default=False, description="Stream NDJSON progress lines after each committed chunk."),
+    admin: dict = Depends(get_current_admin),
+):
+    """Import consultants and blocks from a raw JSON Lines or CSV body, reporting per-row errors."""
+    upload = await _spool_request(request)
+    if progress:
+        return StreamingResponse(
+            _stream_import(upload, format, admin["id"], chunk_size), media_type="application/x-ndjson"
+        )
+
+    with upload:
+        text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+        try:
+            report = await run_in_threadpool(import_service.import_records, text, format, admin["id"], chunk_size)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+        finally:
+            text.detach()
+    return report
@@ -1,20 +1,75 @@
+import asyncio
 import io
 import logging
 import re
-from typing import Optional
+from typing import Any, Awaitable, Literal, Optional
 
-from fastapi import APIRouter, Depends, Form, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
 
 from ...core.database import get_db
 from ...api.dependencies import get_current_admin
-from ...schemas.profile import ProfileCreate, ProfileUpdate, ProfileResponse
+from ...api.conditional import ConditionalGet
+from ...api.fieldsets import FieldSelection, sparse_fields
+from ...schemas.profile import (
+    BlockSuggestionRequest,
+    BlockSuggestionResponse,
+    ProfileCreate,
+    ProfileUpdate,
+    ProfileResponse,
+    ProfileSummaryResponse,
+)
+from ...services import block_suggestion_service
 from ...services import profile_service
 from ...services import profile_export_service
+from ...services import version_service
 
 router = APIRouter(prefix="/profiles", tags=["profiles"])
 logger = logging.getLogger(__name__)
 HEX_COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+CLIENT_CLOSED_REQUEST = 499
+ProfileView = Literal["full", "summary"]
+profile_fields = sparse_fields(ProfileResponse)
+VIEW_QUERY_DESCRIPTION = (
+    "'summary' omits selected_block_ids and profile_data; fetch GET /profiles/{id} for the snapshot. "
+    "Ignored when fields is given."
+)
+
+
+def _list_model(view: str) -> type[ProfileSummaryResponse]:
+    """Response model of one entry in a profile listing for the requested view."""
+    return ProfileSummaryResponse if view == "summary" else ProfileResponse
+
+
+class ClientDisconnected(Exception):
+    """Raised when the client went away while waiting for a shared result."""
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    """Block until the ASGI server reports that the client disconnected."""
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def _await_unless_disconnected(request: Request, awaitable: Awaitable[Any]) -> Any:
+    """Await a result, detaching early (and cancelling only this waiter) if the client disconnects."""
+    waiter = asyncio.ensure_future(awaitable)
+    disconnect = asyncio.ensure_future(_wait_for_disconnect(request))
+    try:
+        done, _ = await asyncio.wait({waiter, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        waiter.cancel()
+        raise
+    finally:
+        disconnect.cancel()
+
+    if waiter in done:
+        return waiter.result()
+
+    waiter.cancel()
+    raise ClientDisconnected()
 
 
 @router.post("", response_model=ProfileResponse, status_code=status.HTTP_201_CREATED)
@@ -31,40 +86,86 @@ async def create_profile(
     return profile
 
 
-@router.get("", response_model=list[ProfileResponse])
+@router.post("/suggest-blocks", response_model=BlockSuggestionResponse)
+async def suggest_blocks(
+    request: BlockSuggestionRequest,
+    admin: dict = Depends(get_current_admin),
+):
+    """Rank a consultant's blocks against target skills and propose a selection fitting a page budget."""
+    with get_db() as conn:
+        try:
+            return await block_suggestion_service.suggest_blocks(
+                conn,
+                request.consultant_id,
+                request.skills,
+                max_pages=request.max_pages,
+                include_unmatched=request.include_unmatched,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get("", response_model=list[ProfileResponse] | list[ProfileSummaryResponse])
 async def list_profiles(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=500),
+    view: ProfileView = Query(default="full", description=VIEW_QUERY_DESCRIPTION),
+    fields: FieldSelection = Depends(profile_fields),
+    conditional: ConditionalGet = Depends(),
     _admin: dict = Depends(get_current_admin),
 ):
     """List all profiles"""
+    not_modified = await conditional.check(version_service.PROFILES_SCOPE)
+    if not_modified:
+        return not_modified
     with get_db() as conn:
-        profiles = await profile_service.get_profiles(conn, skip, limit)
-    return profiles
+        profiles = await profile_service.get_profiles(
+            conn, skip, limit, summary=view == "summary", columns=fields.fields
+        )
+    return fields.response(profiles, conditional.headers, model=_list_model(view))
 
 
-@router.get("/consultant/{consultant_id}", response_model=list[ProfileResponse])
+@router.get("/export/metrics")
+async def get_export_metrics(_admin: dict = Depends(get_current_admin)):
+    """Report how many PDF renders were shared between concurrent export requests."""
+    return profile_export_service.export_render_flight.metrics()
+
+
+@router.get("/consultant/{consultant_id}", response_model=list[ProfileResponse] | list[ProfileSummaryResponse])
 async def get_consultant_profiles(
     consultant_id: int,
+    view: ProfileView = Query(default="full", description=VIEW_QUERY_DESCRIPTION),
+    fields: FieldSelection = Depends(profile_fields),
+    conditional: ConditionalGet = Depends(),
     _admin: dict = Depends(get_current_admin),
 ):
     """Get all profiles for a consultant"""
+    not_modified = await conditional.check(version_service.consultant_profiles_scope(consultant_id))
+    if not_modified:
+        return not_modified
     with get_db() as conn:
-        profiles = await profile_service.get_consultant_profiles(conn, consultant_id)
-    return profiles
+        profiles = await profile_service.get_consultant_profiles(
+            conn, consultant_id, summary=view == "summary", columns=fields.fields
+        )
+    return fields.response(profiles, conditional.headers, model=_list_model(view))
 
 
 @router.get("/{profile_id}", response_model=ProfileResponse)
 async def get_profile(
     profile_id: int,
+    fields: FieldSelection = Depends(profile_fields),
+    conditional: ConditionalGet = Depends(),
     _admin: dict = Depends(get_current_admin),
 ):
     """Get profile details"""
+    not_modified = await conditional.check(version_service.profile_scope(profile_id))
+    if not_modified:
+        return not_modified
     with get_db() as conn:
-        profile = await profile_service.get_profile(conn, profile_id)
+        profile = await profile_service.get_profile(conn, profile_id, columns=fields.fields)
     if not profile:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
-    return profile
+    return fields.response(profile, conditional.headers)
 
 
 @router.put("/{profile_id}", response_model=ProfileResponse)
@@ -116,6 +217,7 @@ async def duplicate_profile(
 
 @router.post("/{profile_id}/export/pdf")
 async def export_profile_pdf(
+    request: Request,
     profile_id: int,
     company_name: Optional[str] = Form(None),
     accent_color: Optional[str] = Form("#0E4B8A"),
@@ -138,12 +240,16 @@ async def export_profile_pdf(
         )
 
     try:
-        # Export profile to PDF
-        pdf_bytes, filename = profile_export_service.export_profile_to_pdf(
-            profile_data=profile["profile_data"],
-            company_name=company_name,
-            accent_color=accent_color,
-            template=template,
+        # Export profile to PDF; identical concurrent exports share one render
+        pdf_bytes, filename = await _await_unless_disconnected(
+            request,
+            profile_export_service.export_profile_to_pdf_shared(
+                profile_data=profile["profile_data"],
+                company_name=company_name,
+                accent_color=accent_color,
+                template=template,
+                snapshot_key=profile_service.snapshot_key(profile),
+            ),
         )
 
         # Return PDF as streaming response
@@ -154,6 +260,10 @@ async def export_profile_pdf(
                 "Content-Disposition": f"attachment; filename={filename}"
             },
         )
+    except ClientDisconnected:
+        logger.info("Client disconnected while waiting for PDF export of profile %s", profile_id)
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from ...core.database import get_db
+from ...api.dependencies import get_current_admin
+from ...schemas.search import SearchResponse
+from ...services import search_service
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+QUERY_DESCRIPTION = 'All words must match; use "quoted phrases" and trailing * for prefixes (e.g. migr*).'
+TYPES_DESCRIPTION = (
+    f"Comma-separated kinds to search. Allowed: {', '.join(search_service.SEARCH_KINDS)}. Defaults to all."
+)
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(min_length=1, max_length=200, description=QUERY_DESCRIPTION),
+    types: str | None = Query(default=None, description=TYPES_DESCRIPTION),
+    limit: int = Query(default=20, ge=1, le=100),
+    _admin: dict = Depends(get_current_admin),
+):
+    """Full-text search over consultants and blocks, ranked by relevance"""
+    kinds = None
+    if types is not None:
+        kinds = [kind.strip() for kind in types.split(",") if kind.strip()]
+    try:
+        with get_db() as conn:
+            return await search_service.search(conn, q, kinds, limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
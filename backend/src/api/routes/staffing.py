@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from ...core.database import get_db
+from ...api.dependencies import get_current_admin
+from ...schemas.staffing import ConsultantMatchResponse, MatchRequest, StaffingMatchResponse
+from ...services import matching_service, term_index
+
+router = APIRouter(prefix="/staffing", tags=["staffing"])
+
+MAX_TERMS = 20
+
+
+@router.get("/consultants", response_model=list[StaffingMatchResponse])
+async def find_consultants_by_terms(
+    terms: str = Query(description="Comma-separated technologies or skills; consultants must hold all of them."),
+    min_level: str | None = Query(
+        default=None,
+        description=f"Only count skills at this level or above ({', '.join(term_index.SKILL_LEVELS)}).",
+    ),
+    limit: int = Query(default=100, ge=1, le=500),
+    _admin: dict = Depends(get_current_admin),
+):
+    """Find consultants holding every requested technology or skill, from the term index"""
+    requested = [term for term in terms.split(",") if term.strip()]
+    if len(requested) > MAX_TERMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {MAX_TERMS} terms can be combined."
+        )
+    try:
+        with get_db() as conn:
+            return await term_index.find_consultants(conn, requested, min_level, limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.post("/match", response_model=list[ConsultantMatchResponse])
+async def match_consultants(
+    request: MatchRequest,
+    _admin: dict = Depends(get_current_admin),
+):
+    """Rank consultants against weighted required and nice-to-have skills and technologies"""
+    try:
+        with get_db() as conn:
+            return await matching_service.match_consultants(
+                conn, [requirement.model_dump() for requirement in request.requirements], request.limit
+            )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, Query
+
+from ...core.database import get_db
+from ...api.dependencies import get_current_admin
+from ...schemas.stats import DashboardStatsResponse, SkillAnalyticsResponse
+from ...services import analytics_service, stats_service
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get("", response_model=DashboardStatsResponse)
+async def get_dashboard_stats(
+    weeks: int = Query(default=12, ge=1, le=260),
+    _admin: dict = Depends(get_current_admin),
+):
+    """Get dashboard totals, block counts per type, active links and weekly profile creation"""
+    with get_db() as conn:
+        stats = await stats_service.get_dashboard_stats(conn, weeks)
+    return stats
+
+
+@router.get("/skills", response_model=SkillAnalyticsResponse)
+async def get_skill_analytics(
+    limit: int = Query(default=50, ge=1, le=500),
+    _admin: dict = Depends(get_current_admin),
+):
+    """Get the team skill heatmap (consultants per skill and level) and technology usage by year"""
+    with get_db() as conn:
+        analytics = await analytics_service.get_skill_analytics(conn, limit)
+    return analytics
@@ -0,0 +1,64 @@
+"""Response encoding for rows produced by the service layer.
+
+Service rows were validated and normalized when they were written, so responses
+skip the input-side checks the response schemas inherit (email syntax checks and
+Python normalizing validators) and never build a model instance per row. Each
+response model is compiled once into a TypedDict row schema whose TypeAdapter
+validates and dumps rows to JSON bytes inside pydantic-core.
+"""
+
+import types
+from functools import lru_cache
+from typing import Annotated, Any, Mapping, Union, get_args, get_origin
+
+from fastapi.responses import Response
+from pydantic import BaseModel, EmailStr, TypeAdapter
+from typing_extensions import NotRequired, TypedDict
+
+# Input-only annotations and the plain type checked on output instead.
+TRUSTED_ANNOTATIONS = {EmailStr: str}
+
+
+def _trusted_annotation(annotation: Any) -> Any:
+    if annotation in TRUSTED_ANNOTATIONS:
+        return TRUSTED_ANNOTATIONS[annotation]
+    if get_origin(annotation) in (Union, types.UnionType):
+        return Union[tuple(_trusted_annotation(member) for member in get_args(annotation))]
+    return annotation
+
+
+@lru_cache(maxsize=256)
+def row_schema(model: type[BaseModel], fields: tuple[str, ...] | None = None) -> type:
+    """Build (once per field set) the TypedDict row schema for ``model``, limited to ``fields``."""
+    annotations = {}
+    for name in fields or tuple(model.model_fields):
+        field = model.model_fields[name]
+        annotation = _trusted_annotation(field.annotation)
+        # Field metadata keeps constraints, aliases and defaults for omitted keys.
+        if field.is_required():
+            annotations[name] = Annotated[annotation, field]
+        else:
+            annotations[name] = NotRequired[Annotated[annotation, field]]
+    return TypedDict(f"{model.__name__}Row", annotations)
+
+
+@lru_cache(maxsize=256)
+def response_adapter(model: type[BaseModel], fields: tuple[str, ...] | None = None, many: bool = True) -> TypeAdapter:
+    """Return the cached adapter for a ``model`` row (or list of rows), limited to ``fields``."""
+    schema = row_schema(model, fields)
+    return TypeAdapter(list[schema] if many else schema)
+
+
+def json_response(
+    content: Mapping[str, Any] | list[Mapping[str, Any]],
+    model: type[BaseModel],
+    fields: tuple[str, ...] | None = None,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Encode service rows (or a single row) as ``model`` JSON, narrowed to ``fields``."""
+    adapter = response_adapter(model, fields, isinstance(content, list))
+    return Response(
+        adapter.dump_json(adapter.validate_python(content)),
+        media_type="application/json",
+        headers=headers,
+    )
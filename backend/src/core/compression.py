@@ -0,0 +1,155 @@
+"""HTTP compression: br/gzip negotiation for API responses and precompressed static files.
+
+Brotli is optional; without the ``brotli`` package only gzip is offered.
+"""
+
+import gzip
+from pathlib import Path
+from typing import Iterable
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES, GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the installed extras
+    brotli = None
+
+# Precompressed sibling suffix per content coding, in server preference order.
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# Static file types worth precompressing; images and fonts are already compressed.
+COMPRESSIBLE_SUFFIXES = {
+    ".css", ".html", ".ico", ".js", ".json", ".map", ".mjs", ".svg", ".txt", ".webmanifest", ".xml",
+}
+
+# PDF exports are mostly compressed streams already; gzip data exports are compressed by the route.
+EXCLUDED_CONTENT_TYPES = (*DEFAULT_EXCLUDED_CONTENT_TYPES, "application/pdf", "application/gzip")
+
+# Compress large bodies off the event loop, like Starlette's gzip responder.
+THREAD_MINIMUM_SIZE = 128 * 1024
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Return the content codings this process can produce, most preferred first."""
+    return ("br", "gzip") if brotli else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str, available: Iterable[str]) -> str | None:
+    """Pick the first available coding with the highest q-value in Accept-Encoding."""
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, parameters = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for parameter in parameters.split(";"):
+            key, _, value = parameter.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in available:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class BrotliResponder(IdentityResponder):
+    """Brotli counterpart of Starlette's GZipResponder (supports streaming bodies)."""
+
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int, *, exclude_content_types: tuple[str, ...]):
+        super().__init__(app, minimum_size, exclude_content_types=exclude_content_types)
+        self.quality = quality
+        self._compressor = None
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if len(body) >= THREAD_MINIMUM_SIZE:
+            return await run_in_threadpool(self._compress_body, body, more_body)
+        return self._compress_body(body, more_body)
+
+    def _compress_body(self, body: bytes, more_body: bool) -> bytes:
+        if self._compressor is None:
+            self._compressor = brotli.Compressor(quality=self.quality)
+        if more_body:
+            return self._compressor.process(body) + self._compressor.flush()
+        return self._compressor.process(body) + self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """Compress responses under ``path_prefix`` of at least ``minimum_size`` bytes with br or gzip.
+
+    Responses that already carry Content-Encoding (precompressed static files) pass through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        path_prefix: str = "/api",
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.path_prefix = path_prefix
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), available_encodings())
+        if encoding == "br":
+            responder = BrotliResponder(
+                self.app, self.minimum_size, self.brotli_quality, exclude_content_types=EXCLUDED_CONTENT_TYPES
+            )
+        elif encoding == "gzip":
+            responder = GZipResponder(
+                self.app,
+                self.minimum_size,
+                compresslevel=self.gzip_level,
+                thread_minimum_size=THREAD_MINIMUM_SIZE,
+                exclude_content_types=EXCLUDED_CONTENT_TYPES,
+            )
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size, exclude_content_types=EXCLUDED_CONTENT_TYPES)
+        await responder(scope, receive, send)
+
+
+def precompress_directory(directory: Path, minimum_size: int = 1024) -> list[Path]:
+    """Write maximum-level .br/.gz siblings for compressible files; return the files written.
+
+    A sibling is only kept when it is smaller than the original.
+    """
+    written: list[Path] = []
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file() or path.suffix.lower() not in COMPRESSIBLE_SUFFIXES:
+            continue
+        data = path.read_bytes()
+        if len(data) < minimum_size:
+            continue
+
+        candidates = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli:
+            candidates["br"] = brotli.compress(data, quality=11)
+        for encoding, compressed in candidates.items():
+            sibling = path.with_name(path.name + ENCODING_SUFFIXES[encoding])
+            if len(compressed) >= len(data):
+                sibling.unlink(missing_ok=True)
+                continue
+            sibling.write_bytes(compressed)
+            written.append(sibling)
+    return written
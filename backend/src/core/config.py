@@ -20,13 +20,25 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # In-process read model for consultant/block reads (single-worker deployments only)
+    READ_MODEL_ENABLED: bool = False
+
+    # Response compression (API responses at least this many bytes are sent br/gzip-encoded)
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+
     # CORS
     CORS_ORIGINS: list[str] = Field(default_factory=lambda: ["http://localhost:5173", "http://localhost:3000"])
 
     # File Upload
+    UPLOAD_DIR: str = "./uploads"
     MAX_UPLOAD_SIZE_MB: int = 5
+    MAX_IMPORT_SIZE_MB: int = 200
     ALLOWED_IMAGE_EXTENSIONS: list[str] = Field(default_factory=lambda: ["jpg", "jpeg", "png", "webp"])
 
+    # PDF Export (TTF family loaded from PDF_FONT_DIR as <family>-Regular.ttf, -Bold, -Italic, -BoldItalic)
+    PDF_FONT_FAMILY: str | None = None
+    PDF_FONT_DIR: str = "./fonts"
+
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
     @field_validator("SECRET_KEY")
@@ -1,6 +1,6 @@
 import sqlite3
 from contextlib import contextmanager
-from typing import Generator, Sequence
+from typing import Callable, Generator, Sequence
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
@@ -29,10 +29,27 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+class PrismeConnection(sqlite3.Connection):
+    """SQLite connection that collects callbacks to run once its transaction commits."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.after_commit_callbacks: list[Callable[[], None]] = []
+
+
+def on_commit(conn: sqlite3.Connection, callback: Callable[[], None]) -> None:
+    """Run callback after the surrounding get_db() transaction commits (discarded on rollback)."""
+    callbacks = getattr(conn, "after_commit_callbacks", None)
+    if callbacks is None:
+        callback()
+        return
+    callbacks.append(callback)
+
+
 def get_db_connection() -> sqlite3.Connection:
     """Create a new SQLite database connection with row dict support."""
     db_path = _extract_sqlite_path(settings.DATABASE_URL)
-    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn = sqlite3.connect(db_path, check_same_thread=False, factory=PrismeConnection)
     # Enable foreign keys for SQLite
     conn.execute("PRAGMA foreign_keys = ON")
     # Return rows as dictionaries
@@ -40,6 +57,15 @@ def get_db_connection() -> sqlite3.Connection:
     return conn
 
 
+def enable_wal() -> None:
+    """Switch the database to WAL journaling (persistent), so long readers never block writers."""
+    conn = sqlite3.connect(_extract_sqlite_path(settings.DATABASE_URL))
+    try:
+        conn.execute("PRAGMA journal_mode = WAL")
+    finally:
+        conn.close()
+
+
 @contextmanager
 def get_db() -> Generator[sqlite3.Connection, None, None]:
     """Yield a transaction-scoped database connection."""
@@ -48,11 +74,16 @@ def get_db() -> Generator[sqlite3.Connection, None, None]:
         yield conn
         conn.commit()
     except Exception:
+        conn.after_commit_callbacks.clear()
         conn.rollback()
         raise
     finally:
         conn.close()
 
+    callbacks, conn.after_commit_callbacks = conn.after_commit_callbacks, []
+    for callback in callbacks:
+        callback()
+
 
 def dict_from_row(row: sqlite3.Row) -> dict | None:
     """Convert a sqlite row to a dictionary."""
@@ -62,3 +93,13 @@ def dict_from_row(row: sqlite3.Row) -> dict | None:
 def list_from_rows(rows: Sequence[sqlite3.Row]) -> list[dict]:
     """Convert a list of sqlite rows to dictionaries."""
     return [dict(row) for row in rows]
+
+
+def select_columns(columns: Sequence[str] | None) -> str:
+    """Build a SELECT column list; None selects every column.
+
+    Column names must come from a validated allow-list (e.g. response model fields).
+    """
+    if not columns:
+        return "*"
+    return ", ".join(f'"{column}"' for column in columns)
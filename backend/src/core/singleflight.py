@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class _InFlightCall:
+    """Shared state for one running call and the callers waiting on it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one shared execution.
+
+    The first caller for a key starts the work; callers arriving while it is
+    still running wait on the same task and receive the same result (or the
+    same exception). A waiter that is cancelled only detaches itself; the
+    shared work keeps running for the remaining waiters.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: dict[Hashable, _InFlightCall] = {}
+        self._metrics = {
+            "requests": 0,
+            "executions": 0,
+            "coalesced": 0,
+            "failures": 0,
+            "cancelled_waiters": 0,
+            "abandoned": 0,
+        }
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``func()`` once per key, sharing the result with concurrent callers."""
+        self._metrics["requests"] += 1
+        call = self._calls.get(key)
+        if call is None:
+            call = _InFlightCall(asyncio.ensure_future(func()))
+            self._calls[key] = call
+            self._metrics["executions"] += 1
+            call.task.add_done_callback(lambda task, key=key, call=call: self._finish(key, call, task))
+        else:
+            self._metrics["coalesced"] += 1
+
+        call.waiters += 1
+        try:
+            # Shield the shared task so a cancelled waiter does not cancel it for everyone else.
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if not call.task.cancelled():
+                self._metrics["cancelled_waiters"] += 1
+            raise
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Thread-backed work cannot be interrupted; keep the entry so late
+                # callers can still join the running execution.
+                self._metrics["abandoned"] += 1
+
+    def _finish(self, key: Hashable, call: _InFlightCall, task: asyncio.Future) -> None:
+        """Drop a completed call and record its outcome."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            self._metrics["failures"] += 1
+            if call.waiters == 0:
+                logger.warning("Abandoned %s call failed: %s", self.name, exc)
+
+    def metrics(self) -> dict:
+        """Return counters describing coalescing effectiveness."""
+        return {
+            "name": self.name,
+            **self._metrics,
+            "in_flight": len(self._calls),
+        }
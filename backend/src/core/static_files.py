@@ -0,0 +1,138 @@
+"""Indexed static serving for the SPA build.
+
+The build directory is scanned once when the app is created. Lookups are dict
+hits, client-side routes fall back to ``index.html`` without a failed filesystem
+lookup, small files (and their precompressed siblings) are answered from memory,
+and hashed Vite assets are marked immutable.
+"""
+
+import hashlib
+import mimetypes
+import os
+import re
+from dataclasses import dataclass, field
+from email.utils import formatdate
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from .compression import ENCODING_SUFFIXES, negotiate_encoding
+
+INDEX_FILE = "index.html"
+
+# Files up to this size are kept in memory (the index page and most chunks).
+MEMORY_LIMIT_BYTES = 256 * 1024
+
+# Vite emits content-hashed names such as assets/index-B3x9Qk2a.js.
+HASHED_ASSET_RE = re.compile(r"(?:^|/)assets/.+[-.][A-Za-z0-9_-]{8,}\.[a-z0-9]+$")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+@dataclass(frozen=True)
+class StaticVariant:
+    """One stored representation of a file (identity or a precompressed sibling)."""
+
+    path: str
+    stat_result: os.stat_result
+    etag: str
+    content: bytes | None = None
+
+
+@dataclass(frozen=True)
+class StaticEntry:
+    """Indexed static file with its response headers and available encodings."""
+
+    media_type: str
+    cache_control: str
+    identity: StaticVariant
+    encoded: dict[str, StaticVariant] = field(default_factory=dict)
+
+
+def _load_variant(path: Path) -> StaticVariant:
+    stat_result = path.stat()
+    etag_base = f"{stat_result.st_mtime}-{stat_result.st_size}"
+    etag = f'"{hashlib.md5(etag_base.encode(), usedforsecurity=False).hexdigest()}"'
+    content = path.read_bytes() if stat_result.st_size <= MEMORY_LIMIT_BYTES else None
+    return StaticVariant(path=str(path), stat_result=stat_result, etag=etag, content=content)
+
+
+def build_static_index(directory: Path) -> dict[str, StaticEntry]:
+    """Index every file below ``directory`` by its URL path (relative, posix separators)."""
+    sibling_suffixes = set(ENCODING_SUFFIXES.values())
+    index: dict[str, StaticEntry] = {}
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file() or path.suffix in sibling_suffixes:
+            continue
+        url_path = path.relative_to(directory).as_posix()
+        encoded = {}
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            sibling = path.with_name(path.name + suffix)
+            if sibling.is_file():
+                encoded[encoding] = _load_variant(sibling)
+        index[url_path] = StaticEntry(
+            media_type=mimetypes.guess_type(path.name)[0] or "text/plain",
+            cache_control=IMMUTABLE_CACHE_CONTROL if HASHED_ASSET_RE.search(url_path) else REVALIDATE_CACHE_CONTROL,
+            identity=_load_variant(path),
+            encoded=encoded,
+        )
+    return index
+
+
+class SPAStaticFiles(StaticFiles):
+    """Serve the frontend build from an in-memory index with SPA history fallback."""
+
+    def __init__(self, *, directory: str, **kwargs):
+        super().__init__(directory=directory, **kwargs)
+        self.index = build_static_index(Path(directory))
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405, headers={"Allow": "GET, HEAD"})
+
+        url_path = "" if path == "." else path.replace(os.sep, "/")
+        # Never rewrite API requests to index.html; keep proper 404 behavior.
+        if url_path == "api" or url_path.startswith("api/"):
+            raise HTTPException(status_code=404)
+
+        entry = self.index.get(url_path) or self.index.get(f"{url_path}/{INDEX_FILE}".lstrip("/"))
+        if entry is None:
+            # Missing asset files (with an extension) stay 404s.
+            if "." in url_path.rsplit("/", 1)[-1]:
+                raise HTTPException(status_code=404)
+            # SPA history fallback for client-side routes (e.g. /admin/dashboard).
+            entry = self.index.get(INDEX_FILE)
+            if entry is None:
+                raise HTTPException(status_code=404)
+
+        return self.entry_response(entry, Headers(scope=scope))
+
+    def entry_response(self, entry: StaticEntry, request_headers: Headers) -> Response:
+        """Build the response for an indexed file, preferring an accepted precompressed variant."""
+        headers = {"Cache-Control": entry.cache_control}
+        variant = entry.identity
+        if entry.encoded:
+            headers["Vary"] = "Accept-Encoding"
+            encoding = negotiate_encoding(request_headers.get("accept-encoding", ""), entry.encoded)
+            if encoding:
+                variant = entry.encoded[encoding]
+                headers["Content-Encoding"] = encoding
+
+        headers["ETag"] = variant.etag
+        headers["Last-Modified"] = formatdate(variant.stat_result.st_mtime, usegmt=True)
+        if self.is_not_modified(Headers(headers=headers), request_headers):
+            return Response(status_code=304, headers=headers)
+
+        if variant.content is not None:
+            return Response(variant.content, media_type=entry.media_type, headers=headers)
+        return FileResponse(
+            variant.path,
+            stat_result=variant.stat_result,
+            media_type=entry.media_type,
+            headers=headers,
+        )
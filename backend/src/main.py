@@ -1,25 +1,46 @@
-import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from starlette.exceptions import HTTPException as StarletteHTTPException
-from starlette.responses import Response
 
+from .core.compression import CompressionMiddleware
 from .core.config import settings
-from .api.routes import auth, consultants, blocks, links, profiles
+from .core.database import enable_wal, get_db
+from .core.static_files import SPAStaticFiles
+from .api.routes import auth, consultants, blocks, exports, imports, links, profiles, search, staffing, stats
+from .services.matching_service import match_index
+from .services.pdf_font_service import get_pdf_font_family
+from .services.read_model import consultant_read_model
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 STATIC_DIR = BASE_DIR / "static"
 
 # Note: Database tables are created via Alembic migrations
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Warm process-wide caches before serving requests."""
+    # Parse configured PDF fonts once per process instead of on the first export.
+    get_pdf_font_family()
+    # Exports hold a read transaction for the whole stream; in WAL mode writers are not blocked by it.
+    enable_wal()
+    # Build the consultant match index now rather than on the first match request.
+    with get_db() as conn:
+        match_index.load(conn)
+    if settings.READ_MODEL_ENABLED:
+        with get_db() as conn:
+            consultant_read_model.load(conn)
+    yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Prismé API",
     description="Consulting Profile Management API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -29,14 +50,23 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Sync-Cursor"],
 )
 
+# br/gzip for API responses; the static build is served from precompressed siblings instead.
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE, path_prefix="/api")
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(consultants.router, prefix="/api/v1")
 app.include_router(blocks.router, prefix="/api/v1")
 app.include_router(links.router, prefix="/api/v1")
 app.include_router(profiles.router, prefix="/api/v1")
+app.include_router(stats.router, prefix="/api/v1")
+app.include_router(imports.router, prefix="/api/v1")
+app.include_router(exports.router, prefix="/api/v1")
+app.include_router(staffing.router, prefix="/api/v1")
+app.include_router(search.router, prefix="/api/v1")
 
 @app.get("/api/health")
 async def health_check():
@@ -44,26 +74,6 @@ async def health_check():
     return {"status": "healthy", "service": "prisme-api"}
 
 
-class SPAStaticFiles(StaticFiles):
-    async def get_response(self, path: str, scope) -> Response:
-        # Never rewrite API requests to index.html; keep proper 404 behavior.
-        if path == "api" or path.startswith("api/"):
-            return await super().get_response(path, scope)
-
-        try:
-            return await super().get_response(path, scope)
-        except StarletteHTTPException as exc:
-            if exc.status_code != 404:
-                raise
-
-            # If request is for an asset file (has extension), keep the 404.
-            if "." in os.path.basename(path):
-                raise
-
-            # SPA history fallback for client-side routes (e.g. /admin/dashboard).
-            return await super().get_response("index.html", scope)
-
-
 # Mount static files (frontend build) in production
 if STATIC_DIR.exists():
     app.mount("/", SPAStaticFiles(directory=str(STATIC_DIR), html=True), name="static")
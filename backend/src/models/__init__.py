@@ -2,6 +2,6 @@ from .admin import Admin
 from .consultant import Consultant
 from .block import Block
 from .access_link import AccessLink
-from .profile import Profile
+from .profile import Profile, ProfileSnapshot
 
-__all__ = ["Admin", "Consultant", "Block", "AccessLink", "Profile"]
+__all__ = ["Admin", "Consultant", "Block", "AccessLink", "Profile", "ProfileSnapshot"]
@@ -22,7 +22,8 @@ class Profile(Base):
 
     # Snapshot of selected blocks (JSON)
     selected_block_ids: Mapped[str] = mapped_column(Text)  # JSON array
-    profile_data: Mapped[str] = mapped_column(Text)  # Complete JSON snapshot
+    snapshot_hash: Mapped[str] = mapped_column(String(64))  # Complete JSON snapshot, in profile_snapshots
+    generated_at: Mapped[str | None] = mapped_column(String(40), nullable=True)  # Snapshot generation time
 
     created_by_admin_id: Mapped[int] = mapped_column(Integer, ForeignKey("admins.id"))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -33,3 +34,13 @@ class Profile(Base):
     # Relationships
     consultant: Mapped["Consultant"] = relationship("Consultant", back_populates="profiles")
     created_by: Mapped["Admin"] = relationship("Admin")
+
+
+class ProfileSnapshot(Base):
+    """Content-addressed profile snapshot shared by every profile with identical content"""
+
+    __tablename__ = "profile_snapshots"
+
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)  # SHA-256 of data
+    data: Mapped[str] = mapped_column(Text)  # JSON snapshot, generated_at left null (kept on the profile)
+    refcount: Mapped[int] = mapped_column(Integer, default=0)  # Profiles referencing it (trigger-maintained)
@@ -1,8 +1,19 @@
 from .admin import AdminCreate, AdminUpdate, AdminResponse, Token
 from .consultant import ConsultantCreate, ConsultantUpdate, ConsultantResponse
-from .block import BlockCreate, BlockUpdate, BlockResponse
+from .block import BlockCreate, BlockBulkCreate, BlockUpdate, BlockResponse
 from .access_link import AccessLinkCreate, AccessLinkResponse
-from .profile import ProfileCreate, ProfileUpdate, ProfileResponse
+from .profile import (
+    BlockSuggestionRequest,
+    BlockSuggestionResponse,
+    ProfileCreate,
+    ProfileUpdate,
+    ProfileResponse,
+    ProfileSummaryResponse,
+)
+from .stats import DashboardStatsResponse, SkillAnalyticsResponse
+from .imports import ImportReportResponse
+from .staffing import ConsultantMatchResponse, MatchRequest, StaffingMatchResponse
+from .search import SearchResponse
 
 __all__ = [
     "AdminCreate",
@@ -13,6 +24,7 @@ __all__ = [
     "ConsultantUpdate",
     "ConsultantResponse",
     "BlockCreate",
+    "BlockBulkCreate",
     "BlockUpdate",
     "BlockResponse",
     "AccessLinkCreate",
@@ -20,4 +32,14 @@ __all__ = [
     "ProfileCreate",
     "ProfileUpdate",
     "ProfileResponse",
+    "ProfileSummaryResponse",
+    "BlockSuggestionRequest",
+    "BlockSuggestionResponse",
+    "DashboardStatsResponse",
+    "SkillAnalyticsResponse",
+    "ImportReportResponse",
+    "StaffingMatchResponse",
+    "MatchRequest",
+    "ConsultantMatchResponse",
+    "SearchResponse",
 ]
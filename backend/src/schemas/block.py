@@ -1,6 +1,9 @@
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 from datetime import datetime, date
-from typing import Literal
+from typing import Annotated, Literal
+
+# Block order keys are sparse (spaced apart so a move rewrites one row), hence the wide range.
+MAX_BLOCK_ORDER = 1_000_000_000
 
 
 class BlockBase(BaseModel):
@@ -8,7 +11,7 @@ class BlockBase(BaseModel):
 
     title: str = Field(min_length=1, max_length=200)
     block_type: Literal["project", "skill", "certification", "misc"]
-    order: int = Field(default=0, ge=0, le=10000)
+    order: int = Field(default=0, ge=0, le=MAX_BLOCK_ORDER)
 
 
 class ProjectBlockCreate(BlockBase):
@@ -50,15 +53,29 @@ class MiscBlockCreate(BlockBase):
     misc_content: str | None = Field(default=None, max_length=5000)
 
 
-# Union type for creating any block
-BlockCreate = ProjectBlockCreate | SkillBlockCreate | CertificationBlockCreate | MiscBlockCreate
+# Union type for creating any block; block_type selects the member schema directly
+BlockCreate = Annotated[
+    ProjectBlockCreate | SkillBlockCreate | CertificationBlockCreate | MiscBlockCreate,
+    Field(discriminator="block_type"),
+]
+
+# Compiled once for validating block payloads outside request bodies
+block_create_adapter = TypeAdapter(BlockCreate)
+
+MAX_BULK_BLOCKS = 500
+
+
+class BlockBulkCreate(BaseModel):
+    """Schema for creating several blocks at once"""
+
+    blocks: list[BlockCreate] = Field(min_length=1, max_length=MAX_BULK_BLOCKS)
 
 
 class BlockUpdate(BaseModel):
     """Schema for updating a block"""
 
     title: str | None = Field(default=None, min_length=1, max_length=200)
-    order: int | None = Field(default=None, ge=0, le=10000)
+    order: int | None = Field(default=None, ge=0, le=MAX_BLOCK_ORDER)
     # Type-specific fields
     client_name: str | None = Field(default=None, max_length=200)
     project_description: str | None = Field(default=None, max_length=5000)
@@ -110,7 +127,72 @@ class BlockResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BlockBatchCreate(BaseModel):
+    """Batch operation creating a block"""
+
+    op: Literal["create"]
+    block: BlockCreate
+
+
+class BlockBatchUpdate(BaseModel):
+    """Batch operation updating a block"""
+
+    op: Literal["update"]
+    id: int
+    block: BlockUpdate
+
+
+class BlockBatchDelete(BaseModel):
+    """Batch operation deleting a block"""
+
+    op: Literal["delete"]
+    id: int
+
+
+BlockBatchOperation = Annotated[
+    BlockBatchCreate | BlockBatchUpdate | BlockBatchDelete,
+    Field(discriminator="op"),
+]
+
+
+class BlockBatchRequest(BaseModel):
+    """Schema for applying mixed block operations in one transaction"""
+
+    operations: list[BlockBatchOperation] = Field(min_length=1, max_length=MAX_BULK_BLOCKS)
+
+
+class BlockBatchResult(BaseModel):
+    """Outcome of one batch operation, in request order"""
+
+    index: int
+    op: Literal["create", "update", "delete"]
+    id: int
+    status: Literal["created", "updated", "deleted", "not_found"]
+    block: BlockResponse | None = None
+
+
+class BlockBatchResponse(BaseModel):
+    """Schema for batch results"""
+
+    results: list[BlockBatchResult]
+
+
+class BlockMove(BaseModel):
+    """Place a block directly after another one (first when after_id is null)"""
+
+    id: int
+    after_id: int | None = None
+
+
 class BlockReorderRequest(BaseModel):
-    """Schema for reordering blocks"""
+    """Schema for reordering blocks: explicit orders for a full list, or moves applied in sequence"""
+
+    block_orders: list[dict[str, int]] | None = None  # [{"id": 1, "order": 0}, ...]
+    moves: list[BlockMove] | None = Field(default=None, min_length=1, max_length=MAX_BULK_BLOCKS)
 
-    block_orders: list[dict[str, int]] = Field(min_length=1)  # [{"id": 1, "order": 0}, ...]
+    @model_validator(mode="after")
+    def require_one_mode(self) -> "BlockReorderRequest":
+        """Accept either block_orders or moves, not both."""
+        if (self.block_orders is None) == (self.moves is None):
+            raise ValueError("Provide either block_orders or moves.")
+        return self
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class ImportRowError(BaseModel):
+    """A rejected import record and why it was rejected"""
+
+    line: int
+    message: str
+
+
+class ImportReportResponse(BaseModel):
+    """Schema for the outcome of a bulk import"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    records: int
+    consultants_created: int
+    blocks_created: int
+    error_count: int
+    errors: list[ImportRowError]
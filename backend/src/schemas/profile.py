@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from typing import Any
 
@@ -62,16 +63,67 @@ class ProfileUpdate(ProfileContentBase):
     """Schema for updating a profile."""
 
 
-class ProfileResponse(BaseModel):
-    """Schema for profile responses."""
+class ProfileSummaryResponse(BaseModel):
+    """Schema for profile list entries without snapshot payloads."""
 
     id: int
     consultant_id: int
     profile_name: str
-    selected_block_ids: str
-    profile_data: str
     created_by_admin_id: int
     created_at: datetime | str
     updated_at: datetime | str
+    block_count: int = 0
+    block_type_counts: dict[str, int] = Field(default_factory=dict)
 
     model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("block_type_counts", mode="before")
+    @classmethod
+    def parse_block_type_counts(cls, value: Any) -> Any:
+        """Accept the JSON text stored in the profiles table."""
+        if isinstance(value, str):
+            return json.loads(value) if value else {}
+        return value
+
+
+class ProfileResponse(ProfileSummaryResponse):
+    """Schema for profile responses."""
+
+    selected_block_ids: str
+    snapshot_hash: str
+    profile_data: str
+
+
+class BlockSuggestionRequest(BaseModel):
+    """Schema for requesting a block selection tailored to target skills."""
+
+    consultant_id: int
+    skills: list[str] = Field(min_length=1, max_length=50)
+    max_pages: int = Field(default=2, ge=1, le=20)
+    include_unmatched: bool = False
+    model_config = ConfigDict(extra="forbid")
+
+
+class SuggestedBlock(BaseModel):
+    """One ranked block of a suggestion; ``estimated_height`` is in PDF points."""
+
+    id: int
+    block_type: str
+    title: str
+    score: float
+    relevance: float
+    recency: float
+    matched_skills: list[str]
+    estimated_height: float
+    selected: bool
+
+
+class BlockSuggestionResponse(BaseModel):
+    """Schema for a block suggestion; ``selected_block_ids`` feeds straight into ProfileCreate."""
+
+    consultant_id: int
+    skills: list[str]
+    max_pages: int
+    estimated_pages: float
+    selected_block_ids: list[int]
+    blocks: list[SuggestedBlock]
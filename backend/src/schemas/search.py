@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+
+
+class ConsultantSearchHit(BaseModel):
+    """A consultant matching a search, with a highlighted snippet"""
+
+    id: int
+    first_name: str
+    last_name: str
+    title: str
+    snippet: str
+    score: float
+
+
+class BlockSearchHit(BaseModel):
+    """A block matching a search, with a highlighted snippet"""
+
+    id: int
+    consultant_id: int
+    block_type: str
+    title: str
+    snippet: str
+    score: float
+
+
+class SearchResponse(BaseModel):
+    """Search results per kind, best match first"""
+
+    consultants: list[ConsultantSearchHit]
+    blocks: list[BlockSearchHit]
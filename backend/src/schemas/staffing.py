@@ -0,0 +1,65 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class TermMatch(BaseModel):
+    """A block that matched a requested term"""
+
+    term: str
+    kind: Literal["technology", "skill"]
+    block_id: int
+    block_type: str
+    title: str
+    proficiency_level: str | None = None
+
+
+class StaffingMatchResponse(BaseModel):
+    """A consultant holding every requested term, with the blocks that matched"""
+
+    id: int
+    first_name: str
+    last_name: str
+    email: str
+    title: str
+    matches: list[TermMatch]
+
+
+class MatchRequirement(BaseModel):
+    """A skill or technology a staffing request asks for"""
+
+    term: str = Field(min_length=1, max_length=100)
+    weight: float = Field(default=1.0, gt=0, le=100)
+    required: bool = False
+    min_level: str | None = None
+
+
+class MatchRequest(BaseModel):
+    """Schema for ranking consultants against a staffing request"""
+
+    requirements: list[MatchRequirement] = Field(min_length=1, max_length=50)
+    limit: int = Field(default=20, ge=1, le=500)
+
+
+class TermScore(BaseModel):
+    """How well a consultant covers one requested term"""
+
+    term: str
+    weight: float
+    required: bool
+    score: float
+    skill_level: str | None = None
+    project_months: int
+    last_used: str | None = None
+
+
+class ConsultantMatchResponse(BaseModel):
+    """A ranked consultant with the per-term breakdown of the score"""
+
+    id: int
+    first_name: str
+    last_name: str
+    email: str
+    title: str
+    score: float
+    terms: list[TermScore]
@@ -0,0 +1,55 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class WeeklyCount(BaseModel):
+    """Number of profiles created in the week starting on ``week_start`` (Monday)."""
+
+    week_start: date
+    count: int
+
+
+class DashboardStatsResponse(BaseModel):
+    """Schema for dashboard statistics"""
+
+    consultants: int
+    profiles: int
+    blocks: int
+    access_links: int
+    active_access_links: int
+    blocks_by_type: dict[str, int]
+    profiles_per_week: list[WeeklyCount]
+
+
+class SkillStats(BaseModel):
+    """Consultants holding a skill, in total and per display level."""
+
+    term: str
+    consultants: int
+    levels: dict[str, int]
+
+
+class TechnologyYearCount(BaseModel):
+    """Projects started in ``year`` that used a technology."""
+
+    year: int
+    projects: int
+
+
+class TechnologyStats(BaseModel):
+    """Projects using a technology, in total and by start year."""
+
+    term: str
+    projects: int
+    undated_projects: int
+    by_year: list[TechnologyYearCount]
+
+
+class SkillAnalyticsResponse(BaseModel):
+    """Schema for the team skill heatmap and technology usage over time"""
+
+    consultants: int
+    levels: list[str]
+    skills: list[SkillStats]
+    technologies: list[TechnologyStats]
@@ -0,0 +1,91 @@
+"""Team skill analytics from incrementally maintained aggregates.
+
+Triggers on ``block_terms`` (see the skill_analytics migration) keep four
+small tables current as postings come and go with block writes:
+
+    skill_counts            consultants holding each skill
+    skill_level_counts      consultants per skill and display level
+    technology_counts       projects using each technology
+    technology_year_counts  projects per technology and start year (0 when undated)
+
+Skill counts are distinct consultants: a posting only moves them when it is
+the consultant's first (or last) one for the skill and level. Only whole skill
+titles are counted, not the parts split off them for search. Rows that drop
+to zero are deleted, so the tables stay as large as the vocabulary and reads
+cost the same however many consultants and blocks there are. ``rebuild``
+recomputes the tables from the postings to repair drift.
+"""
+
+import json
+import sqlite3
+
+from .block_types import SKILL_DISPLAY_LEVELS
+
+AGGREGATE_TABLES = ("skill_counts", "skill_level_counts", "technology_counts", "technology_year_counts")
+
+# Recompute every aggregate from the postings (run in this order, after clearing the tables).
+REBUILD_QUERIES = (
+    """INSERT INTO skill_counts (term, consultants)
+       SELECT term, COUNT(DISTINCT consultant_id) FROM block_terms
+       WHERE kind = 'skill' AND NOT is_title_part GROUP BY term""",
+    """INSERT INTO skill_level_counts (term, level, consultants)
+       SELECT term, label, COUNT(DISTINCT consultant_id) FROM block_terms
+       WHERE kind = 'skill' AND NOT is_title_part GROUP BY term, label""",
+    """INSERT INTO technology_counts (term, projects)
+       SELECT term, COUNT(*) FROM block_terms WHERE kind = 'technology' GROUP BY term""",
+    """INSERT INTO technology_year_counts (term, year, projects)
+       SELECT term, COALESCE(year, 0), COUNT(*) FROM block_terms WHERE kind = 'technology' GROUP BY 1, 2""",
+)
+
+
+def rebuild(conn: sqlite3.Connection) -> None:
+    """Recompute the aggregate tables from the current postings in the caller's transaction."""
+    for table in AGGREGATE_TABLES:
+        conn.execute(f"DELETE FROM {table}")
+    for query in REBUILD_QUERIES:
+        conn.execute(query)
+
+
+async def get_skill_analytics(conn: sqlite3.Connection, limit: int = 50) -> dict:
+    """Most widely held skills with their level breakdown and most used technologies by year."""
+    consultants = conn.execute("SELECT value FROM stats_counters WHERE name = 'consultants'").fetchone()
+
+    skills = [
+        {"term": row["term"], "consultants": row["consultants"], "levels": dict.fromkeys(SKILL_DISPLAY_LEVELS, 0)}
+        for row in conn.execute(
+            "SELECT term, consultants FROM skill_counts ORDER BY consultants DESC, term LIMIT ?", (limit,)
+        ).fetchall()
+    ]
+    skills_by_term = {skill["term"]: skill for skill in skills}
+    cursor = conn.execute(
+        "SELECT term, level, consultants FROM skill_level_counts WHERE term IN (SELECT value FROM json_each(?))",
+        (json.dumps(list(skills_by_term)),),
+    )
+    for row in cursor.fetchall():
+        skills_by_term[row["term"]]["levels"][row["level"]] = row["consultants"]
+
+    technologies = [
+        {"term": row["term"], "projects": row["projects"], "undated_projects": 0, "by_year": []}
+        for row in conn.execute(
+            "SELECT term, projects FROM technology_counts ORDER BY projects DESC, term LIMIT ?", (limit,)
+        ).fetchall()
+    ]
+    technologies_by_term = {technology["term"]: technology for technology in technologies}
+    cursor = conn.execute(
+        """SELECT term, year, projects FROM technology_year_counts
+           WHERE term IN (SELECT value FROM json_each(?)) ORDER BY term, year""",
+        (json.dumps(list(technologies_by_term)),),
+    )
+    for row in cursor.fetchall():
+        technology = technologies_by_term[row["term"]]
+        if row["year"]:
+            technology["by_year"].append({"year": row["year"], "projects": row["projects"]})
+        else:
+            technology["undated_projects"] = row["projects"]
+
+    return {
+        "consultants": consultants["value"] if consultants else 0,
+        "levels": list(SKILL_DISPLAY_LEVELS),
+        "skills": skills,
+        "technologies": technologies,
+    }
@@ -1,7 +1,16 @@
 import sqlite3
 import json
-from ..schemas.block import BlockCreate, BlockUpdate
-from ..core.database import dict_from_row, list_from_rows
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Sequence
+
+from ..schemas.block import MAX_BLOCK_ORDER, BlockBatchOperation, BlockCreate, BlockMove, BlockUpdate
+from ..core.database import dict_from_row, list_from_rows, select_columns
+from . import read_model, term_index
+from .block_types import BLOCK_TYPES, COMMON_EDITABLE_COLUMNS
+
+# Deleted blocks stay as inactive rows so delta syncs can report them.
+SOFT_DELETE_BLOCK = "UPDATE blocks SET is_active = 0, updated_at = CURRENT_TIMESTAMP WHERE id = ? AND is_active = 1"
 
 
 def _normalize_technologies_value(value: list[str] | str | None) -> str | None:
@@ -32,9 +41,11 @@ def _normalize_technologies_value(value: list[str] | str | None) -> str | None:
     return None
 
 
-async def create_block(conn: sqlite3.Connection, consultant_id: int, block_data: BlockCreate) -> dict:
-    """Create a new content block."""
+def _block_insert(consultant_id: int, block_data: BlockCreate, order: int | None = None) -> tuple[str, list]:
+    """Build the INSERT statement and values for a validated block (``order`` overrides the schema default)."""
     data = block_data.model_dump()
+    if order is not None:
+        data["order"] = order
     if "technologies" in data:
         data["technologies"] = _normalize_technologies_value(data["technologies"])
 
@@ -43,39 +54,89 @@ async def create_block(conn: sqlite3.Connection, consultant_id: int, block_data:
     placeholders = ", ".join(["?"] * len(columns))
     column_names = ", ".join([f'"{col}"' for col in columns])
     values = [consultant_id] + list(data.values())
+    return f"INSERT INTO blocks ({column_names}) VALUES ({placeholders})", values
+
+
+def _new_block_orders(
+    conn: sqlite3.Connection, consultant_id: int, blocks_data: Sequence[BlockCreate]
+) -> list[int | None]:
+    """Order keys for new blocks: None where the client chose one, else sparse keys before the first block.
+
+    Blocks without an order keep their input order, spread evenly below the consultant's
+    first key, so a later move to the top still finds a gap instead of rebalancing.
+    """
+    orders: list[int | None] = [None] * len(blocks_data)
+    unordered = [index for index, block_data in enumerate(blocks_data) if "order" not in block_data.model_fields_set]
+    if not unordered:
+        return orders
+    first = conn.execute(
+        'SELECT MIN("order") FROM blocks WHERE consultant_id = ? AND is_active = 1', (consultant_id,)
+    ).fetchone()[0]
+    slots = len(unordered) + 1
+    if first is None:
+        first = min(slots * ORDER_STEP, MAX_BLOCK_ORDER)
+    for position, index in enumerate(unordered, start=1):
+        orders[index] = first * position // slots
+    return orders
 
-    cursor = conn.execute(
-        f"INSERT INTO blocks ({column_names}) VALUES ({placeholders})",
-        values
-    )
+
+async def create_block(conn: sqlite3.Connection, consultant_id: int, block_data: BlockCreate) -> dict:
+    """Create a new content block."""
+    [order] = _new_block_orders(conn, consultant_id, [block_data])
+    query, values = _block_insert(consultant_id, block_data, order)
+    cursor = conn.execute(query, values)
     block_id = cursor.lastrowid
 
     # Fetch the created block
     cursor = conn.execute("SELECT * FROM blocks WHERE id = ?", (block_id,))
-    return dict_from_row(cursor.fetchone())
+    block = dict_from_row(cursor.fetchone())
+    term_index.index_blocks(conn, [block])
+    read_model.record_block(conn, block)
+    return block
+
+
+async def create_blocks(
+    conn: sqlite3.Connection, consultant_id: int, blocks_data: Sequence[BlockCreate]
+) -> list[dict]:
+    """Create several content blocks in the caller's transaction, returning them in input order."""
+    blocks = []
+    orders = _new_block_orders(conn, consultant_id, blocks_data)
+    for block_data, order in zip(blocks_data, orders):
+        query, values = _block_insert(consultant_id, block_data, order)
+        cursor = conn.execute(f"{query} RETURNING *", values)
+        block = dict_from_row(cursor.fetchone())
+        read_model.record_block(conn, block)
+        blocks.append(block)
+    term_index.index_blocks(conn, blocks)
+    return blocks
 
 
 async def get_block(conn: sqlite3.Connection, block_id: int) -> dict | None:
-    """Get a block by id."""
-    cursor = conn.execute("SELECT * FROM blocks WHERE id = ?", (block_id,))
+    """Get an active (not deleted) block by id."""
+    cursor = conn.execute("SELECT * FROM blocks WHERE id = ? AND is_active = 1", (block_id,))
     row = cursor.fetchone()
     return dict_from_row(row)
 
 
 async def get_consultant_blocks(
-    conn: sqlite3.Connection, consultant_id: int, block_type: str | None = None
+    conn: sqlite3.Connection,
+    consultant_id: int,
+    block_type: str | None = None,
+    columns: Sequence[str] | None = None,
 ) -> list[dict]:
-    """Get all blocks for a consultant, optionally filtered by type"""
+    """Get all blocks for a consultant, optionally filtered by type (selecting only that type's columns)"""
     if block_type:
+        if not columns and block_type in BLOCK_TYPES:
+            columns = BLOCK_TYPES[block_type].select_columns
         cursor = conn.execute(
-            """SELECT * FROM blocks
+            f"""SELECT {select_columns(columns)} FROM blocks
                WHERE consultant_id = ? AND block_type = ? AND is_active = 1
                ORDER BY "order", created_at DESC""",
             (consultant_id, block_type)
         )
     else:
         cursor = conn.execute(
-            """SELECT * FROM blocks
+            f"""SELECT {select_columns(columns)} FROM blocks
                WHERE consultant_id = ? AND is_active = 1
                ORDER BY "order", created_at DESC""",
             (consultant_id,)
@@ -83,6 +144,46 @@ async def get_consultant_blocks(
     return list_from_rows(cursor.fetchall())
 
 
+def sync_cursor_value(since: datetime) -> str:
+    """Format a sync cursor like the stored CURRENT_TIMESTAMP values (UTC, whole seconds)."""
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    return since.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def next_sync_cursor(blocks: Sequence[dict], since: str | None = None) -> str | None:
+    """Return the cursor for the next sync: the latest updated_at served (``since`` when nothing changed).
+
+    Writers are serialized and stamp rows inside their transaction, so later commits never carry
+    an older timestamp; the cursor is inclusive because timestamps only have second precision.
+    """
+    return max((block["updated_at"] for block in blocks if block.get("updated_at")), default=since)
+
+
+async def get_changed_blocks(
+    conn: sqlite3.Connection,
+    consultant_id: int,
+    since: str,
+    block_type: str | None = None,
+    columns: Sequence[str] | None = None,
+) -> list[dict]:
+    """Get a consultant's blocks changed at or after ``since``; deleted ones come back with is_active false."""
+    conditions = "consultant_id = ? AND updated_at >= ?"
+    params: list = [consultant_id, since]
+    if block_type:
+        if not columns and block_type in BLOCK_TYPES:
+            columns = BLOCK_TYPES[block_type].select_columns
+        conditions += " AND block_type = ?"
+        params.append(block_type)
+    cursor = conn.execute(
+        f"""SELECT {select_columns(columns)} FROM blocks
+           WHERE {conditions}
+           ORDER BY updated_at, id""",
+        params,
+    )
+    return list_from_rows(cursor.fetchall())
+
+
 async def get_blocks_by_ids(conn: sqlite3.Connection, block_ids: list[int]) -> list[dict]:
     """Get blocks by list of ids."""
     if not block_ids:
@@ -96,46 +197,32 @@ async def get_blocks_by_ids(conn: sqlite3.Connection, block_ids: list[int]) -> l
     return list_from_rows(cursor.fetchall())
 
 
+def _block_updates(block_type: str, block_data: BlockUpdate) -> dict:
+    """Return the provided fields editable on ``block_type``, normalized for storage."""
+    registered = BLOCK_TYPES.get(block_type)
+    allowed_fields = registered.editable_columns if registered else COMMON_EDITABLE_COLUMNS
+    updates = {
+        key: value for key, value in block_data.model_dump(exclude_unset=True).items() if key in allowed_fields
+    }
+    if "technologies" in updates:
+        updates["technologies"] = _normalize_technologies_value(updates["technologies"])
+    return updates
+
+
 async def update_block(conn: sqlite3.Connection, block_id: int, block_data: BlockUpdate) -> dict | None:
     """Update a content block."""
     # Get current block
-    cursor = conn.execute("SELECT * FROM blocks WHERE id = ?", (block_id,))
+    cursor = conn.execute("SELECT * FROM blocks WHERE id = ? AND is_active = 1", (block_id,))
     block = cursor.fetchone()
 
     if not block:
         return None
 
     # Build update query dynamically for only provided fields
-    updates = block_data.model_dump(exclude_unset=True)
-    if not updates:
-        return dict_from_row(block)
-
-    allowed_fields = {
-        "title",
-        "order",
-        "client_name",
-        "project_description",
-        "role",
-        "technologies",
-        "start_date",
-        "end_date",
-        "is_ongoing",
-        "duration_months",
-        "proficiency_level",
-        "misc_content",
-        "issuing_organization",
-        "issue_date",
-        "expiry_date",
-        "credential_id",
-        "credential_url",
-    }
-    updates = {key: value for key, value in updates.items() if key in allowed_fields}
+    updates = _block_updates(block["block_type"], block_data)
     if not updates:
         return dict_from_row(block)
 
-    if "technologies" in updates:
-        updates["technologies"] = _normalize_technologies_value(updates["technologies"])
-
     set_clause = ", ".join([f'"{key}" = ?' for key in updates.keys()])
     values = list(updates.values()) + [block_id]
 
@@ -146,32 +233,237 @@ async def update_block(conn: sqlite3.Connection, block_id: int, block_data: Bloc
 
     # Fetch updated block
     cursor = conn.execute("SELECT * FROM blocks WHERE id = ?", (block_id,))
-    return dict_from_row(cursor.fetchone())
+    updated_block = dict_from_row(cursor.fetchone())
+    term_index.index_blocks(conn, [updated_block])
+    read_model.record_block(conn, updated_block)
+    return updated_block
 
 
 async def delete_block(conn: sqlite3.Connection, block_id: int) -> bool:
-    """Delete a content block and return whether deletion occurred."""
-    cursor = conn.execute("SELECT id FROM blocks WHERE id = ?", (block_id,))
-    if not cursor.fetchone():
+    """Soft-delete a content block (kept as a sync tombstone) and return whether deletion occurred."""
+    cursor = conn.execute(SOFT_DELETE_BLOCK, (block_id,))
+    if not cursor.rowcount:
         return False
 
-    conn.execute("DELETE FROM blocks WHERE id = ?", (block_id,))
+    term_index.unindex_blocks(conn, [block_id])
+    read_model.record_block_deleted(conn, block_id)
     return True
 
 
+# Sparse order keys: rebalancing spaces blocks ORDER_STEP apart, so a move can take the
+# midpoint between its new neighbours and rewrite a single row.
+ORDER_STEP = 1024
+
+# A move leaving a gap this small schedules a rebalance of the consultant's blocks.
+MIN_ORDER_GAP = 16
+
+# Active blocks of a consultant in display order.
+_DISPLAY_ORDER = 'ORDER BY "order", created_at DESC'
+
+
 async def reorder_blocks(conn: sqlite3.Connection, consultant_id: int, block_orders: list[dict]) -> None:
-    """Update display order of blocks for a consultant."""
+    """Update display order of blocks for a consultant (only rows whose order changes are written)."""
     if not block_orders:
         return
 
     block_ids = [item["id"] for item in block_orders]
     placeholders = ", ".join(["?"] * len(block_ids))
     cursor = conn.execute(
-        f"SELECT id FROM blocks WHERE consultant_id = ? AND id IN ({placeholders})",
+        f'SELECT id, "order" FROM blocks WHERE consultant_id = ? AND is_active = 1 AND id IN ({placeholders})',
         [consultant_id, *block_ids],
     )
-    allowed_ids = {row["id"] for row in cursor.fetchall()}
-    updates = [(item["order"], item["id"]) for item in block_orders if item["id"] in allowed_ids]
+    current = {row["id"]: row["order"] for row in cursor.fetchall()}
+    orders = {
+        item["id"]: item["order"]
+        for item in block_orders
+        if item["id"] in current and current[item["id"]] != item["order"]
+    }
+    _write_block_orders(conn, consultant_id, orders)
+
+
+def _next_order_key(conn: sqlite3.Connection, consultant_id: int, block_id: int, anchor: dict | None) -> int | None:
+    """Order key of the first active block after ``anchor`` (or the first one), skipping ``block_id``.
+
+    Blocks tied with the anchor count as following it, which leaves no gap and forces a rebalance.
+    """
+    if anchor is None:
+        row = conn.execute(
+            f"""SELECT "order" FROM blocks WHERE consultant_id = ? AND is_active = 1 AND id != ?
+                {_DISPLAY_ORDER} LIMIT 1""",
+            (consultant_id, block_id),
+        ).fetchone()
+    else:
+        row = conn.execute(
+            f"""SELECT "order" FROM blocks
+                WHERE consultant_id = ? AND is_active = 1 AND id NOT IN (?, ?)
+                  AND ("order" > ? OR ("order" = ? AND created_at <= ?))
+                {_DISPLAY_ORDER} LIMIT 1""",
+            (consultant_id, block_id, anchor["id"], anchor["order"], anchor["order"], anchor["created_at"]),
+        ).fetchone()
+    return row["order"] if row else None
+
+
+def _order_key_between(lower: int | None, upper: int | None) -> int | None:
+    """Pick a key strictly between two neighbouring keys, or None when they leave no room."""
+    if upper is None:
+        key = (lower if lower is not None else 0) + ORDER_STEP
+        return key if key <= MAX_BLOCK_ORDER else None
+    if lower is None:
+        return upper // 2 if upper > 0 else None
+    return (lower + upper) // 2 if upper - lower >= 2 else None
+
+
+def _rebalanced_orders(conn: sqlite3.Connection, consultant_id: int, move: BlockMove | None = None) -> dict[int, int]:
+    """Respace a consultant's active blocks ORDER_STEP apart (applying ``move`` first); return changed keys."""
+    rows = conn.execute(
+        f'SELECT id, "order" FROM blocks WHERE consultant_id = ? AND is_active = 1 {_DISPLAY_ORDER}',
+        (consultant_id,),
+    ).fetchall()
+    current = {row["id"]: row["order"] for row in rows}
+    block_ids = list(current)
+    if move is not None:
+        block_ids.remove(move.id)
+        block_ids.insert(block_ids.index(move.after_id) + 1 if move.after_id is not None else 0, move.id)
+
+    orders = {block_id: (position + 1) * ORDER_STEP for position, block_id in enumerate(block_ids)}
+    return {block_id: order for block_id, order in orders.items() if current[block_id] != order}
+
+
+def _write_block_orders(conn: sqlite3.Connection, consultant_id: int, orders: dict[int, int]) -> None:
+    """Store new order keys, stamping updated_at so delta syncs pick the moves up."""
+    if not orders:
+        return
+    conn.executemany(
+        'UPDATE blocks SET "order" = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
+        [(order, block_id) for block_id, order in orders.items()],
+    )
+    if read_model.consultant_read_model.enabled:
+        placeholders = ", ".join(["?"] * len(orders))
+        cursor = conn.execute(f'SELECT id, "order", updated_at FROM blocks WHERE id IN ({placeholders})', list(orders))
+        read_model.record_block_orders(conn, consultant_id, {row["id"]: dict(row) for row in cursor.fetchall()})
+
+
+async def move_blocks(conn: sqlite3.Connection, consultant_id: int, moves: Sequence[BlockMove]) -> bool:
+    """Apply moves in sequence, normally rewriting one row each.
+
+    Returns whether a move left a small gap, i.e. whether the consultant's blocks should be
+    rebalanced soon. A move with no gap left rebalances immediately.
+    """
+    needs_rebalance = False
+    for move in moves:
+        if move.id == move.after_id:
+            raise ValueError(f"Block {move.id} cannot be placed after itself.")
+        block_ids = [move.id] if move.after_id is None else [move.id, move.after_id]
+        placeholders = ", ".join(["?"] * len(block_ids))
+        cursor = conn.execute(
+            f"""SELECT id, "order", created_at FROM blocks
+                WHERE consultant_id = ? AND is_active = 1 AND id IN ({placeholders})""",
+            [consultant_id, *block_ids],
+        )
+        found = {row["id"]: dict(row) for row in cursor.fetchall()}
+        missing = [block_id for block_id in block_ids if block_id not in found]
+        if missing:
+            raise ValueError(f"Block {missing[0]} not found.")
+
+        anchor = found.get(move.after_id)
+        lower = anchor["order"] if anchor else None
+        upper = _next_order_key(conn, consultant_id, move.id, anchor)
+        key = _order_key_between(lower, upper)
+        if key is None:
+            _write_block_orders(conn, consultant_id, _rebalanced_orders(conn, consultant_id, move))
+            continue
+
+        if key != found[move.id]["order"]:
+            _write_block_orders(conn, consultant_id, {move.id: key})
+        gaps = [key - (lower if lower is not None else 0)]
+        if upper is not None:
+            gaps.append(upper - key)
+        needs_rebalance = needs_rebalance or min(gaps) < MIN_ORDER_GAP
+    return needs_rebalance
+
+
+async def rebalance_block_orders(conn: sqlite3.Connection, consultant_id: int) -> int:
+    """Respace a consultant's active blocks ORDER_STEP apart; return the number of rows rewritten."""
+    orders = _rebalanced_orders(conn, consultant_id)
+    _write_block_orders(conn, consultant_id, orders)
+    return len(orders)
+
+
+async def apply_block_batch(
+    conn: sqlite3.Connection, consultant_id: int, operations: Sequence[BlockBatchOperation]
+) -> list[dict]:
+    """Apply create, update and delete operations in the caller's transaction.
+
+    Statements of the same shape run through one ``executemany``. Updates and
+    deletes of blocks the consultant does not own are reported as ``not_found``.
+    Results follow request order.
+    """
+    target_ids = [operation.id for operation in operations if operation.op != "create"]
+    duplicates = [block_id for block_id, count in Counter(target_ids).items() if count > 1]
+    if duplicates:
+        raise ValueError(f"Block {min(duplicates)} appears in more than one operation.")
+
+    owned_types: dict[int, str] = {}
+    if target_ids:
+        placeholders = ", ".join(["?"] * len(target_ids))
+        cursor = conn.execute(
+            f"SELECT id, block_type FROM blocks WHERE consultant_id = ? AND is_active = 1 AND id IN ({placeholders})",
+            [consultant_id, *target_ids],
+        )
+        owned_types = {row["id"]: row["block_type"] for row in cursor.fetchall()}
+
+    results: list[dict | None] = [None] * len(operations)
+    deletes: list[int] = []
+    updates_by_shape: dict[tuple[str, ...], list[list]] = {}
+    inserts_by_query: dict[str, list[tuple[int, list]]] = {}
+    creates = [operation.block for operation in operations if operation.op == "create"]
+    create_orders = iter(_new_block_orders(conn, consultant_id, creates))
+    for index, operation in enumerate(operations):
+        if operation.op == "create":
+            query, values = _block_insert(consultant_id, operation.block, next(create_orders))
+            inserts_by_query.setdefault(query, []).append((index, values))
+            continue
+
+        result = {"index": index, "op": operation.op, "id": operation.id}
+        if operation.id not in owned_types:
+            results[index] = {**result, "status": "not_found"}
+        elif operation.op == "delete":
+            deletes.append(operation.id)
+            results[index] = {**result, "status": "deleted"}
+        else:
+            updates = _block_updates(owned_types[operation.id], operation.block)
+            if updates:
+                updates_by_shape.setdefault(tuple(updates), []).append([*updates.values(), operation.id])
+            results[index] = {**result, "status": "updated"}
+
+    if deletes:
+        conn.executemany(SOFT_DELETE_BLOCK, [(block_id,) for block_id in deletes])
+        term_index.unindex_blocks(conn, deletes)
+        for block_id in deletes:
+            read_model.record_block_deleted(conn, block_id)
+
+    for shape, rows in updates_by_shape.items():
+        set_clause = ", ".join([f'"{key}" = ?' for key in shape])
+        conn.executemany(
+            f"UPDATE blocks SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            rows,
+        )
 
-    if updates:
-        conn.executemany('UPDATE blocks SET "order" = ? WHERE id = ?', updates)
+    for query, rows in inserts_by_query.items():
+        conn.executemany(query, [values for _, values in rows])
+        # AUTOINCREMENT ids of one statement's rows are contiguous inside the write transaction.
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        for offset, (index, _) in enumerate(rows):
+            block_id = last_id - len(rows) + 1 + offset
+            results[index] = {"index": index, "op": "create", "id": block_id, "status": "created"}
+
+    changed_ids = [result["id"] for result in results if result["status"] in ("created", "updated")]
+    if changed_ids:
+        blocks = {block["id"]: block for block in await get_blocks_by_ids(conn, changed_ids)}
+        term_index.index_blocks(conn, list(blocks.values()))
+        for result in results:
+            block = blocks.get(result["id"]) if result["status"] in ("created", "updated") else None
+            if block:
+                result["block"] = block
+                read_model.record_block(conn, block)
+    return results
@@ -0,0 +1,193 @@
+"""Suggest which of a consultant's blocks a tailored profile should include.
+
+Given target skills, every active block is scored as
+
+    credit     = 1 for a target among a project's technologies,
+                 0.5 + 0.5 * proficiency rank / 4 for a skill block of the target,
+                 0.5 for a target only mentioned in the block's text
+    relevance  = sum of the credits / number of targets
+    score      = relevance * (0.5 + 0.5 * recency)
+
+with recency as in staffing matches, from a project's end (ongoing projects
+are current) or a certification's issue date. Blocks are then taken in score
+order while the profile still fits the page budget. Pages are estimated from
+the export's own layout: each block is measured with the PDF styles and the
+pages are filled as ReportLab fills them, with cards kept together.
+
+The measured layout and the block terms are cached per consultant, keyed by
+the trigger-maintained write versions of the consultant and of their blocks,
+so trying other targets or budgets only re-scores.
+"""
+
+import re
+import sqlite3
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Sequence
+
+from starlette.concurrency import run_in_threadpool
+
+from ..core.database import list_from_rows
+from . import version_service
+from .consultant_service import get_consultant
+from .matching_service import _day, recency
+from .profile_export_service import ProfileLayout, measure_profile_layout
+from .profile_service import _build_profile_snapshot
+from .term_index import SKILL_LEVELS, block_term_rows, canonical_term
+
+# Credit of a target mentioned in a block's text but not among its terms.
+TEXT_MATCH_CREDIT = 0.5
+
+# Share of a block's score that depends on its recency.
+RECENCY_WEIGHT = 0.5
+
+# Consultants whose measured blocks are kept in memory.
+CACHED_CONSULTANTS = 256
+
+_MAX_SKILL_LEVEL = max(SKILL_LEVELS.values())
+
+# Block columns searched for targets that are not among a block's terms.
+_TEXT_COLUMNS = ("title", "client_name", "role", "project_description", "issuing_organization", "misc_content")
+
+# Last use of an ongoing project: recency treats days after today as today.
+_ONGOING = date.max.toordinal()
+
+
+@dataclass(frozen=True)
+class _BlockFeatures:
+    """What scoring needs from one block: the credit of each of its terms, its text and its last use."""
+
+    id: int
+    block_type: str
+    title: str
+    credits: dict[str, float]
+    text: str
+    last_used: int
+
+
+@dataclass(frozen=True)
+class _ConsultantBlocks:
+    """A consultant's active blocks in display order with their measured layout."""
+
+    versions: tuple[int, int]
+    blocks: tuple[_BlockFeatures, ...]
+    layout: ProfileLayout
+
+
+_cache: OrderedDict[int, _ConsultantBlocks] = OrderedDict()
+
+
+def _last_used(block: dict) -> int:
+    """Ordinal day a block was last current (0 when undated)."""
+    if block["block_type"] == "project":
+        if block.get("is_ongoing"):
+            return _ONGOING
+        if block.get("end_date"):
+            return _day(block["end_date"])
+        if block.get("start_date"):
+            return _day(block["start_date"]) + round((block.get("duration_months") or 0) * 30.44)
+        return 0
+    if block["block_type"] == "certification":
+        return _day(block.get("issue_date"))
+    return 0
+
+
+def _block_features(block: dict) -> _BlockFeatures:
+    credits = {
+        term: 1.0 if kind == "technology" else 0.5 + 0.5 * (level or 1) / _MAX_SKILL_LEVEL
+        for term, _, _, kind, level in block_term_rows(block)
+    }
+    text = canonical_term(" ".join(str(block[column]) for column in _TEXT_COLUMNS if block.get(column)))
+    return _BlockFeatures(block["id"], block["block_type"], block["title"], credits, text, _last_used(block))
+
+
+async def _consultant_blocks(conn: sqlite3.Connection, consultant_id: int) -> _ConsultantBlocks:
+    """Cached blocks and layout of a consultant, rebuilt when the consultant or their blocks changed."""
+    versions = (
+        await version_service.get_version(conn, version_service.consultant_scope(consultant_id)),
+        await version_service.get_version(conn, version_service.consultant_blocks_scope(consultant_id)),
+    )
+    cached = _cache.get(consultant_id)
+    if cached is not None and cached.versions == versions:
+        _cache.move_to_end(consultant_id)
+        return cached
+
+    consultant = await get_consultant(conn, consultant_id)
+    if not consultant:
+        raise ValueError("Consultant not found.")
+    cursor = conn.execute(
+        'SELECT * FROM blocks WHERE consultant_id = ? AND is_active = 1 ORDER BY "order", created_at DESC',
+        (consultant_id,),
+    )
+    blocks = list_from_rows(cursor.fetchall())
+    snapshot = _build_profile_snapshot(consultant, blocks, [block["id"] for block in blocks], {}, {})
+    layout = await run_in_threadpool(measure_profile_layout, snapshot)
+
+    entry = _ConsultantBlocks(versions, tuple(map(_block_features, blocks)), layout)
+    _cache[consultant_id] = entry
+    _cache.move_to_end(consultant_id)
+    while len(_cache) > CACHED_CONSULTANTS:
+        _cache.popitem(last=False)
+    return entry
+
+
+async def suggest_blocks(
+    conn: sqlite3.Connection,
+    consultant_id: int,
+    skills: Sequence[str],
+    max_pages: int = 2,
+    include_unmatched: bool = False,
+    today: date | None = None,
+) -> dict:
+    """Rank a consultant's blocks against target skills and propose the best ones fitting ``max_pages``."""
+    targets = list(dict.fromkeys(term for term in map(canonical_term, skills) if term))
+    if not targets:
+        raise ValueError("Provide at least one skill.")
+    day = (today or date.today()).toordinal()
+    consultant_blocks = await _consultant_blocks(conn, consultant_id)
+    layout = consultant_blocks.layout
+
+    patterns = {target: re.compile(rf"(?<!\w){re.escape(target)}(?!\w)") for target in targets}
+    ranked = []
+    for block in consultant_blocks.blocks:
+        matched, credit = [], 0.0
+        for target in targets:
+            target_credit = block.credits.get(target)
+            if target_credit is None and patterns[target].search(block.text):
+                target_credit = TEXT_MATCH_CREDIT
+            if target_credit:
+                matched.append(target)
+                credit += target_credit
+        relevance = credit / len(targets)
+        block_recency = recency(block.last_used, day)
+        ranked.append({
+            "id": block.id,
+            "block_type": block.block_type,
+            "title": block.title,
+            "score": round(relevance * (1 - RECENCY_WEIGHT + RECENCY_WEIGHT * block_recency), 4),
+            "relevance": round(relevance, 4),
+            "recency": round(block_recency, 4),
+            "matched_skills": matched,
+            "estimated_height": round(layout.block_heights[block.id], 1),
+            "selected": False,
+        })
+    ranked.sort(key=lambda block: (-block["score"], -block["recency"]))
+
+    # Greedy fill: a block that would overflow the budget is skipped, smaller ones may still fit.
+    selected: list[int] = []
+    for block in ranked:
+        if not (block["score"] or include_unmatched):
+            break
+        if layout.pages([*selected, block["id"]]) <= max_pages:
+            selected.append(block["id"])
+            block["selected"] = True
+
+    return {
+        "consultant_id": consultant_id,
+        "skills": targets,
+        "max_pages": max_pages,
+        "estimated_pages": round(layout.pages(selected), 2),
+        "selected_block_ids": selected,
+        "blocks": ranked,
+    }
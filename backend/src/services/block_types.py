@@ -0,0 +1,221 @@
+"""Block type registry.
+
+Each block type is declared once: its create schema, the snapshot fields it
+exposes (with the block column each reads and how customizations and stored
+values are decoded) and the PDF section renderer. Column sets and field maps
+used by the block, profile and export services are compiled from these
+declarations at import time.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from ..schemas.block import (
+    BlockBase,
+    CertificationBlockCreate,
+    MiscBlockCreate,
+    ProjectBlockCreate,
+    SkillBlockCreate,
+)
+
+# Columns every block row has, in table order.
+COMMON_COLUMNS = ("id", "consultant_id", "block_type", "title", "order", "is_active", "created_at", "updated_at")
+
+# Columns editable on every block type.
+COMMON_EDITABLE_COLUMNS = ("title", "order")
+
+
+def _parse_json_array(value: str | None) -> list[str]:
+    """Parse JSON list values safely and return an empty list for invalid payloads."""
+    if not value:
+        return []
+
+    try:
+        parsed = json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return []
+
+    if isinstance(parsed, list):
+        return [str(item) for item in parsed]
+    return []
+
+
+def parse_list_like(value: str | list[str] | None) -> list[str]:
+    """Parse list-like customization values (list, JSON string, comma-separated string)."""
+    if value is None:
+        return []
+
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if str(item).strip()]
+
+    if isinstance(value, str):
+        stripped = value.strip()
+        if not stripped:
+            return []
+
+        looks_like_json_array = stripped.startswith("[") and stripped.endswith("]")
+        if looks_like_json_array:
+            try:
+                parsed_json = json.loads(stripped)
+            except (json.JSONDecodeError, TypeError):
+                parsed_json = None
+
+            if isinstance(parsed_json, list):
+                return [str(item).strip() for item in parsed_json if str(item).strip()]
+            if parsed_json is not None:
+                return []
+
+        if "," in stripped:
+            return [item.strip() for item in stripped.split(",") if item.strip()]
+        return [stripped]
+
+    return []
+
+
+# Skill levels shown in exported profiles and skill analytics, highest first.
+SKILL_DISPLAY_LEVELS = ("Expert", "Advanced", "Proficient", "Basic")
+
+
+def display_skill_level(raw_level: str | None) -> str:
+    """Map a free-text proficiency level onto one of SKILL_DISPLAY_LEVELS (Proficient when unrecognized)."""
+    text = str(raw_level or "").strip().lower()
+    if not text:
+        return "Proficient"
+    if any(token in text for token in ("expert", "master", "principal", "lead")):
+        return "Expert"
+    if any(token in text for token in ("advanced", "senior")):
+        return "Advanced"
+    if any(token in text for token in ("basic", "beginner", "novice", "junior")):
+        return "Basic"
+    return "Proficient"
+
+
+def _parse_int(value: int | str | None) -> int | None:
+    """Parse integer-like customization values."""
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_bool(value: bool | str | None, fallback: bool | None = None) -> bool | None:
+    """Parse boolean-like customization values with optional fallback."""
+    if value is None:
+        return fallback
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        if normalized in {"true", "1", "yes", "on"}:
+            return True
+        if normalized in {"false", "0", "no", "off"}:
+            return False
+    return fallback
+
+
+def _customized_list(value: Any, stored: Any) -> list[str]:
+    return parse_list_like(value)
+
+
+def _customized_int(value: Any, stored: Any) -> int | None:
+    return _parse_int(value)
+
+
+def _drop_end_date_when_ongoing(serialized: dict) -> None:
+    if serialized["is_ongoing"]:
+        serialized["end_date"] = None
+
+
+@dataclass(frozen=True)
+class SnapshotField:
+    """One snapshot key, the block column it reads and how its values are decoded.
+
+    ``from_customization(value, stored)`` decodes a customization override and
+    ``from_column(stored)`` decodes the stored column; without them values pass through.
+    """
+
+    key: str
+    column: str
+    from_customization: Callable[[Any, Any], Any] | None = None
+    from_column: Callable[[Any], Any] | None = None
+
+
+@dataclass(frozen=True)
+class BlockType:
+    """Declaration of a block type; ``columns`` is derived from the create schema.
+
+    ``pdf_renderer`` names the PDF generator method adding the type's section and
+    ``pdf_entry`` the one building a single block's card (None for types laid
+    out as a grid rather than one card per block).
+    """
+
+    name: str
+    create_schema: type[BlockBase]
+    snapshot_fields: tuple[SnapshotField, ...]
+    pdf_renderer: str
+    pdf_entry: str | None = None
+    finalize: Callable[[dict], None] | None = None
+    columns: tuple[str, ...] = field(init=False)
+    select_columns: tuple[str, ...] = field(init=False)
+    editable_columns: frozenset[str] = field(init=False)
+
+    def __post_init__(self):
+        columns = tuple(name for name in self.create_schema.model_fields if name not in BlockBase.model_fields)
+        object.__setattr__(self, "columns", columns)
+        object.__setattr__(self, "select_columns", COMMON_COLUMNS + columns)
+        object.__setattr__(self, "editable_columns", frozenset(COMMON_EDITABLE_COLUMNS + columns))
+
+
+# Registry order is the section order of exported profiles.
+BLOCK_TYPES: dict[str, BlockType] = {
+    block_type.name: block_type
+    for block_type in (
+        BlockType(
+            name="project",
+            create_schema=ProjectBlockCreate,
+            snapshot_fields=(
+                SnapshotField("client_name", "client_name"),
+                SnapshotField("description", "project_description"),
+                SnapshotField("role", "role"),
+                SnapshotField("technologies", "technologies", _customized_list, _parse_json_array),
+                SnapshotField("duration_months", "duration_months", _customized_int),
+                SnapshotField("start_date", "start_date"),
+                SnapshotField("end_date", "end_date"),
+                SnapshotField("is_ongoing", "is_ongoing", _parse_bool),
+            ),
+            pdf_renderer="_add_projects",
+            pdf_entry="_project_entry",
+            finalize=_drop_end_date_when_ongoing,
+        ),
+        BlockType(
+            name="skill",
+            create_schema=SkillBlockCreate,
+            snapshot_fields=(SnapshotField("level", "proficiency_level"),),
+            pdf_renderer="_add_skills",
+        ),
+        BlockType(
+            name="certification",
+            create_schema=CertificationBlockCreate,
+            snapshot_fields=(
+                SnapshotField("issuing_organization", "issuing_organization"),
+                SnapshotField("issue_date", "issue_date"),
+                SnapshotField("expiry_date", "expiry_date"),
+                SnapshotField("credential_id", "credential_id"),
+                SnapshotField("credential_url", "credential_url"),
+            ),
+            pdf_renderer="_add_certifications",
+            pdf_entry="_certification_entry",
+        ),
+        BlockType(
+            name="misc",
+            create_schema=MiscBlockCreate,
+            snapshot_fields=(SnapshotField("content", "misc_content"),),
+            pdf_renderer="_add_misc",
+            pdf_entry="_misc_entry",
+        ),
+    )
+}
+
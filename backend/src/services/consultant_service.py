@@ -1,13 +1,17 @@
 import sqlite3
 import json
+from typing import Sequence
 
 from ..schemas.consultant import ConsultantCreate, ConsultantUpdate
-from ..core.database import dict_from_row, list_from_rows
+from ..core.database import dict_from_row, list_from_rows, select_columns
+from . import read_model
 
 
 def serialize_consultant(consultant: dict) -> dict:
     """Convert consultant row to response format with JSON deserialization."""
     serialized = {**consultant}
+    if "focus_areas" not in serialized:
+        return serialized
     if serialized.get("focus_areas"):
         try:
             parsed = json.loads(serialized["focus_areas"])
@@ -26,50 +30,60 @@ def _normalize_focus_areas(focus_areas: list[str] | None) -> list[str]:
     return [str(area).strip() for area in focus_areas if str(area).strip()]
 
 
-async def create_consultant(conn: sqlite3.Connection, consultant_data: ConsultantCreate, admin_id: int) -> dict:
-    """Create a new consultant."""
+CONSULTANT_INSERT = """
+    INSERT INTO consultants (first_name, last_name, email, title, summary, photo_url, role, focus_areas, years_experience, motto, created_by_admin_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _consultant_insert_values(consultant_data: ConsultantCreate, admin_id: int) -> tuple:
+    """Build the CONSULTANT_INSERT values for a validated consultant."""
     focus_areas = _normalize_focus_areas(consultant_data.focus_areas)
     focus_areas_json = json.dumps(focus_areas) if focus_areas else None
-
-    cursor = conn.execute(
-        """
-        INSERT INTO consultants (first_name, last_name, email, title, summary, photo_url, role, focus_areas, years_experience, motto, created_by_admin_id)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            consultant_data.first_name,
-            consultant_data.last_name,
-            consultant_data.email,
-            consultant_data.title,
-            consultant_data.summary,
-            consultant_data.photo_url,
-            consultant_data.role,
-            focus_areas_json,
-            consultant_data.years_experience,
-            consultant_data.motto,
-            admin_id
-        )
+    return (
+        consultant_data.first_name,
+        consultant_data.last_name,
+        consultant_data.email,
+        consultant_data.title,
+        consultant_data.summary,
+        consultant_data.photo_url,
+        consultant_data.role,
+        focus_areas_json,
+        consultant_data.years_experience,
+        consultant_data.motto,
+        admin_id
     )
+
+
+async def create_consultant(conn: sqlite3.Connection, consultant_data: ConsultantCreate, admin_id: int) -> dict:
+    """Create a new consultant."""
+    cursor = conn.execute(CONSULTANT_INSERT, _consultant_insert_values(consultant_data, admin_id))
     consultant_id = cursor.lastrowid
 
     # Fetch the created consultant
     cursor = conn.execute("SELECT * FROM consultants WHERE id = ?", (consultant_id,))
-    return serialize_consultant(dict_from_row(cursor.fetchone()))
+    consultant = serialize_consultant(dict_from_row(cursor.fetchone()))
+    read_model.record_consultant(conn, consultant)
+    return consultant
 
 
-async def get_consultant(conn: sqlite3.Connection, consultant_id: int) -> dict | None:
-    """Get a consultant by id."""
-    cursor = conn.execute("SELECT * FROM consultants WHERE id = ?", (consultant_id,))
+async def get_consultant(
+    conn: sqlite3.Connection, consultant_id: int, columns: Sequence[str] | None = None
+) -> dict | None:
+    """Get a consultant by id, optionally selecting only some columns."""
+    cursor = conn.execute(f"SELECT {select_columns(columns)} FROM consultants WHERE id = ?", (consultant_id,))
     row = cursor.fetchone()
     if row:
         return serialize_consultant(dict_from_row(row))
     return None
 
 
-async def get_consultants(conn: sqlite3.Connection, skip: int = 0, limit: int = 100) -> list[dict]:
+async def get_consultants(
+    conn: sqlite3.Connection, skip: int = 0, limit: int = 100, columns: Sequence[str] | None = None
+) -> list[dict]:
     """Get all consultants ordered by latest creation timestamp."""
     cursor = conn.execute(
-        "SELECT * FROM consultants ORDER BY created_at DESC LIMIT ? OFFSET ?",
+        f"SELECT {select_columns(columns)} FROM consultants ORDER BY created_at DESC LIMIT ? OFFSET ?",
         (limit, skip)
     )
     return [serialize_consultant(c) for c in list_from_rows(cursor.fetchall())]
@@ -120,7 +134,9 @@ async def update_consultant(conn: sqlite3.Connection, consultant_id: int, consul
 
     # Fetch updated consultant
     cursor = conn.execute("SELECT * FROM consultants WHERE id = ?", (consultant_id,))
-    return serialize_consultant(dict_from_row(cursor.fetchone()))
+    updated_consultant = serialize_consultant(dict_from_row(cursor.fetchone()))
+    read_model.record_consultant(conn, updated_consultant)
+    return updated_consultant
 
 
 async def delete_consultant(conn: sqlite3.Connection, consultant_id: int) -> bool:
@@ -130,4 +146,5 @@ async def delete_consultant(conn: sqlite3.Connection, consultant_id: int) -> boo
         return False
 
     conn.execute("DELETE FROM consultants WHERE id = ?", (consultant_id,))
+    read_model.record_consultant_deleted(conn, consultant_id)
     return True
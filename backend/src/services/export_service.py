@@ -0,0 +1,131 @@
+"""Streaming NDJSON export of the full dataset.
+
+Every row becomes one JSON line tagged with ``record_type``; JSON text columns
+are decoded so consumers get arrays and objects rather than strings, and block
+lines carry ``consultant_email`` so consultant and block records can be fed
+back through the bulk import (deleted blocks, kept as sync tombstones, are
+left out). Access links are exported without their tokens, which grant edit
+access.
+
+Every table is read in ``fetchmany`` batches inside one read transaction on a
+single connection. In WAL mode (enabled at startup) that transaction sees one
+consistent snapshot while writers keep committing, nothing is copied to disk,
+and memory is bounded by the batch size. The WAL cannot be checkpointed past
+an open export, so it grows until the slowest export finishes.
+"""
+
+import json
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+from ..core.database import get_db_connection
+from .profile_service import PROFILE_COLUMNS, PROFILE_SOURCE
+
+
+@dataclass(frozen=True)
+class ExportTable:
+    """One exported record type, the query producing its rows and the JSON columns to decode."""
+
+    record_type: str
+    query: str
+    json_columns: tuple[str, ...] = ()
+
+
+# Export order: consultants before the rows that reference them.
+EXPORT_TABLES: dict[str, ExportTable] = {
+    table.record_type: table
+    for table in (
+        ExportTable("consultant", "SELECT * FROM consultants ORDER BY id", ("focus_areas",)),
+        ExportTable(
+            "block",
+            """
+            SELECT blocks.*, consultants.email AS consultant_email
+            FROM blocks JOIN consultants ON consultants.id = blocks.consultant_id
+            WHERE blocks.is_active = 1
+            ORDER BY blocks.id
+            """,
+            ("technologies",),
+        ),
+        ExportTable(
+            "profile",
+            f"SELECT {PROFILE_COLUMNS} FROM {PROFILE_SOURCE} ORDER BY profiles.id",
+            ("selected_block_ids", "profile_data", "block_type_counts"),
+        ),
+        ExportTable(
+            "access_link",
+            """
+            SELECT id, consultant_id, expires_at, created_by_admin_id, is_used, last_accessed_at, created_at
+            FROM access_links ORDER BY id
+            """,
+        ),
+    )
+}
+
+# Rows fetched (and encoded into one output chunk) at a time.
+EXPORT_BATCH_ROWS = 500
+
+
+def _decode_json(value):
+    """Decode a JSON text column, keeping values that are not valid JSON as they are."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return value
+
+
+def resolve_record_types(record_types: Iterable[str] | None) -> list[ExportTable]:
+    """Return the tables to export, in export order, raising ValueError for unknown record types."""
+    if record_types is None:
+        return list(EXPORT_TABLES.values())
+    requested = set(record_types)
+    unknown = requested.difference(EXPORT_TABLES)
+    if unknown:
+        raise ValueError(
+            f"Unknown record types: {', '.join(sorted(unknown))}. Allowed: {', '.join(EXPORT_TABLES)}."
+        )
+    return [table for name, table in EXPORT_TABLES.items() if name in requested]
+
+
+def iter_export(
+    tables: list[ExportTable],
+    compress: bool = False,
+    progress: Callable[[str, int], None] | None = None,
+) -> Iterator[bytes]:
+    """Yield the NDJSON export (gzip-compressed when ``compress`` is set) in chunks.
+
+    ``progress(record_type, rows)`` is called after each batch with the rows exported so far.
+    """
+    conn = get_db_connection()
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if compress else None
+    try:
+        # The snapshot is taken at the first read and held until the rollback below.
+        conn.execute("BEGIN")
+        for table in tables:
+            cursor = conn.execute(table.query)
+            names = [column[0] for column in cursor.description]
+            json_indexes = [names.index(column) for column in table.json_columns]
+            exported = 0
+            while rows := cursor.fetchmany(EXPORT_BATCH_ROWS):
+                lines = []
+                for row in rows:
+                    record = {"record_type": table.record_type, **dict(zip(names, row))}
+                    for index in json_indexes:
+                        record[names[index]] = _decode_json(row[index])
+                    lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+                lines.append("")
+                chunk = "\n".join(lines).encode()
+                exported += len(rows)
+                if progress:
+                    progress(table.record_type, exported)
+                if compressor:
+                    chunk = compressor.compress(chunk)
+                if chunk:
+                    yield chunk
+        if compressor:
+            yield compressor.flush()
+    finally:
+        conn.rollback()
+        conn.close()
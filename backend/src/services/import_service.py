@@ -0,0 +1,246 @@
+"""Streaming bulk import of consultants and blocks.
+
+Input is JSON Lines (one object per line) or CSV with a header row. Every record
+carries ``record_type`` (``consultant`` or ``block``); block records name their
+consultant by ``consultant_email``, either an existing consultant or one
+imported earlier in the same stream. Records are read and validated one at a
+time and written in chunked transactions, so memory is bounded by the chunk
+size rather than the input size. Invalid records are reported by line number
+and skipped; valid records are imported. Input that cannot be decoded as UTF-8
+or parsed as CSV ends the import with a final row error: records read before
+it are imported, the rest is not.
+"""
+
+import csv
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Iterator, TextIO
+
+from pydantic import BaseModel, EmailStr, TypeAdapter, ValidationError
+
+from ..core.database import get_db, list_from_rows
+from ..schemas.block import block_create_adapter
+from ..schemas.consultant import ConsultantCreate
+from . import read_model, term_index
+from .block_service import _block_insert, _new_block_orders
+from .block_types import parse_list_like
+from .consultant_service import CONSULTANT_INSERT, _consultant_insert_values, serialize_consultant
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+# Records validated and written per transaction.
+DEFAULT_CHUNK_SIZE = 500
+
+# Row errors kept in a report; error_count keeps counting past it.
+MAX_REPORTED_ERRORS = 100
+
+_email_adapter = TypeAdapter(EmailStr)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_email(email: str) -> str:
+    """Normalize a block's consultant reference like stored emails (cached: references repeat)."""
+    return _email_adapter.validate_python(email)
+
+
+@dataclass
+class ImportReport:
+    """Running totals of an import, handed to progress callbacks after each chunk."""
+
+    records: int = 0
+    consultants_created: int = 0
+    blocks_created: int = 0
+    error_count: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def add_error(self, line: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "message": message})
+
+
+@dataclass
+class _ImportRow:
+    line: int
+    record: BaseModel
+    consultant_email: str | None = None
+
+
+def _iter_ndjson(stream: TextIO) -> Iterator[tuple[int, dict | str]]:
+    """Yield (line number, record or error message) for each non-blank line."""
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield line_number, f"Invalid JSON: {exc.msg}."
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "Record must be a JSON object."
+            continue
+        yield line_number, record
+
+
+def _iter_csv(stream: TextIO) -> Iterator[tuple[int, dict | str]]:
+    """Yield (line number, record) for each CSV row; empty cells are treated as missing."""
+    reader = csv.DictReader(stream)
+    if not reader.fieldnames or "record_type" not in reader.fieldnames:
+        raise ValueError("CSV header must include a record_type column.")
+    for row in reader:
+        record = {key: value for key, value in row.items() if key and value not in (None, "")}
+        if "focus_areas" in record:
+            record["focus_areas"] = parse_list_like(record["focus_areas"])
+        yield reader.line_num, record
+
+
+RECORD_READERS: dict[str, Callable[[TextIO], Iterator[tuple[int, dict | str]]]] = {
+    "ndjson": _iter_ndjson,
+    "csv": _iter_csv,
+}
+
+
+def _iter_records(stream: TextIO, fmt: str) -> Iterator[tuple[int, dict | str]]:
+    """Yield the reader's records; unreadable input ends them with an error after the last line read."""
+    line = 0
+    try:
+        for line, record in RECORD_READERS[fmt](stream):
+            yield line, record
+    except UnicodeDecodeError:
+        yield line + 1, "Input is not valid UTF-8 at or after this line; the rest of the input was not imported."
+    except csv.Error as exc:
+        yield line + 1, f"Malformed CSV: {exc}; the rest of the input was not imported."
+
+
+def _format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'record'}: {error['msg']}" for error in exc.errors()
+    )
+
+
+def _parse_record(line: int, record: dict) -> _ImportRow:
+    """Validate one record with the create schemas, raising ValueError with a readable message."""
+    record = dict(record)
+    record_type = record.pop("record_type", None)
+    try:
+        if record_type == "consultant":
+            return _ImportRow(line, ConsultantCreate.model_validate(record))
+        if record_type == "block":
+            consultant_email = record.pop("consultant_email", None)
+            if not consultant_email:
+                raise ValueError("Block records require consultant_email.")
+            try:
+                consultant_email = _normalize_email(str(consultant_email))
+            except ValidationError as exc:
+                raise ValueError(f"consultant_email: {exc.errors()[0]['msg']}") from exc
+            return _ImportRow(line, block_create_adapter.validate_python(record), consultant_email)
+    except ValidationError as exc:
+        raise ValueError(_format_validation_error(exc)) from exc
+    raise ValueError("record_type must be 'consultant' or 'block'.")
+
+
+def _consultant_ids_by_email(conn: sqlite3.Connection, emails: set[str]) -> dict[str, int]:
+    if not emails:
+        return {}
+    placeholders = ", ".join(["?"] * len(emails))
+    cursor = conn.execute(f"SELECT id, email FROM consultants WHERE email IN ({placeholders})", list(emails))
+    return {row["email"]: row["id"] for row in cursor.fetchall()}
+
+
+def _inserted_rows(conn: sqlite3.Connection, table: str, count: int) -> list[dict]:
+    """Read back the rows of the ``count`` preceding inserts (contiguous ids in this transaction)."""
+    last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+    cursor = conn.execute(f"SELECT * FROM {table} WHERE id BETWEEN ? AND ?", (last_id - count + 1, last_id))
+    return list_from_rows(cursor.fetchall())
+
+
+def _write_chunk(conn: sqlite3.Connection, rows: list[_ImportRow], admin_id: int, report: ImportReport) -> None:
+    """Insert one chunk of validated rows: consultants first, then blocks resolved by email."""
+    consultant_rows = [row for row in rows if row.consultant_email is None]
+    block_rows = [row for row in rows if row.consultant_email is not None]
+    track_read_model = read_model.consultant_read_model.enabled
+
+    existing = _consultant_ids_by_email(conn, {row.record.email for row in consultant_rows})
+    consultant_values = []
+    chunk_emails: set[str] = set()
+    for row in consultant_rows:
+        email = row.record.email
+        if email in existing or email in chunk_emails:
+            report.add_error(row.line, f"Consultant {email} already exists.")
+            continue
+        chunk_emails.add(email)
+        consultant_values.append(_consultant_insert_values(row.record, admin_id))
+
+    if consultant_values:
+        conn.executemany(CONSULTANT_INSERT, consultant_values)
+        report.consultants_created += len(consultant_values)
+        if track_read_model:
+            for consultant in _inserted_rows(conn, "consultants", len(consultant_values)):
+                read_model.record_consultant(conn, serialize_consultant(consultant))
+
+    consultant_ids = _consultant_ids_by_email(conn, {row.consultant_email for row in block_rows})
+    records_by_consultant: dict[int, list[BaseModel]] = {}
+    for row in block_rows:
+        consultant_id = consultant_ids.get(row.consultant_email)
+        if consultant_id is None:
+            report.add_error(row.line, f"Consultant {row.consultant_email} not found.")
+            continue
+        records_by_consultant.setdefault(consultant_id, []).append(row.record)
+
+    inserts: dict[str, list[list]] = {}
+    for consultant_id, records in records_by_consultant.items():
+        for record, order in zip(records, _new_block_orders(conn, consultant_id, records)):
+            query, values = _block_insert(consultant_id, record, order)
+            inserts.setdefault(query, []).append(values)
+
+    for query, values in inserts.items():
+        conn.executemany(query, values)
+        report.blocks_created += len(values)
+        blocks = _inserted_rows(conn, "blocks", len(values))
+        term_index.index_blocks(conn, blocks)
+        if track_read_model:
+            for block in blocks:
+                read_model.record_block(conn, block)
+
+
+def import_records(
+    stream: TextIO,
+    fmt: str,
+    admin_id: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: Callable[[ImportReport], None] | None = None,
+) -> ImportReport:
+    """Import consultant and block records from a text stream, committing every ``chunk_size`` records."""
+    if fmt not in RECORD_READERS:
+        raise ValueError(f"Unsupported import format: {fmt}. Use one of: {', '.join(IMPORT_FORMATS)}.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    report = ImportReport()
+    chunk: list[_ImportRow] = []
+
+    def flush() -> None:
+        with get_db() as conn:
+            _write_chunk(conn, chunk, admin_id, report)
+        chunk.clear()
+        if progress:
+            progress(report)
+
+    for line, record in _iter_records(stream, fmt):
+        report.records += 1
+        if isinstance(record, str):
+            report.add_error(line, record)
+            continue
+        try:
+            chunk.append(_parse_record(line, record))
+        except ValueError as exc:
+            report.add_error(line, str(exc))
+            continue
+        if len(chunk) >= chunk_size:
+            flush()
+
+    if chunk:
+        flush()
+    return report
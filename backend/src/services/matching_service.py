@@ -0,0 +1,367 @@
+"""Rank consultants against a staffing requirement.
+
+Every consultant has a sparse term vector in ``consultant_terms`` (maintained
+by ``term_index`` in the transaction that changes their blocks). A requirement
+lists terms with weights; some are required and may ask for a minimum skill
+level. Terms are scored per consultant as
+
+    skill       = proficiency rank / 4 (0 without a skill block for the term)
+    experience  = recency * (0.5 + 0.5 * min(project months, 60) / 60)
+    recency     = 1 / (1 + years since the last project using the term / 3)
+    term score  = 1 - (1 - skill) * (1 - experience)
+    score       = sum(weight * term score) / sum(weight)
+
+and consultants missing a required term are left out. Scores are in [0, 1].
+Like recency, the months of open-ended projects are counted up to the day
+of the request (from the earliest such project's start), not stored.
+
+Scoring runs against ``match_index``, an in-process copy of the vectors laid
+out as one posting array per term over dense consultant slots, so a request
+accumulates every consultant's score term by term without a per-consultant
+query. Before each use the index applies the consultants listed in
+``consultant_term_changes`` since its last sync (written with every vector
+refresh, so imports from other processes are picked up too), and reloads in
+full when it has fallen too far behind.
+"""
+
+import heapq
+import json
+import sqlite3
+import threading
+from array import array
+from datetime import date
+from typing import Iterable, Sequence
+
+from ..core.database import list_from_rows
+from .term_index import SKILL_LEVELS, canonical_term, skill_level_rank
+
+# Project months after which more experience with a term no longer counts.
+EXPERIENCE_CAP_MONTHS = 60
+
+# Years after which a term's project experience counts half.
+RECENCY_HALF_LIFE_YEARS = 3
+
+# Recency of project experience without any dates.
+UNDATED_RECENCY = 0.5
+
+# Changed consultants applied one by one; more than this reloads the index.
+MAX_INCREMENTAL_CONSULTANTS = 500
+
+_MAX_SKILL_LEVEL = max(SKILL_LEVELS.values())
+_LEVEL_NAMES = {rank: name.capitalize() for name, rank in SKILL_LEVELS.items()}
+_RECENCY_DAYS = 365.25 * RECENCY_HALF_LIFE_YEARS
+
+_VECTOR_COLUMNS = "consultant_id, term, skill_level, project_count, project_months, ongoing_since, last_used"
+_DAYS_PER_MONTH = 30.44
+
+
+def _day(value: str | None) -> int:
+    """Ordinal day of a stored date (0 when unknown)."""
+    return date.fromisoformat(value).toordinal() if value else 0
+
+
+def recency(last_used: int, today: int) -> float:
+    """Recency of experience last used on an ordinal day (0 when undated, later than ``today`` counts as current)."""
+    if not last_used:
+        return UNDATED_RECENCY
+    return 1.0 / (1.0 + max(today - last_used, 0) / _RECENCY_DAYS)
+
+
+def experience_months(project_months: int, ongoing_since: int, today: int) -> int:
+    """Stored months of closed projects plus those of open-ended projects running since an ordinal day (0 when none)."""
+    if not ongoing_since:
+        return project_months
+    return project_months + int(max(today - ongoing_since, 0) / _DAYS_PER_MONTH)
+
+
+def term_score(
+    skill_level: int, project_count: int, project_months: int, ongoing_since: int, last_used: int, today: int
+) -> float:
+    """Score of one vector entry; ``ongoing_since``, ``last_used`` and ``today`` are ordinal days."""
+    skill = skill_level / _MAX_SKILL_LEVEL
+    if not project_count:
+        return skill
+    months = experience_months(project_months, ongoing_since, today)
+    experience = recency(last_used, today) * (
+        0.5 + 0.5 * min(months, EXPERIENCE_CAP_MONTHS) / EXPERIENCE_CAP_MONTHS
+    )
+    return 1.0 - (1.0 - skill) * (1.0 - experience)
+
+
+class _Postings:
+    """Vector entries of one term: parallel arrays over consultant slots, plus cached scores for a day."""
+
+    __slots__ = (
+        "slots", "skill_levels", "project_counts", "project_months", "ongoing_since", "last_used",
+        "scores", "scored_day",
+    )
+
+    def __init__(self):
+        self.slots = array("i")
+        self.skill_levels = array("b")
+        self.project_counts = array("i")
+        self.project_months = array("i")
+        self.ongoing_since = array("i")
+        self.last_used = array("i")
+        self.scores = array("d")
+        self.scored_day = None
+
+    def _columns(self) -> tuple[array, ...]:
+        return (
+            self.slots, self.skill_levels, self.project_counts, self.project_months, self.ongoing_since, self.last_used
+        )
+
+    def add(
+        self,
+        slot: int,
+        skill_level: int | None,
+        project_count: int,
+        project_months: int,
+        ongoing_since: int,
+        last_used: int,
+    ):
+        for column, value in zip(
+            self._columns(), (slot, skill_level or 0, project_count, project_months, ongoing_since, last_used)
+        ):
+            column.append(value)
+        self.scored_day = None
+
+    def remove(self, slot: int) -> None:
+        index = self.slots.index(slot)
+        for column in self._columns():
+            del column[index]
+        self.scored_day = None
+
+    def scores_for(self, today: int) -> array:
+        if self.scored_day != today:
+            self.scores = array("d", map(
+                term_score, *self._columns()[1:], [today] * len(self.slots),
+            ))
+            self.scored_day = today
+        return self.scores
+
+
+class MatchIndex:
+    """In-process copy of ``consultant_terms`` organised for scoring all consultants at once."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._synced_seq: int | None = None
+        self._postings: dict[str, _Postings] = {}
+        self._slots: dict[int, int] = {}
+        self._consultants: list[int | None] = []
+        self._slot_terms: dict[int, list[str]] = {}
+        self._free_slots: list[int] = []
+
+    def _reset(self) -> None:
+        self._postings, self._slots, self._consultants, self._slot_terms, self._free_slots = {}, {}, [], {}, []
+
+    def _add_rows(self, rows: Iterable[tuple]) -> None:
+        days: dict[str | None, int] = {}
+        for consultant_id, term, skill_level, project_count, project_months, ongoing_since, last_used in rows:
+            slot = self._slots.get(consultant_id)
+            if slot is None:
+                slot = self._free_slots.pop() if self._free_slots else len(self._consultants)
+                if slot == len(self._consultants):
+                    self._consultants.append(consultant_id)
+                else:
+                    self._consultants[slot] = consultant_id
+                self._slots[consultant_id] = slot
+                self._slot_terms[slot] = []
+            for value in (ongoing_since, last_used):
+                if value not in days:
+                    days[value] = _day(value)
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = _Postings()
+            postings.add(slot, skill_level, project_count, project_months, days[ongoing_since], days[last_used])
+            self._slot_terms[slot].append(term)
+
+    def _remove_consultant(self, consultant_id: int) -> None:
+        slot = self._slots.pop(consultant_id, None)
+        if slot is None:
+            return
+        for term in self._slot_terms.pop(slot):
+            self._postings[term].remove(slot)
+        self._consultants[slot] = None
+        self._free_slots.append(slot)
+
+    def _query_rows(self, conn: sqlite3.Connection, query: str, params: tuple = ()) -> Iterable[tuple]:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        while rows := cursor.fetchmany(5000):
+            yield from rows
+
+    def load(self, conn: sqlite3.Connection) -> None:
+        """Rebuild the index from ``consultant_terms``."""
+        with self._lock:
+            self._load(conn, self._change_head(conn))
+
+    def _change_head(self, conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM consultant_term_changes").fetchone()[0]
+
+    def _load(self, conn: sqlite3.Connection, head: int) -> None:
+        self._reset()
+        self._add_rows(self._query_rows(conn, f"SELECT {_VECTOR_COLUMNS} FROM consultant_terms"))
+        self._synced_seq = head
+
+    def sync(self, conn: sqlite3.Connection) -> None:
+        """Apply vector changes committed since the last sync, by this or any other process."""
+        with self._lock:
+            head = self._change_head(conn)
+            if self._synced_seq is None or head < self._synced_seq:
+                self._load(conn, head)
+                return
+            if head == self._synced_seq:
+                return
+            oldest = conn.execute("SELECT MIN(seq) FROM consultant_term_changes").fetchone()[0]
+            changed = [row[0] for row in conn.execute(
+                "SELECT DISTINCT consultant_id FROM consultant_term_changes WHERE seq > ? AND seq <= ?",
+                (self._synced_seq, head),
+            ).fetchall()]
+            if oldest > self._synced_seq + 1 or len(changed) > MAX_INCREMENTAL_CONSULTANTS:
+                # Part of the change log was pruned, or too much changed to apply piecemeal.
+                self._load(conn, head)
+                return
+            for consultant_id in changed:
+                self._remove_consultant(consultant_id)
+            self._add_rows(self._query_rows(
+                conn,
+                f"SELECT {_VECTOR_COLUMNS} FROM consultant_terms WHERE consultant_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(changed),),
+            ))
+            self._synced_seq = head
+
+    def rank(self, requirements: list[dict], limit: int, today: int) -> list[tuple[int, float]]:
+        """Top ``limit`` (consultant_id, score) pairs, best first, ties by consultant id."""
+        with self._lock:
+            size = len(self._consultants)
+            totals = [0.0] * size
+            required_hits = bytearray(size)
+            required_count = 0
+            for requirement in requirements:
+                postings = self._postings.get(requirement["term"])
+                if postings is None:
+                    if requirement["required"]:
+                        return []
+                    continue
+                weight = requirement["weight"]
+                scores = postings.scores_for(today)
+                if requirement["min_rank"]:
+                    min_rank = requirement["min_rank"]
+                    entries = [
+                        (slot, score)
+                        for slot, score, level in zip(postings.slots, scores, postings.skill_levels)
+                        if level >= min_rank
+                    ]
+                else:
+                    entries = zip(postings.slots, scores)
+                if requirement["required"]:
+                    required_count += 1
+                    for slot, score in entries:
+                        totals[slot] += weight * score
+                        required_hits[slot] += 1
+                else:
+                    for slot, score in entries:
+                        totals[slot] += weight * score
+
+            consultants = self._consultants
+            candidates = (
+                slot for slot in range(size)
+                if consultants[slot] is not None and totals[slot] > 0 and required_hits[slot] == required_count
+            )
+            best = heapq.nsmallest(limit, candidates, key=lambda slot: (-totals[slot], consultants[slot]))
+            total_weight = sum(requirement["weight"] for requirement in requirements)
+            return [(consultants[slot], totals[slot] / total_weight) for slot in best]
+
+
+match_index = MatchIndex()
+
+
+def _resolve_requirements(requirements: Sequence[dict]) -> list[dict]:
+    """Canonicalize requirement terms and levels, raising ValueError for empty, duplicate or unknown ones."""
+    resolved: dict[str, dict] = {}
+    for requirement in requirements:
+        term = canonical_term(requirement["term"])
+        if not term:
+            raise ValueError("Requirement terms cannot be empty.")
+        if term in resolved:
+            raise ValueError(f"Duplicate requirement: {term}.")
+        min_level = requirement.get("min_level")
+        min_rank = skill_level_rank(min_level)
+        if min_level and min_rank is None:
+            raise ValueError(f"Unknown level: {min_level}. Use one of: {', '.join(SKILL_LEVELS)}.")
+        resolved[term] = {
+            "term": term,
+            "weight": float(requirement.get("weight", 1.0)),
+            "required": bool(requirement.get("required")),
+            "min_rank": min_rank,
+        }
+    if not resolved:
+        raise ValueError("Provide at least one requirement.")
+    return list(resolved.values())
+
+
+def _term_breakdown(vectors: list[dict], requirements: dict[str, dict], today: date) -> list[dict]:
+    """Per-term scores of one consultant, largest weighted contribution first."""
+    terms = []
+    for vector in vectors:
+        requirement = requirements[vector["term"]]
+        if requirement["min_rank"] and (vector["skill_level"] or 0) < requirement["min_rank"]:
+            continue
+        last_used = vector["last_used"]
+        ongoing_since = _day(vector["ongoing_since"])
+        terms.append({
+            "term": vector["term"],
+            "weight": requirement["weight"],
+            "required": requirement["required"],
+            "score": term_score(
+                vector["skill_level"] or 0, vector["project_count"], vector["project_months"],
+                ongoing_since, _day(last_used), today.toordinal(),
+            ),
+            "skill_level": _LEVEL_NAMES.get(vector["skill_level"]),
+            "project_months": experience_months(vector["project_months"], ongoing_since, today.toordinal()),
+            # Ongoing projects are stored as open-ended.
+            "last_used": min(last_used, today.isoformat()) if last_used else None,
+        })
+    return sorted(terms, key=lambda term: term["weight"] * term["score"], reverse=True)
+
+
+async def match_consultants(
+    conn: sqlite3.Connection,
+    requirements: Sequence[dict],
+    limit: int = 20,
+    today: date | None = None,
+) -> list[dict]:
+    """Best-scoring consultants for a requirement, each with its per-term breakdown."""
+    resolved = _resolve_requirements(requirements)
+    today = today or date.today()
+    match_index.sync(conn)
+    ranked = match_index.rank(resolved, limit, today.toordinal())
+    if not ranked:
+        return []
+
+    ids = json.dumps([consultant_id for consultant_id, _ in ranked])
+    consultants = {consultant["id"]: consultant for consultant in list_from_rows(conn.execute(
+        "SELECT id, first_name, last_name, email, title FROM consultants WHERE id IN (SELECT value FROM json_each(?))",
+        (ids,),
+    ).fetchall())}
+    vectors: dict[int, list[dict]] = {}
+    for vector in list_from_rows(conn.execute(
+        f"""SELECT {_VECTOR_COLUMNS} FROM consultant_terms
+            WHERE consultant_id IN (SELECT value FROM json_each(?)) AND term IN (SELECT value FROM json_each(?))""",
+        (ids, json.dumps([requirement["term"] for requirement in resolved])),
+    ).fetchall()):
+        vectors.setdefault(vector["consultant_id"], []).append(vector)
+
+    by_term = {requirement["term"]: requirement for requirement in resolved}
+    matches = []
+    for consultant_id, score in ranked:
+        consultant = consultants.get(consultant_id)
+        if consultant is None:
+            continue
+        consultant["score"] = score
+        consultant["terms"] = _term_breakdown(vectors.get(consultant_id, []), by_term, today)
+        matches.append(consultant)
+    return matches
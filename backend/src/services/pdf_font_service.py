@@ -0,0 +1,88 @@
+"""PDF font registration for profile exports.
+
+TrueType families are parsed once per process and registered with ReportLab.
+ReportLab keeps per-document glyph usage on each registered font and embeds
+only a subset of the glyphs a document actually uses.
+"""
+
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from ..core.config import settings
+
+# File name suffixes looked up in PDF_FONT_DIR for each face of a family.
+FONT_FACE_SUFFIXES = {
+    "regular": "Regular",
+    "bold": "Bold",
+    "italic": "Italic",
+    "bold_italic": "BoldItalic",
+}
+
+_registration_lock = threading.Lock()
+
+
+class PDFFontFamily(NamedTuple):
+    """ReportLab font names for the faces used by the PDF styles."""
+
+    regular: str
+    bold: str
+    italic: str
+    bold_italic: str
+
+
+BUILTIN_FONT_FAMILY = PDFFontFamily(
+    regular="Helvetica",
+    bold="Helvetica-Bold",
+    italic="Helvetica-Oblique",
+    bold_italic="Helvetica-BoldOblique",
+)
+
+
+def _font_face_path(font_dir: Path, family: str, suffix: str) -> Path:
+    return font_dir / f"{family}-{suffix}.ttf"
+
+
+@lru_cache(maxsize=None)
+def register_font_family(family: str, font_dir: str) -> PDFFontFamily:
+    """Parse and register a TTF family once, returning the registered face names.
+
+    Expects ``<family>-Regular.ttf`` in ``font_dir``; missing Bold/Italic/BoldItalic
+    faces fall back to the closest registered face.
+    """
+    directory = Path(font_dir)
+    regular_path = _font_face_path(directory, family, FONT_FACE_SUFFIXES["regular"])
+    if not regular_path.is_file():
+        raise ValueError(f"PDF font family '{family}' not found: missing {regular_path}")
+
+    with _registration_lock:
+        registered: dict[str, str] = {}
+        for face, suffix in FONT_FACE_SUFFIXES.items():
+            path = _font_face_path(directory, family, suffix)
+            if not path.is_file():
+                continue
+            font_name = f"{family}-{suffix}"
+            if font_name not in pdfmetrics.getRegisteredFontNames():
+                pdfmetrics.registerFont(TTFont(font_name, str(path)))
+            registered[face] = font_name
+
+        regular = registered["regular"]
+        bold = registered.get("bold", regular)
+        italic = registered.get("italic", regular)
+        bold_italic = registered.get("bold_italic", bold if "bold" in registered else italic)
+
+        # Lets <b>/<i> markup inside paragraphs resolve to the family's faces.
+        pdfmetrics.registerFontFamily(regular, normal=regular, bold=bold, italic=italic, boldItalic=bold_italic)
+
+    return PDFFontFamily(regular=regular, bold=bold, italic=italic, bold_italic=bold_italic)
+
+
+def get_pdf_font_family() -> PDFFontFamily:
+    """Return the configured PDF font family, registering it on first use."""
+    if not settings.PDF_FONT_FAMILY:
+        return BUILTIN_FONT_FAMILY
+    return register_font_family(settings.PDF_FONT_FAMILY, settings.PDF_FONT_DIR)
@@ -0,0 +1,195 @@
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import AsyncIterator
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+from starlette.concurrency import run_in_threadpool
+
+from ..core.config import settings
+
+DIGEST_RE = re.compile(r"[0-9a-f]{64}")
+PHOTO_URL_DIGEST_RE = re.compile(r"/photos/(?P<digest>[0-9a-f]{64})/")
+PHOTO_ORIGINAL_NAME = "original"
+
+# Derivatives rendered once at upload time: name -> (square edge in px, Pillow format, file name).
+PHOTO_VARIANTS = {
+    "thumb": (192, "WEBP", "thumb.webp"),
+    "pdf": (360, "JPEG", "pdf.jpg"),
+}
+
+# Pillow format names mapped to the extensions accepted by settings.ALLOWED_IMAGE_EXTENSIONS.
+PILLOW_FORMAT_EXTENSIONS = {"JPEG": "jpg", "PNG": "png", "WEBP": "webp"}
+
+
+class PhotoTooLargeError(ValueError):
+    """Raised when an upload exceeds the configured size limit."""
+
+
+def _photos_root() -> Path:
+    """Return the directory holding content-addressed photo folders."""
+    return Path(settings.UPLOAD_DIR) / "photos"
+
+
+def _max_upload_bytes() -> int:
+    return settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024
+
+
+def photo_dir(digest: str) -> Path:
+    """Return the folder for a photo digest (sharded by the first two hex characters)."""
+    return _photos_root() / digest[:2] / digest
+
+
+def variant_filename(variant: str) -> str:
+    """Return the file name of a derivative, raising ValueError for unknown variants."""
+    if variant not in PHOTO_VARIANTS:
+        raise ValueError(f"Unknown photo variant: {variant}")
+    return PHOTO_VARIANTS[variant][2]
+
+
+def get_variant_path(digest: str, variant: str) -> Path | None:
+    """Return the derivative path for a digest when it exists on disk."""
+    if not DIGEST_RE.fullmatch(digest):
+        return None
+    path = photo_dir(digest) / variant_filename(variant)
+    return path if path.is_file() else None
+
+
+def digest_from_photo_url(photo_url: str | None) -> str | None:
+    """Extract the content digest from a photo URL produced by this service."""
+    if not photo_url:
+        return None
+    match = PHOTO_URL_DIGEST_RE.search(photo_url)
+    return match.group("digest") if match else None
+
+
+def resolve_photo_variant(photo_url: str | None, variant: str) -> Path | None:
+    """Map a stored photo URL to a pre-sized derivative file, if it is one of ours."""
+    digest = digest_from_photo_url(photo_url)
+    if not digest:
+        return None
+    return get_variant_path(digest, variant)
+
+
+async def _spool_upload(chunks: AsyncIterator[bytes], directory: Path) -> tuple[Path, str]:
+    """Stream chunks to a temporary file while hashing, enforcing the upload size limit."""
+    directory.mkdir(parents=True, exist_ok=True)
+    hasher = hashlib.sha256()
+    size = 0
+    limit = _max_upload_bytes()
+    handle = tempfile.NamedTemporaryFile(dir=directory, prefix="upload-", delete=False)
+    temp_path = Path(handle.name)
+    try:
+        with handle:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if size > limit:
+                    raise PhotoTooLargeError(f"Photo exceeds the {settings.MAX_UPLOAD_SIZE_MB} MB upload limit.")
+                hasher.update(chunk)
+                handle.write(chunk)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    if size == 0:
+        temp_path.unlink(missing_ok=True)
+        raise ValueError("Photo upload is empty.")
+    return temp_path, hasher.hexdigest()
+
+
+def _detect_extension(path: Path) -> str:
+    """Identify the image format with Pillow and check it against the allowed extensions."""
+    try:
+        with Image.open(path) as image:
+            image_format = image.format
+            image.verify()
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError) as exc:
+        raise ValueError("Uploaded file is not a valid image.") from exc
+
+    extension = PILLOW_FORMAT_EXTENSIONS.get(image_format or "")
+    allowed = {"jpg" if item.lower() == "jpeg" else item.lower() for item in settings.ALLOWED_IMAGE_EXTENSIONS}
+    if not extension or extension not in allowed:
+        raise ValueError(f"Unsupported image format. Allowed: {', '.join(sorted(allowed))}.")
+    return extension
+
+
+def _render_variants(original: Path, target_dir: Path) -> None:
+    """Render missing derivatives for an original image (atomically, one file per variant).
+
+    Images that only fail once decoded (truncated data, too many pixels) raise
+    ValueError after the derivatives rendered so far are removed.
+    """
+    rendered = []
+    try:
+        with Image.open(original) as source:
+            image = ImageOps.exif_transpose(source)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+            for edge, image_format, filename in PHOTO_VARIANTS.values():
+                destination = target_dir / filename
+                if destination.exists():
+                    continue
+                resized = ImageOps.fit(image, (edge, edge), method=Image.Resampling.LANCZOS)
+                if image_format == "JPEG" and resized.mode != "RGB":
+                    # JPEG has no alpha channel; flatten onto white like the PDF background.
+                    background = Image.new("RGB", resized.size, (255, 255, 255))
+                    background.paste(resized, mask=resized.getchannel("A") if resized.mode == "RGBA" else None)
+                    resized = background
+
+                # A temp file of its own, so concurrent uploads of one image never share it.
+                save_options = (
+                    {"quality": 85, "optimize": True} if image_format == "JPEG" else {"quality": 82, "method": 4}
+                )
+                handle = tempfile.NamedTemporaryFile(dir=target_dir, prefix=f".{filename}.", delete=False)
+                temp_destination = Path(handle.name)
+                try:
+                    with handle:
+                        resized.save(handle, format=image_format, **save_options)
+                    os.replace(temp_destination, destination)
+                except BaseException:
+                    temp_destination.unlink(missing_ok=True)
+                    raise
+                rendered.append(destination)
+    except (Image.DecompressionBombError, OSError) as exc:
+        for path in rendered:
+            path.unlink(missing_ok=True)
+        raise ValueError("Uploaded file is not a valid image.") from exc
+
+
+def finalize_upload(temp_path: Path, digest: str) -> str:
+    """Move a spooled upload to its content-addressed folder and build its derivatives."""
+    try:
+        extension = _detect_extension(temp_path)
+        target_dir = photo_dir(digest)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        original = target_dir / f"{PHOTO_ORIGINAL_NAME}.{extension}"
+        stored = not original.exists()
+        if stored:
+            os.replace(temp_path, original)
+        else:
+            temp_path.unlink(missing_ok=True)
+        try:
+            _render_variants(original, target_dir)
+        except ValueError:
+            # Nothing refers to an original that could not be rendered.
+            if stored:
+                original.unlink(missing_ok=True)
+            raise
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return digest
+
+
+async def store_photo(chunks: AsyncIterator[bytes]) -> str:
+    """Store an uploaded photo by content hash and return its digest.
+
+    Identical uploads share one folder, so derivatives are only rendered once.
+    Image decoding and resampling run in the threadpool.
+    """
+    temp_path, digest = await _spool_upload(chunks, _photos_root() / "tmp")
+    return await run_in_threadpool(finalize_upload, temp_path, digest)
@@ -1,23 +1,38 @@
 """Profile PDF export service using ReportLab."""
 
+import hashlib
 import io
 import json
 import re
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterable, Optional
 
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
-from reportlab.platypus import HRFlowable, KeepTogether, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import HRFlowable, Image, KeepTogether, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from starlette.concurrency import run_in_threadpool
+
+from ..core.singleflight import SingleFlight
+from . import photo_service
+from .block_types import BLOCK_TYPES, SKILL_DISPLAY_LEVELS, display_skill_level
+from .pdf_font_service import get_pdf_font_family
 
 FILENAME_ALLOWED_RE = re.compile(r"[^\w\s\-.]")
 WHITESPACE_RE = re.compile(r"[\s]+")
 ARETO_PRIMARY_COLOR = "#0E4B8A"
 ARETO_SECONDARY_COLOR = "#1AA6B7"
 DEFAULT_ACCENT_COLOR = ARETO_PRIMARY_COLOR
+PHOTO_DISPLAY_SIZE = 0.95 * inch
+
+# Concurrent exports with identical render keys share a single ReportLab render.
+export_render_flight = SingleFlight("pdf_export")
+
+_SECTION_ORDER = {name: index for index, name in enumerate(BLOCK_TYPES)}
 
 
 def sanitize_filename(filename: str) -> str:
@@ -126,6 +141,39 @@ def format_multiline_text(value: Optional[str]) -> str:
     return "<br/>".join(lines) if lines else ""
 
 
+@dataclass(frozen=True)
+class ProfileLayout:
+    """Measured heights, in points, of the parts of one profile PDF.
+
+    Card blocks (types with a ``pdf_entry``) are kept together on one page;
+    grid blocks flow row by row and carry their average share of the grid.
+    """
+
+    frame_height: float
+    intro_height: float
+    section_heights: dict[str, float]
+    block_heights: dict[int, float]
+    block_types: dict[int, str]
+
+    def pages(self, block_ids: Iterable[int]) -> float:
+        """Pages filled by the blocks in selection order, the last one counted by the fraction used."""
+        page, used = 0, self.intro_height
+        section = None
+        for block_id in sorted(block_ids, key=lambda block_id: _SECTION_ORDER[self.block_types[block_id]]):
+            block_type = self.block_types[block_id]
+            items = [(self.block_heights[block_id], BLOCK_TYPES[block_type].pdf_entry is not None)]
+            if block_type != section:
+                section = block_type
+                items.insert(0, (self.section_heights[block_type], False))
+            for height, keep_together in items:
+                if keep_together and used and used + height > self.frame_height >= height:
+                    page, used = page + 1, 0.0
+                used += height
+                while used > self.frame_height:
+                    page, used = page + 1, used - self.frame_height
+        return page + used / self.frame_height
+
+
 class ProfilePDFGenerator:
     """Generate an areto-inspired modern profile PDF from profile data."""
 
@@ -134,12 +182,15 @@ class ProfilePDFGenerator:
         profile_data: dict,
         company_name: Optional[str] = None,
         accent_color: str = "#1A365D",
+        photo_path: Optional[str] = None,
     ):
         if isinstance(profile_data, str):
             profile_data = json.loads(profile_data)
 
         self.profile_data = profile_data
         self.company_name = company_name
+        # Pre-sized JPEG derivative; ReportLab embeds JPEG data without decoding it.
+        self.photo_path = photo_path
         resolved_accent = accent_color or ARETO_PRIMARY_COLOR
         self.accent_color = parse_hex_color(resolved_accent)
         self.palette = {
@@ -153,10 +204,16 @@ class ProfilePDFGenerator:
             "divider": colors.HexColor("#D8E3F0"),
         }
 
+        # Registered once per process; TTF families are subset-embedded per document
+        self.fonts = get_pdf_font_family()
+
         # Page setup
         self.page_width, self.page_height = A4
         self.margin = 0.82 * inch
+        self.bottom_margin = self.margin + 0.16 * inch
         self.content_width = self.page_width - 2 * self.margin
+        # Usable height of a page: SimpleDocTemplate's frame pads 6pt on each side.
+        self.frame_height = self.page_height - self.margin - self.bottom_margin - 12
 
         # Build styles
         self.styles = self._create_styles()
@@ -170,7 +227,7 @@ class ProfilePDFGenerator:
 
         styles.add(ParagraphStyle(
             name='Normal',
-            fontName='Helvetica',
+            fontName=self.fonts.regular,
             fontSize=10.1,
             leading=14.8,
             textColor=self.palette["text_secondary"],
@@ -182,7 +239,7 @@ class ProfilePDFGenerator:
             fontSize=8.7,
             leading=10.2,
             textColor=self.palette["text_muted"],
-            fontName='Helvetica-Bold',
+            fontName=self.fonts.bold,
             spaceAfter=3,
         ))
 
@@ -191,7 +248,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=22.5,
             leading=26.2,
-            fontName='Helvetica-Bold',
+            fontName=self.fonts.bold,
             textColor=self.palette["brand_primary"],
             spaceAfter=1,
         ))
@@ -201,7 +258,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=8.7,
             leading=11.2,
-            fontName='Helvetica',
+            fontName=self.fonts.regular,
             alignment=TA_RIGHT,
             textColor=self.palette["text_muted"],
         ))
@@ -211,7 +268,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=25,
             leading=28.6,
-            fontName='Helvetica-Bold',
+            fontName=self.fonts.bold,
             textColor=self.palette["text_primary"],
             spaceAfter=2,
         ))
@@ -221,7 +278,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=12.2,
             leading=16.8,
-            fontName='Helvetica',
+            fontName=self.fonts.regular,
             textColor=self.palette["brand_primary"],
             spaceAfter=12,
         ))
@@ -231,7 +288,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=10.4,
             leading=13,
-            fontName='Helvetica-Bold',
+            fontName=self.fonts.bold,
             textColor=self.palette["brand_primary"],
             spaceBefore=20,
             spaceAfter=8,
@@ -243,7 +300,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=9,
             leading=11.2,
-            fontName='Helvetica-Bold',
+            fontName=self.fonts.bold,
             textColor=self.palette["text_muted"],
             spaceAfter=8,
         ))
@@ -253,7 +310,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=11.5,
             leading=14.6,
-            fontName='Helvetica-Bold',
+            fontName=self.fonts.bold,
             textColor=self.palette["text_primary"],
             spaceAfter=3,
             keepWithNext=True,
@@ -264,7 +321,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=9.2,
             leading=12.8,
-            fontName='Helvetica',
+            fontName=self.fonts.regular,
             textColor=self.palette["text_muted"],
             spaceAfter=6,
         ))
@@ -274,7 +331,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=10,
             leading=14.6,
-            fontName='Helvetica',
+            fontName=self.fonts.regular,
             textColor=self.palette["text_secondary"],
             alignment=TA_JUSTIFY,
             spaceAfter=7,
@@ -285,7 +342,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=9.6,
             leading=13.3,
-            fontName='Helvetica',
+            fontName=self.fonts.regular,
             textColor=self.palette["text_secondary"],
             spaceAfter=5,
         ))
@@ -295,7 +352,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=10.2,
             leading=15.2,
-            fontName='Helvetica-Oblique',
+            fontName=self.fonts.italic,
             textColor=self.palette["text_secondary"],
             leftIndent=10,
             rightIndent=8,
@@ -307,7 +364,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=8.8,
             leading=11.2,
-            fontName='Helvetica-Bold',
+            fontName=self.fonts.bold,
             textColor=self.palette["text_muted"],
         ))
 
@@ -316,7 +373,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=9.8,
             leading=13.3,
-            fontName='Helvetica',
+            fontName=self.fonts.regular,
             textColor=self.palette["text_secondary"],
             alignment=TA_LEFT,
         ))
@@ -326,7 +383,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=8.5,
             leading=10.6,
-            fontName='Helvetica',
+            fontName=self.fonts.regular,
             textColor=self.palette["text_secondary"],
             alignment=TA_CENTER,
         ))
@@ -336,7 +393,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=8.4,
             leading=10,
-            fontName='Helvetica-Bold',
+            fontName=self.fonts.bold,
             textColor=self.palette["brand_primary"],
             alignment=TA_CENTER,
         ))
@@ -346,7 +403,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=8.2,
             leading=10.2,
-            fontName='Helvetica',
+            fontName=self.fonts.regular,
             textColor=self.palette["text_secondary"],
         ))
 
@@ -355,7 +412,7 @@ class ProfilePDFGenerator:
             parent=styles['Normal'],
             fontSize=8.5,
             leading=10.6,
-            fontName='Helvetica',
+            fontName=self.fonts.regular,
             textColor=self.palette["text_secondary"],
             alignment=TA_LEFT,
         ))
@@ -385,7 +442,7 @@ class ProfilePDFGenerator:
         footer_left = f"{footer_brand} | Consultant Profile"
 
         canv.setFillColor(self.palette["text_muted"])
-        canv.setFont("Helvetica", 8.2)
+        canv.setFont(self.fonts.regular, 8.2)
         canv.drawString(doc.leftMargin, doc.bottomMargin - 0.34 * inch, footer_left[:110])
         canv.drawRightString(
             self.page_width - doc.rightMargin,
@@ -478,10 +535,29 @@ class ProfilePDFGenerator:
         general = self.profile_data.get('general_customizations', {})
 
         name = f"{consultant.get('first_name', '')} {consultant.get('last_name', '')}".strip()
+        identity = []
         if name:
-            self.story.append(Paragraph(escape_xml(name), self.styles['ConsultantName']))
+            identity.append(Paragraph(escape_xml(name), self.styles['ConsultantName']))
         if consultant.get('title'):
-            self.story.append(Paragraph(escape_xml(consultant['title']), self.styles['ConsultantTitle']))
+            identity.append(Paragraph(escape_xml(consultant['title']), self.styles['ConsultantTitle']))
+
+        if self.photo_path:
+            photo = Image(self.photo_path, width=PHOTO_DISPLAY_SIZE, height=PHOTO_DISPLAY_SIZE)
+            photo_column_width = PHOTO_DISPLAY_SIZE + 0.18 * inch
+            identity_table = Table(
+                [[photo, identity]],
+                colWidths=[photo_column_width, self.content_width - photo_column_width],
+            )
+            identity_table.setStyle(TableStyle([
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+                ('LEFTPADDING', (0, 0), (-1, -1), 0),
+                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+                ('TOPPADDING', (0, 0), (-1, -1), 0),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ]))
+            self.story.append(identity_table)
+        else:
+            self.story.extend(identity)
 
         facts = []
         if general.get('role'):
@@ -533,7 +609,7 @@ class ProfilePDFGenerator:
         description: Optional[str] = None,
         detail_lines: Optional[list[str]] = None,
     ):
-        """Create a card-like block and keep it intact on one page when possible."""
+        """Create a card-like block; sections wrap it in KeepTogether to keep it on one page when possible."""
         block = [Paragraph(escape_xml(title), self.styles['EntryTitle'])]
 
         if metadata:
@@ -549,7 +625,8 @@ class ProfilePDFGenerator:
                 if line:
                     block.append(Paragraph(line, self.styles['DetailLine']))
 
-        card = Table([[block]], colWidths=[self.content_width])
+        # splitInRow lets entries taller than a page (long descriptions) continue on the next page.
+        card = Table([[block]], colWidths=[self.content_width], splitInRow=1)
         card.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, -1), self.palette["surface"]),
             ('BOX', (0, 0), (-1, -1), 0.65, self.palette["divider"]),
@@ -559,52 +636,46 @@ class ProfilePDFGenerator:
             ('RIGHTPADDING', (0, 0), (-1, -1), 10),
             ('VALIGN', (0, 0), (-1, -1), 'TOP'),
         ]))
-        return KeepTogether([card, Spacer(1, 0.08 * inch)])
+        return [card, Spacer(1, 0.08 * inch)]
+
+    def _project_entry(self, project: dict) -> list:
+        """Build the entry card of one project."""
+        metadata = []
+        if project.get('client_name'):
+            metadata.append(f"Client: {project['client_name']}")
+        if project.get('role'):
+            metadata.append(f"Role: {project['role']}")
+
+        duration = self._format_project_duration(project)
+        if duration:
+            metadata.append(f"Timeline: {duration}")
+
+        details = []
+        technologies = parse_list_like(project.get('technologies'))
+        if technologies:
+            details.append(
+                f"<b>Technologies:</b> {escape_xml(', '.join(technologies))}"
+            )
 
-    def _add_projects(self):
-        """Add professional experience section."""
-        projects = self.profile_data.get('blocks_by_type', {}).get('project', [])
-        if not projects:
-            return
+        return self._build_entry_block(
+            title=project.get('title', 'Untitled Project'),
+            metadata=metadata,
+            description=project.get('description'),
+            detail_lines=details,
+        )
 
+    def _add_projects(self, projects: list[dict]):
+        """Add professional experience section."""
         self._add_section_header('Professional Experience')
 
         for project in projects:
-            metadata = []
-            if project.get('client_name'):
-                metadata.append(f"Client: {project['client_name']}")
-            if project.get('role'):
-                metadata.append(f"Role: {project['role']}")
-
-            duration = self._format_project_duration(project)
-            if duration:
-                metadata.append(f"Timeline: {duration}")
-
-            details = []
-            technologies = parse_list_like(project.get('technologies'))
-            if technologies:
-                details.append(
-                    f"<b>Technologies:</b> {escape_xml(', '.join(technologies))}"
-                )
+            self.story.append(KeepTogether(self._project_entry(project)))
 
-            self.story.append(
-                self._build_entry_block(
-                    title=project.get('title', 'Untitled Project'),
-                    metadata=metadata,
-                    description=project.get('description'),
-                    detail_lines=details,
-                )
-            )
-
-    def _add_skills(self):
+    def _add_skills(self, skills: list[dict]):
         """Add skills section as a proficiency-sorted list inside a compact grid."""
-        skills = self.profile_data.get('blocks_by_type', {}).get('skill', [])
-        if not skills:
-            return
-
         self._add_section_header('Skills Overview')
 
-        level_order = ['Expert', 'Advanced', 'Proficient', 'Basic']
+        level_order = SKILL_DISPLAY_LEVELS
         level_colors = {
             'Expert': '#009E73',
             'Advanced': '#0072B2',
@@ -612,23 +683,11 @@ class ProfilePDFGenerator:
             'Basic': '#7A7A7A',
         }
 
-        def normalize_level(raw_level: Optional[str]) -> str:
-            text = str(raw_level or '').strip().lower()
-            if not text:
-                return 'Proficient'
-            if any(token in text for token in ('expert', 'master', 'principal', 'lead')):
-                return 'Expert'
-            if any(token in text for token in ('advanced', 'senior')):
-                return 'Advanced'
-            if any(token in text for token in ('basic', 'beginner', 'novice', 'junior')):
-                return 'Basic'
-            return 'Proficient'
-
         level_rank = {level: index for index, level in enumerate(level_order)}
         skill_entries = []
         for skill in skills:
             title = str(skill.get('title') or 'Skill').strip() or 'Skill'
-            normalized_level = normalize_level(skill.get('level'))
+            normalized_level = display_skill_level(skill.get('level'))
             skill_entries.append((title, normalized_level))
 
         skill_entries.sort(key=lambda entry: (level_rank[entry[1]], entry[0].lower()))
@@ -725,65 +784,111 @@ class ProfilePDFGenerator:
         self.story.append(skills_grid)
         self.story.append(Spacer(1, 0.06 * inch))
 
-    def _add_misc(self):
-        """Add miscellaneous section for talks, blogs, websites, and similar items."""
-        misc_blocks = self.profile_data.get('blocks_by_type', {}).get('misc', [])
-        if not misc_blocks:
-            return
+    def _misc_entry(self, item: dict) -> list:
+        """Build the entry card of one miscellaneous item."""
+        return self._build_entry_block(
+            title=item.get('title', 'Additional Item'),
+            description=item.get('content'),
+        )
 
+    def _add_misc(self, misc_blocks: list[dict]):
+        """Add miscellaneous section for talks, blogs, websites, and similar items."""
         self._add_section_header('Additional Highlights')
 
         for item in misc_blocks:
-            self.story.append(
-                self._build_entry_block(
-                    title=item.get('title', 'Additional Item'),
-                    description=item.get('content'),
-                )
-            )
+            self.story.append(KeepTogether(self._misc_entry(item)))
+
+    def _certification_entry(self, cert: dict) -> list:
+        """Build the entry card of one certification."""
+        metadata = []
+        if cert.get('issuing_organization'):
+            metadata.append(f"Issuer: {cert['issuing_organization']}")
+        if cert.get('issue_date'):
+            issue_date = format_display_date(cert.get('issue_date'))
+            if issue_date:
+                metadata.append(f"Issued: {issue_date}")
+        if cert.get('expiry_date'):
+            expiry_date = format_display_date(cert.get('expiry_date'))
+            if expiry_date:
+                metadata.append(f"Expires: {expiry_date}")
+
+        details = []
+        if cert.get('credential_id'):
+            details.append(f"<b>Credential ID:</b> {escape_xml(str(cert['credential_id']))}")
+        if cert.get('credential_url'):
+            details.append(f"<b>Credential URL:</b> {escape_xml(str(cert['credential_url']))}")
+
+        return self._build_entry_block(
+            title=cert.get('title', 'Certification'),
+            metadata=metadata,
+            detail_lines=details,
+        )
 
-    def _add_certifications(self):
+    def _add_certifications(self, certs: list[dict]):
         """Add certifications section."""
-        certs = self.profile_data.get('blocks_by_type', {}).get('certification', [])
-        if not certs:
-            return
-
         self._add_section_header('Certifications')
 
         for cert in certs:
-            metadata = []
-            if cert.get('issuing_organization'):
-                metadata.append(f"Issuer: {cert['issuing_organization']}")
-            if cert.get('issue_date'):
-                issue_date = format_display_date(cert.get('issue_date'))
-                if issue_date:
-                    metadata.append(f"Issued: {issue_date}")
-            if cert.get('expiry_date'):
-                expiry_date = format_display_date(cert.get('expiry_date'))
-                if expiry_date:
-                    metadata.append(f"Expires: {expiry_date}")
-
-            details = []
-            if cert.get('credential_id'):
-                details.append(f"<b>Credential ID:</b> {escape_xml(str(cert['credential_id']))}")
-            if cert.get('credential_url'):
-                details.append(f"<b>Credential URL:</b> {escape_xml(str(cert['credential_url']))}")
-
-            self.story.append(
-                self._build_entry_block(
-                    title=cert.get('title', 'Certification'),
-                    metadata=metadata,
-                    detail_lines=details,
-                )
+            self.story.append(KeepTogether(self._certification_entry(cert)))
+
+    def measure(self) -> ProfileLayout:
+        """Measure the intro, section and per-block heights of the profile without rendering it."""
+        canvas = Canvas(io.BytesIO())
+
+        def height(flowables: list) -> float:
+            return sum(
+                flowable.wrapOn(canvas, self.content_width, self.frame_height)[1]
+                + flowable.getSpaceBefore()
+                + flowable.getSpaceAfter()
+                for flowable in flowables
             )
 
+        self.story = []
+        self._add_header()
+        self._add_consultant_summary()
+        intro_height = height(self.story)
+
+        section_heights: dict[str, float] = {}
+        block_heights: dict[int, float] = {}
+        block_types: dict[int, str] = {}
+        blocks_by_type = self.profile_data.get('blocks_by_type', {})
+        for block_type in BLOCK_TYPES.values():
+            blocks = blocks_by_type.get(block_type.name)
+            if not blocks:
+                continue
+            render = getattr(self, block_type.pdf_renderer)
+            self.story = []
+            render(blocks[:1])
+            if block_type.pdf_entry:
+                # Section chrome around the cards; each card is measured on its own.
+                section_heights[block_type.name] = height(
+                    [flowable for flowable in self.story if not isinstance(flowable, KeepTogether)]
+                )
+                entry = getattr(self, block_type.pdf_entry)
+                heights = [height(entry(block)) for block in blocks]
+            else:
+                first_section = height(self.story)
+                self.story = []
+                render(blocks)
+                share = (height(self.story) - first_section) / (len(blocks) - 1) if len(blocks) > 1 else 0.0
+                heights = [share] * len(blocks)
+                section_heights[block_type.name] = first_section - share
+            for block, block_height in zip(blocks, heights):
+                block_heights[block["id"]] = block_height
+                block_types[block["id"]] = block_type.name
+
+        self.story = []
+        return ProfileLayout(self.frame_height, intro_height, section_heights, block_heights, block_types)
+
     def generate(self) -> bytes:
         """Generate the PDF and return as bytes."""
         self._add_header()
         self._add_consultant_summary()
-        self._add_projects()
-        self._add_skills()
-        self._add_certifications()
-        self._add_misc()
+        blocks_by_type = self.profile_data.get('blocks_by_type', {})
+        for block_type in BLOCK_TYPES.values():
+            blocks = blocks_by_type.get(block_type.name)
+            if blocks:
+                getattr(self, block_type.pdf_renderer)(blocks)
 
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(
@@ -792,7 +897,7 @@ class ProfilePDFGenerator:
             leftMargin=self.margin,
             rightMargin=self.margin,
             topMargin=self.margin,
-            bottomMargin=self.margin + 0.16 * inch,
+            bottomMargin=self.bottom_margin,
             title=f"Profile - {self.profile_data.get('consultant', {}).get('first_name', 'Consultant')}",
             author=self.company_name or "Profile Export",
         )
@@ -826,16 +931,19 @@ def export_profile_to_pdf(
     if isinstance(profile_data, str):
         profile_data = json.loads(profile_data)
 
+    consultant = profile_data.get('consultant', {})
+    photo_path = photo_service.resolve_photo_variant(consultant.get('photo_url'), "pdf")
+
     generator = ProfilePDFGenerator(
         profile_data=profile_data,
         company_name=company_name,
         accent_color=accent_color,
+        photo_path=str(photo_path) if photo_path else None,
     )
 
     pdf_bytes = generator.generate()
 
     # Generate filename
-    consultant = profile_data.get('consultant', {})
     consultant_name = f"{consultant.get('first_name', '')} {consultant.get('last_name', '')}".strip()
 
     if consultant_name:
@@ -844,3 +952,66 @@ def export_profile_to_pdf(
         filename = "consultant_profile.pdf"
 
     return pdf_bytes, filename
+
+
+def measure_profile_layout(profile_data: dict) -> ProfileLayout:
+    """Measure a profile snapshot laid out as ``export_profile_to_pdf`` renders it."""
+    consultant = profile_data.get('consultant', {})
+    photo_path = photo_service.resolve_photo_variant(consultant.get('photo_url'), "pdf")
+    generator = ProfilePDFGenerator(profile_data=profile_data, photo_path=str(photo_path) if photo_path else None)
+    return generator.measure()
+
+
+def build_render_key(
+    profile_data: dict | str,
+    company_name: Optional[str] = None,
+    accent_color: Optional[str] = DEFAULT_ACCENT_COLOR,
+    template: str = "default",
+    snapshot_key: Optional[str] = None,
+) -> str:
+    """Return a stable hash identifying one PDF rendering of a profile snapshot.
+
+    A stored snapshot's key (see ``profile_service.snapshot_key``) stands in for its
+    text, which then is not rehashed.
+    """
+    if snapshot_key:
+        snapshot_text = snapshot_key
+    elif isinstance(profile_data, str):
+        snapshot_text = profile_data
+    else:
+        snapshot_text = json.dumps(profile_data, sort_keys=True, separators=(",", ":"), default=str)
+
+    options = json.dumps(
+        [company_name or "", (accent_color or DEFAULT_ACCENT_COLOR).upper(), template],
+        separators=(",", ":"),
+    )
+    hasher = hashlib.sha256()
+    hasher.update(snapshot_text.encode("utf-8"))
+    hasher.update(b"\0")
+    hasher.update(options.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+async def export_profile_to_pdf_shared(
+    profile_data: dict | str,
+    company_name: Optional[str] = None,
+    accent_color: Optional[str] = DEFAULT_ACCENT_COLOR,
+    template: str = "default",
+    snapshot_key: Optional[str] = None,
+) -> tuple[bytes, str]:
+    """
+    Export profile to PDF, coalescing identical concurrent requests into one render.
+
+    The render runs in the threadpool so waiting requests do not block the event loop.
+    """
+    render_key = build_render_key(profile_data, company_name, accent_color, template, snapshot_key)
+    return await export_render_flight.run(
+        render_key,
+        lambda: run_in_threadpool(
+            export_profile_to_pdf,
+            profile_data=profile_data,
+            company_name=company_name,
+            accent_color=accent_color,
+            template=template,
+        ),
+    )
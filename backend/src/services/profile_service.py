@@ -1,87 +1,34 @@
+import hashlib
 import json
 import sqlite3
 from datetime import datetime, timezone
+from typing import Sequence
 
 from ..core.database import dict_from_row, list_from_rows
 from ..schemas.profile import ProfileCreate, ProfileUpdate
+from .block_types import BLOCK_TYPES
 from .consultant_service import get_consultant
 
 
-def _utc_now_iso() -> str:
-    """Return current UTC timestamp as ISO string."""
-    return datetime.now(timezone.utc).isoformat()
-
-
-def _parse_json_array(value: str | None) -> list[str]:
-    """Parse JSON list values safely and return an empty list for invalid payloads."""
-    if not value:
-        return []
-
-    try:
-        parsed = json.loads(value)
-    except (json.JSONDecodeError, TypeError):
-        return []
-
-    if isinstance(parsed, list):
-        return [str(item) for item in parsed]
-    return []
-
-
-def _parse_list_like(value: str | list[str] | None) -> list[str]:
-    """Parse list-like customization values (list, JSON string, comma-separated string)."""
-    if value is None:
-        return []
-
-    if isinstance(value, list):
-        return [str(item).strip() for item in value if str(item).strip()]
-
-    if isinstance(value, str):
-        stripped = value.strip()
-        if not stripped:
-            return []
-
-        looks_like_json_array = stripped.startswith("[") and stripped.endswith("]")
-        if looks_like_json_array:
-            try:
-                parsed_json = json.loads(stripped)
-            except (json.JSONDecodeError, TypeError):
-                parsed_json = None
-
-            if isinstance(parsed_json, list):
-                return [str(item).strip() for item in parsed_json if str(item).strip()]
-            if parsed_json is not None:
-                return []
+# Columns served by profile listings in summary view; covered by the summary indexes.
+PROFILE_SUMMARY_COLUMNS = (
+    "id, consultant_id, profile_name, created_by_admin_id, created_at, updated_at, block_count, block_type_counts"
+)
 
-        if "," in stripped:
-            return [item.strip() for item in stripped.split(",") if item.strip()]
-        return [stripped]
+# Snapshot content lives in profile_snapshots under its hash, stored once however many
+# profiles share it; the generation time stays on the profile so it does not make every
+# snapshot unique. Reads join both back into ``profile_data``, filling the stored
+# ``generated_at`` placeholder in place so keys keep the order they were built in (that of
+# the first snapshot stored with the content; clients must not rely on key order).
+# SQLite drops the join when no snapshot column is selected.
+PROFILE_SOURCE = "profiles LEFT JOIN profile_snapshots ON profile_snapshots.hash = profiles.snapshot_hash"
+PROFILE_DATA = "json_set(profile_snapshots.data, '$.generated_at', profiles.generated_at) AS profile_data"
+PROFILE_COLUMNS = f"profiles.*, {PROFILE_DATA}"
 
-    return []
 
-
-def _parse_int(value: int | str | None) -> int | None:
-    """Parse integer-like customization values."""
-    if value is None or value == "":
-        return None
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return None
-
-
-def _parse_bool(value: bool | str | None, fallback: bool | None = None) -> bool | None:
-    """Parse boolean-like customization values with optional fallback."""
-    if value is None:
-        return fallback
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, str):
-        normalized = value.strip().lower()
-        if normalized in {"true", "1", "yes", "on"}:
-            return True
-        if normalized in {"false", "0", "no", "off"}:
-            return False
-    return fallback
+def _utc_now_iso() -> str:
+    """Return current UTC timestamp as ISO string."""
+    return datetime.now(timezone.utc).isoformat()
 
 
 def _get_customization_value(customization: dict, key: str, fallback):
@@ -97,69 +44,30 @@ def _normalize_selected_block_ids(block_ids: list[int]) -> list[int]:
 def serialize_block(block: dict, customization: dict | None = None) -> dict:
     """Convert a block row into profile snapshot format with optional customizations."""
     customization = customization or {}
-    base = {
+    serialized = {
         "id": block["id"],
         "title": customization.get("title") or block["title"],
         "block_type": block["block_type"],
     }
-
-    if block["block_type"] == "project":
-        if "technologies" in customization:
-            technologies = _parse_list_like(customization.get("technologies"))
-        else:
-            technologies = _parse_json_array(block.get("technologies"))
-
-        if "duration_months" in customization:
-            duration_months = _parse_int(customization.get("duration_months"))
+    block_type = BLOCK_TYPES.get(block["block_type"])
+    if block_type is None:
+        return serialized
+
+    for snapshot_field in block_type.snapshot_fields:
+        stored = block.get(snapshot_field.column)
+        if snapshot_field.key in customization:
+            value = customization[snapshot_field.key]
+            if snapshot_field.from_customization:
+                value = snapshot_field.from_customization(value, stored)
+        elif snapshot_field.from_column:
+            value = snapshot_field.from_column(stored)
         else:
-            duration_months = block.get("duration_months")
-
-        is_ongoing = _parse_bool(
-            _get_customization_value(customization, "is_ongoing", block.get("is_ongoing")),
-            block.get("is_ongoing"),
-        )
-        end_date = None if is_ongoing else _get_customization_value(
-            customization,
-            "end_date",
-            block.get("end_date"),
-        )
+            value = stored
+        serialized[snapshot_field.key] = value
 
-        return {
-            **base,
-            "client_name": _get_customization_value(customization, "client_name", block.get("client_name")),
-            "description": _get_customization_value(customization, "description", block.get("project_description")),
-            "role": _get_customization_value(customization, "role", block.get("role")),
-            "technologies": technologies,
-            "duration_months": duration_months,
-            "start_date": _get_customization_value(customization, "start_date", block.get("start_date")),
-            "end_date": end_date,
-            "is_ongoing": is_ongoing,
-        }
-    if block["block_type"] == "skill":
-        return {
-            **base,
-            "level": _get_customization_value(customization, "level", block.get("proficiency_level")),
-        }
-    if block["block_type"] == "misc":
-        return {
-            **base,
-            "content": _get_customization_value(customization, "content", block.get("misc_content")),
-        }
-    if block["block_type"] == "certification":
-        return {
-            **base,
-            "issuing_organization": _get_customization_value(
-                customization,
-                "issuing_organization",
-                block.get("issuing_organization"),
-            ),
-            "issue_date": _get_customization_value(customization, "issue_date", block.get("issue_date")),
-            "expiry_date": _get_customization_value(customization, "expiry_date", block.get("expiry_date")),
-            "credential_id": _get_customization_value(customization, "credential_id", block.get("credential_id")),
-            "credential_url": _get_customization_value(customization, "credential_url", block.get("credential_url")),
-        }
-
-    return base
+    if block_type.finalize:
+        block_type.finalize(serialized)
+    return serialized
 
 
 def _build_profile_snapshot(
@@ -222,6 +130,42 @@ def _build_profile_snapshot(
     return snapshot
 
 
+def _summarize_snapshot(snapshot: dict) -> tuple[int, str]:
+    """Derive the stored block count and per-type counts (JSON) from a snapshot."""
+    block_type_counts = {
+        block_type: len(blocks) for block_type, blocks in snapshot.get("blocks_by_type", {}).items()
+    }
+    return sum(block_type_counts.values()), json.dumps(block_type_counts)
+
+
+def _store_snapshot(conn: sqlite3.Connection, snapshot: dict) -> str:
+    """Store a snapshot unless its content is already stored, and return the content hash.
+
+    The hash covers canonical JSON (sorted keys, compact separators) of everything but
+    ``generated_at``, so equal content is stored once whatever its key order. Profile
+    triggers count the references and delete snapshots no profile uses.
+    """
+    content = {key: value for key, value in snapshot.items() if key != "generated_at"}
+    digest = hashlib.sha256(json.dumps(content, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+    conn.execute(
+        "INSERT INTO profile_snapshots (hash, data) VALUES (?, ?) ON CONFLICT(hash) DO NOTHING",
+        (digest, json.dumps({**snapshot, "generated_at": None}, separators=(",", ":"))),
+    )
+    return digest
+
+
+def snapshot_key(profile: dict) -> str:
+    """Identity of a profile's full snapshot: its content hash and generation time."""
+    return f"{profile['snapshot_hash']}@{profile['generated_at']}"
+
+
+def serialize_profile(profile: dict | None) -> dict | None:
+    """Convert a profile row to response format (block type counts decoded from JSON)."""
+    if profile and isinstance(profile.get("block_type_counts"), str):
+        profile["block_type_counts"] = json.loads(profile["block_type_counts"] or "{}")
+    return profile
+
+
 async def _get_consultant_blocks(
     conn: sqlite3.Connection,
     consultant_id: int,
@@ -233,7 +177,7 @@ async def _get_consultant_blocks(
 
     placeholders = ", ".join(["?"] * len(selected_block_ids))
     cursor = conn.execute(
-        f"SELECT * FROM blocks WHERE consultant_id = ? AND id IN ({placeholders})",
+        f"SELECT * FROM blocks WHERE consultant_id = ? AND is_active = 1 AND id IN ({placeholders})",
         [consultant_id, *selected_block_ids],
     )
     return list_from_rows(cursor.fetchall())
@@ -258,47 +202,81 @@ async def create_profile(conn: sqlite3.Connection, profile_data: ProfileCreate,
         general_customizations=profile_data.general_customizations.model_dump(),
     )
 
+    block_count, block_type_counts = _summarize_snapshot(profile_snapshot)
+
     cursor = conn.execute(
         """
-        INSERT INTO profiles (consultant_id, profile_name, selected_block_ids, profile_data, created_by_admin_id)
-        VALUES (?, ?, ?, ?, ?)
+        INSERT INTO profiles (
+            consultant_id, profile_name, selected_block_ids, snapshot_hash, generated_at, created_by_admin_id,
+            block_count, block_type_counts
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """,
         (
             profile_data.consultant_id,
             profile_name,
             json.dumps(selected_block_ids),
-            json.dumps(profile_snapshot),
+            _store_snapshot(conn, profile_snapshot),
+            profile_snapshot["generated_at"],
             admin_id,
+            block_count,
+            block_type_counts,
         ),
     )
-    profile_id = cursor.lastrowid
-    cursor = conn.execute("SELECT * FROM profiles WHERE id = ?", (profile_id,))
-    return dict_from_row(cursor.fetchone())
+    return await get_profile(conn, cursor.lastrowid)
 
 
-async def get_profile(conn: sqlite3.Connection, profile_id: int) -> dict | None:
-    """Get a profile by id."""
-    cursor = conn.execute("SELECT * FROM profiles WHERE id = ?", (profile_id,))
+async def get_profile(
+    conn: sqlite3.Connection, profile_id: int, columns: Sequence[str] | None = None
+) -> dict | None:
+    """Get a profile by id, optionally selecting only some columns."""
+    cursor = conn.execute(
+        f"SELECT {_profile_projection(False, columns)} FROM {PROFILE_SOURCE} WHERE profiles.id = ?",
+        (profile_id,),
+    )
     row = cursor.fetchone()
-    return dict_from_row(row)
+    return serialize_profile(dict_from_row(row))
+
+
+def _profile_projection(summary: bool, columns: Sequence[str] | None) -> str:
+    """Explicit columns win over the summary view; otherwise select every column and the snapshot."""
+    if columns:
+        return ", ".join(
+            PROFILE_DATA if column == "profile_data" else f'profiles."{column}"'
+            for column in columns
+        )
+    return PROFILE_SUMMARY_COLUMNS if summary else PROFILE_COLUMNS
 
 
-async def get_profiles(conn: sqlite3.Connection, skip: int = 0, limit: int = 100) -> list[dict]:
-    """Get all profiles ordered by latest creation timestamp."""
+async def get_profiles(
+    conn: sqlite3.Connection,
+    skip: int = 0,
+    limit: int = 100,
+    summary: bool = False,
+    columns: Sequence[str] | None = None,
+) -> list[dict]:
+    """Get all profiles ordered by latest creation timestamp (without snapshots when summary is set)."""
+    projection = _profile_projection(summary, columns)
     cursor = conn.execute(
-        "SELECT * FROM profiles ORDER BY created_at DESC LIMIT ? OFFSET ?",
+        f"SELECT {projection} FROM {PROFILE_SOURCE} ORDER BY created_at DESC LIMIT ? OFFSET ?",
         (limit, skip),
     )
-    return list_from_rows(cursor.fetchall())
+    return [serialize_profile(profile) for profile in list_from_rows(cursor.fetchall())]
 
 
-async def get_consultant_profiles(conn: sqlite3.Connection, consultant_id: int) -> list[dict]:
-    """Get all profiles for a consultant."""
+async def get_consultant_profiles(
+    conn: sqlite3.Connection,
+    consultant_id: int,
+    summary: bool = False,
+    columns: Sequence[str] | None = None,
+) -> list[dict]:
+    """Get all profiles for a consultant (without snapshots when summary is set)."""
+    projection = _profile_projection(summary, columns)
     cursor = conn.execute(
-        "SELECT * FROM profiles WHERE consultant_id = ? ORDER BY created_at DESC",
+        f"SELECT {projection} FROM {PROFILE_SOURCE} WHERE consultant_id = ? ORDER BY created_at DESC",
         (consultant_id,),
     )
-    return list_from_rows(cursor.fetchall())
+    return [serialize_profile(profile) for profile in list_from_rows(cursor.fetchall())]
 
 
 async def delete_profile(conn: sqlite3.Connection, profile_id: int) -> bool:
@@ -318,16 +296,14 @@ async def update_profile(
     _admin_id: int,
 ) -> dict | None:
     """Update an existing profile by rebuilding its snapshot data."""
-    cursor = conn.execute("SELECT * FROM profiles WHERE id = ?", (profile_id,))
-    existing = cursor.fetchone()
-    if not existing:
+    existing_dict = await get_profile(conn, profile_id, columns=("consultant_id",))
+    if not existing_dict:
         return None
 
     profile_name = profile_data.profile_name.strip()
     if not profile_name:
         raise ValueError("Profile name cannot be empty.")
 
-    existing_dict = dict_from_row(existing)
     consultant = await get_consultant(conn, existing_dict["consultant_id"])
     if not consultant:
         raise ValueError("Consultant not found.")
@@ -342,23 +318,29 @@ async def update_profile(
         general_customizations=profile_data.general_customizations.model_dump(),
     )
 
+    block_count, block_type_counts = _summarize_snapshot(profile_snapshot)
+
     conn.execute(
         """UPDATE profiles
            SET "profile_name" = ?,
                "selected_block_ids" = ?,
-               "profile_data" = ?,
+               "snapshot_hash" = ?,
+               generated_at = ?,
+               block_count = ?,
+               block_type_counts = ?,
                updated_at = CURRENT_TIMESTAMP
            WHERE id = ?""",
         (
             profile_name,
             json.dumps(selected_block_ids),
-            json.dumps(profile_snapshot),
+            _store_snapshot(conn, profile_snapshot),
+            profile_snapshot["generated_at"],
+            block_count,
+            block_type_counts,
             profile_id,
         ),
     )
-
-    cursor = conn.execute("SELECT * FROM profiles WHERE id = ?", (profile_id,))
-    return dict_from_row(cursor.fetchone())
+    return await get_profile(conn, profile_id)
 
 
 async def duplicate_profile(
@@ -367,7 +349,7 @@ async def duplicate_profile(
     new_profile_name: str,
     admin_id: int,
 ) -> dict | None:
-    """Duplicate an existing profile with a new profile name."""
+    """Duplicate an existing profile with a new profile name, sharing its stored snapshot."""
     cleaned_profile_name = new_profile_name.strip()
     if not cleaned_profile_name:
         raise ValueError("Profile name cannot be empty.")
@@ -380,17 +362,21 @@ async def duplicate_profile(
     original_dict = dict_from_row(original)
     cursor = conn.execute(
         """
-        INSERT INTO profiles (consultant_id, profile_name, selected_block_ids, profile_data, created_by_admin_id)
-        VALUES (?, ?, ?, ?, ?)
+        INSERT INTO profiles (
+            consultant_id, profile_name, selected_block_ids, snapshot_hash, generated_at, created_by_admin_id,
+            block_count, block_type_counts
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """,
         (
             original_dict["consultant_id"],
             cleaned_profile_name,
             original_dict["selected_block_ids"],
-            original_dict["profile_data"],
+            original_dict["snapshot_hash"],
+            original_dict["generated_at"],
             admin_id,
+            original_dict["block_count"],
+            original_dict["block_type_counts"],
         ),
     )
-    new_profile_id = cursor.lastrowid
-    cursor = conn.execute("SELECT * FROM profiles WHERE id = ?", (new_profile_id,))
-    return dict_from_row(cursor.fetchone())
+    return await get_profile(conn, cursor.lastrowid)
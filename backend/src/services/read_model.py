@@ -0,0 +1,224 @@
+"""Opt-in in-process read model for consultants and their blocks.
+
+When ``READ_MODEL_ENABLED`` is set, consultants and active blocks are loaded
+into memory at startup and every committed mutation from the service layer is
+applied incrementally. Read endpoints are then served without touching SQLite.
+The model also counts writes per resource version scope, so conditional GETs
+of the data it serves need no database lookup either.
+
+The model is per process: only enable it when a single worker owns all writes.
+"""
+
+import sqlite3
+import threading
+import time
+from bisect import insort
+
+from ..core.database import list_from_rows, on_commit
+from .version_service import CONSULTANTS_SCOPE, consultant_blocks_scope, consultant_scope
+
+
+def _consultant_sort_key(consultant: dict) -> tuple:
+    return (str(consultant.get("created_at") or ""), consultant["id"])
+
+
+def _sort_blocks(blocks: list[dict]) -> None:
+    """Sort in place like ``ORDER BY "order", created_at DESC``."""
+    blocks.sort(key=lambda block: (str(block.get("created_at") or ""), block["id"]), reverse=True)
+    blocks.sort(key=lambda block: block.get("order") or 0)
+
+
+class ReadModel:
+    """In-memory copy of consultants and active blocks, kept current by service hooks.
+
+    Stored dicts are shared with callers and must be treated as read-only.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.RLock()
+        self._consultants: dict[int, dict] = {}
+        # Ascending by (created_at, id); listings read it back to front.
+        self._consultant_order: list[tuple] = []
+        self._blocks: dict[int, dict] = {}
+        self._blocks_by_consultant: dict[int, list[dict]] = {}
+        # Writes seen per version scope since the last load, which ``_generation`` identifies.
+        self._versions: dict[str, int] = {}
+        self._generation = ""
+
+    def load(self, conn: sqlite3.Connection) -> None:
+        """Replace the model contents with the current database state and enable it."""
+        # Imported here: consultant_service reports its mutations to this module.
+        from .consultant_service import serialize_consultant
+
+        consultants = [serialize_consultant(row) for row in list_from_rows(
+            conn.execute("SELECT * FROM consultants").fetchall()
+        )]
+        blocks = list_from_rows(conn.execute("SELECT * FROM blocks WHERE is_active = 1").fetchall())
+
+        blocks_by_consultant: dict[int, list[dict]] = {}
+        for block in blocks:
+            blocks_by_consultant.setdefault(block["consultant_id"], []).append(block)
+        for consultant_blocks in blocks_by_consultant.values():
+            _sort_blocks(consultant_blocks)
+
+        with self._lock:
+            self._consultants = {consultant["id"]: consultant for consultant in consultants}
+            self._consultant_order = sorted(_consultant_sort_key(consultant) for consultant in consultants)
+            self._blocks = {block["id"]: block for block in blocks}
+            self._blocks_by_consultant = blocks_by_consultant
+            self._versions = {}
+            self._generation = f"{time.time_ns():x}"
+            self.enabled = True
+
+    # Reads
+
+    def version(self, scope: str) -> str:
+        """Version of a scope's data in this model; counts restart at each load under a new generation."""
+        with self._lock:
+            return f"{self._generation}.{self._versions.get(scope, 0)}"
+
+    def get_consultant(self, consultant_id: int) -> dict | None:
+        return self._consultants.get(consultant_id)
+
+    def list_consultants(self, skip: int = 0, limit: int = 100) -> list[dict]:
+        """Return consultants newest first, matching ``get_consultants`` pagination."""
+        with self._lock:
+            total = len(self._consultant_order)
+            stop = max(total - skip, 0)
+            start = max(stop - limit, 0)
+            keys = self._consultant_order[start:stop]
+            return [self._consultants[consultant_id] for _, consultant_id in reversed(keys)]
+
+    def get_consultant_blocks(self, consultant_id: int, block_type: str | None = None) -> list[dict]:
+        blocks = self._blocks_by_consultant.get(consultant_id, [])
+        if block_type:
+            return [block for block in blocks if block["block_type"] == block_type]
+        return list(blocks)
+
+    # Mutations (applied after commit)
+
+    def put_consultant(self, consultant: dict) -> None:
+        with self._lock:
+            previous = self._consultants.get(consultant["id"])
+            if previous is not None:
+                self._consultant_order.remove(_consultant_sort_key(previous))
+            self._consultants[consultant["id"]] = consultant
+            insort(self._consultant_order, _consultant_sort_key(consultant))
+            self._bump(CONSULTANTS_SCOPE, consultant_scope(consultant["id"]))
+
+    def remove_consultant(self, consultant_id: int) -> None:
+        with self._lock:
+            previous = self._consultants.pop(consultant_id, None)
+            if previous is not None:
+                self._consultant_order.remove(_consultant_sort_key(previous))
+            for block in self._blocks_by_consultant.pop(consultant_id, []):
+                self._blocks.pop(block["id"], None)
+            self._bump(CONSULTANTS_SCOPE, consultant_scope(consultant_id), consultant_blocks_scope(consultant_id))
+
+    def put_block(self, block: dict) -> None:
+        with self._lock:
+            self._discard_block(block["id"])
+            if block.get("is_active", True):
+                self._blocks[block["id"]] = block
+                consultant_blocks = self._blocks_by_consultant.setdefault(block["consultant_id"], [])
+                consultant_blocks.append(block)
+                _sort_blocks(consultant_blocks)
+            self._bump(consultant_blocks_scope(block["consultant_id"]))
+
+    def remove_block(self, block_id: int) -> None:
+        with self._lock:
+            previous = self._discard_block(block_id)
+            if previous is not None:
+                self._bump(consultant_blocks_scope(previous["consultant_id"]))
+
+    def set_block_orders(self, consultant_id: int, changes: dict[int, dict]) -> None:
+        """Apply a reorder (new ``order`` and ``updated_at`` per block id) without re-reading rows."""
+        with self._lock:
+            consultant_blocks = self._blocks_by_consultant.get(consultant_id, [])
+            for index, block in enumerate(consultant_blocks):
+                if block["id"] in changes:
+                    updated = {**block, **changes[block["id"]]}
+                    consultant_blocks[index] = updated
+                    self._blocks[block["id"]] = updated
+            _sort_blocks(consultant_blocks)
+            self._bump(consultant_blocks_scope(consultant_id))
+
+    def _discard_block(self, block_id: int) -> dict | None:
+        previous = self._blocks.pop(block_id, None)
+        if previous is None:
+            return None
+        consultant_blocks = self._blocks_by_consultant.get(previous["consultant_id"], [])
+        consultant_blocks[:] = [block for block in consultant_blocks if block["id"] != block_id]
+        return previous
+
+    def _bump(self, *scopes: str) -> None:
+        # Called after the data changed, so a reader never pairs a newer version with older data.
+        for scope in scopes:
+            self._versions[scope] = self._versions.get(scope, 0) + 1
+
+    # Verification
+
+    def check_consistency(self, conn: sqlite3.Connection) -> dict:
+        """Compare the model against the database and report differing ids."""
+        from .consultant_service import serialize_consultant
+
+        db_consultants = {
+            row["id"]: serialize_consultant(row)
+            for row in list_from_rows(conn.execute("SELECT * FROM consultants").fetchall())
+        }
+        db_blocks = {
+            row["id"]: row
+            for row in list_from_rows(conn.execute("SELECT * FROM blocks WHERE is_active = 1").fetchall())
+        }
+        with self._lock:
+            consultants = dict(self._consultants)
+            blocks = dict(self._blocks)
+
+        report = {
+            "enabled": self.enabled,
+            "consultants": _diff_ids(db_consultants, consultants),
+            "blocks": _diff_ids(db_blocks, blocks),
+        }
+        report["consistent"] = not any(
+            ids for section in ("consultants", "blocks") for ids in report[section].values()
+        )
+        return report
+
+
+def _diff_ids(expected: dict[int, dict], actual: dict[int, dict]) -> dict[str, list[int]]:
+    return {
+        "missing": sorted(expected.keys() - actual.keys()),
+        "unexpected": sorted(actual.keys() - expected.keys()),
+        "stale": sorted(key for key in expected.keys() & actual.keys() if expected[key] != actual[key]),
+    }
+
+
+consultant_read_model = ReadModel()
+
+
+# Service-layer hooks: no-ops unless the read model is enabled.
+
+def record_consultant(conn: sqlite3.Connection, consultant: dict) -> None:
+    if consultant_read_model.enabled:
+        on_commit(conn, lambda: consultant_read_model.put_consultant(consultant))
+
+
+def record_consultant_deleted(conn: sqlite3.Connection, consultant_id: int) -> None:
+    if consultant_read_model.enabled:
+        on_commit(conn, lambda: consultant_read_model.remove_consultant(consultant_id))
+
+
+def record_block(conn: sqlite3.Connection, block: dict) -> None:
+    if consultant_read_model.enabled:
+        on_commit(conn, lambda: consultant_read_model.put_block(block))
+
+
+def record_block_deleted(conn: sqlite3.Connection, block_id: int) -> None:
+    if consultant_read_model.enabled:
+        on_commit(conn, lambda: consultant_read_model.remove_block(block_id))
+
+
+def record_block_orders(conn: sqlite3.Connection, consultant_id: int, changes: dict[int, dict]) -> None:
+    if consultant_read_model.enabled:
+        on_commit(conn, lambda: consultant_read_model.set_block_orders(consultant_id, changes))
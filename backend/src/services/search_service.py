@@ -0,0 +1,153 @@
+"""Full-text search over consultants and blocks (SQLite FTS5).
+
+``block_search`` and ``consultant_search`` are external-content FTS5 tables
+kept in sync by triggers (migration 010), so every write path is covered
+without service hooks; only active blocks are indexed. Results are ordered by
+BM25 with per-column weights (titles and names count most) and carry an
+HTML-escaped snippet with the matched terms wrapped in ``<mark>``.
+
+BM25 scores every match before the best can be picked, so a broad query (a
+very common word or short prefix) costs time in proportion to its matches.
+Queries matching more than ``RANK_WINDOW`` rows are ranked within their most
+recent ``RANK_WINDOW`` matches instead, found by walking the index in
+descending rowid order. A block type filter applies to that walk too, so a rare
+type is not pushed out of the window by matches of other types.
+"""
+
+import html
+import re
+import sqlite3
+from typing import Iterable, Sequence
+
+from ..core.database import list_from_rows
+from .block_types import BLOCK_TYPES
+
+SEARCH_KINDS = ("consultant", *BLOCK_TYPES)
+
+# BM25 column weights, in the column order of the FTS tables (migration 010).
+BLOCK_WEIGHTS = (10.0, 5.0, 1.0, 2.0, 1.0)  # title, client_name, project_description, issuing_organization, misc_content
+CONSULTANT_WEIGHTS = (10.0, 10.0, 5.0, 2.0, 1.0)  # first_name, last_name, title, role, summary
+
+# Most recent matches ranked for broad queries.
+RANK_WINDOW = 5_000
+
+# Words kept around each match in snippets.
+SNIPPET_TOKENS = 12
+
+# Snippet markers that cannot appear in stored text; swapped for <mark> after escaping.
+_MATCH_START, _MATCH_END = "\x02", "\x03"
+_QUERY_TOKENS = re.compile(r'"([^"]*)"|(\S+)')
+_WORD = re.compile(r"\w")
+
+
+def build_match_query(text: str) -> str:
+    """Translate user input into an FTS5 query: all words must match, "quoted phrases" and word* prefixes."""
+    parts = []
+    for phrase, word in _QUERY_TOKENS.findall(text):
+        prefix = not phrase and word.endswith("*")
+        term = phrase or word.rstrip("*")
+        if not _WORD.search(term):
+            continue
+        quoted = '"' + term.replace('"', "") + '"'
+        parts.append(quoted + "*" if prefix else quoted)
+    if not parts:
+        raise ValueError("Provide a search query.")
+    return " ".join(parts)
+
+
+def resolve_kinds(kinds: Iterable[str] | None) -> list[str]:
+    """Return the kinds to search, raising ValueError for unknown ones."""
+    if kinds is None:
+        return list(SEARCH_KINDS)
+    requested = set(kinds)
+    unknown = requested.difference(SEARCH_KINDS)
+    if unknown:
+        raise ValueError(f"Unknown search types: {', '.join(sorted(unknown))}. Allowed: {', '.join(SEARCH_KINDS)}.")
+    return [kind for kind in SEARCH_KINDS if kind in requested]
+
+
+def _rank_floor(
+    conn: sqlite3.Connection,
+    table: str,
+    match: str,
+    source: str | None = None,
+    condition: str = "",
+    params: Sequence = (),
+) -> int:
+    """Lowest rowid of the ``RANK_WINDOW`` most recent matches (0 when there are fewer).
+
+    ``source`` replaces the FROM clause (e.g. to join the content table) and
+    ``condition`` is appended to the WHERE clause, with ``params`` for it.
+    """
+    row = conn.execute(
+        f"""
+        SELECT {table}.rowid FROM {source or table} WHERE {table} MATCH ?{condition}
+        ORDER BY {table}.rowid DESC LIMIT 1 OFFSET ?
+        """,
+        (match, *params, RANK_WINDOW - 1),
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def _bm25(table: str, weights: tuple[float, ...]) -> str:
+    return f"bm25({table}, {', '.join(map(str, weights))})"
+
+
+def _highlight(snippet: str | None) -> str:
+    escaped = html.escape(snippet or "")
+    return escaped.replace(_MATCH_START, "<mark>").replace(_MATCH_END, "</mark>")
+
+
+def _finish(hits: list[dict]) -> list[dict]:
+    for hit in hits:
+        hit["snippet"] = _highlight(hit["snippet"])
+        hit["score"] = -hit["score"]
+    return hits
+
+
+async def search(
+    conn: sqlite3.Connection,
+    text: str,
+    kinds: Sequence[str] | None = None,
+    limit: int = 20,
+) -> dict:
+    """Best-ranked consultants and blocks matching ``text``, optionally limited to some kinds."""
+    match = build_match_query(text)
+    kinds = resolve_kinds(kinds)
+    snippet_args = (_MATCH_START, _MATCH_END, "…", SNIPPET_TOKENS)
+    results = {"consultants": [], "blocks": []}
+
+    if "consultant" in kinds:
+        cursor = conn.execute(
+            f"""
+            SELECT c.id, c.first_name, c.last_name, c.title,
+                   snippet(consultant_search, -1, ?, ?, ?, ?) AS snippet, {_bm25("consultant_search", CONSULTANT_WEIGHTS)} AS score
+            FROM consultant_search JOIN consultants AS c ON c.id = consultant_search.rowid
+            WHERE consultant_search MATCH ? AND consultant_search.rowid >= ?
+            ORDER BY score LIMIT ?
+            """,
+            (*snippet_args, match, _rank_floor(conn, "consultant_search", match), limit),
+        )
+        results["consultants"] = _finish(list_from_rows(cursor.fetchall()))
+
+    block_types = [kind for kind in kinds if kind in BLOCK_TYPES]
+    if block_types:
+        source = "block_search JOIN blocks AS b ON b.id = block_search.rowid"
+        type_filter, type_params = "", []
+        if len(block_types) < len(BLOCK_TYPES):
+            type_filter, type_params = f" AND b.block_type IN ({', '.join(['?'] * len(block_types))})", block_types
+        # Unfiltered walks skip the join: every match is a candidate.
+        floor = _rank_floor(conn, "block_search", match, type_filter and source, type_filter, type_params)
+        cursor = conn.execute(
+            f"""
+            SELECT b.id, b.consultant_id, b.block_type, b.title,
+                   snippet(block_search, -1, ?, ?, ?, ?) AS snippet, {_bm25("block_search", BLOCK_WEIGHTS)} AS score
+            FROM {source}
+            WHERE block_search MATCH ? AND block_search.rowid >= ?{type_filter}
+            ORDER BY score LIMIT ?
+            """,
+            (*snippet_args, match, floor, *type_params, limit),
+        )
+        results["blocks"] = _finish(list_from_rows(cursor.fetchall()))
+
+    return results
@@ -0,0 +1,58 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+from .block_types import BLOCK_TYPES
+
+BLOCK_COUNTER_PREFIX = "blocks:"
+
+
+async def get_dashboard_stats(conn: sqlite3.Connection, weeks: int = 12) -> dict:
+    """Return dashboard totals from trigger-maintained counters.
+
+    Counters are kept current by triggers on every insert/delete, so this
+    reads a handful of rows however large the tables get.
+    """
+    counters = {
+        row["name"]: row["value"]
+        for row in conn.execute("SELECT name, value FROM stats_counters").fetchall()
+    }
+
+    # Expiry depends on the current time, so active links come from the expires_at index.
+    cursor = conn.execute(
+        "SELECT COUNT(*) AS active FROM access_links WHERE expires_at > ?",
+        (datetime.now(timezone.utc),),
+    )
+    active_links = cursor.fetchone()["active"]
+
+    # The last ``weeks`` calendar weeks up to the current one, weeks without profiles as 0.
+    today = datetime.now(timezone.utc).date()
+    first_week = today - timedelta(days=today.weekday(), weeks=weeks - 1)
+    cursor = conn.execute(
+        """
+        WITH RECURSIVE week_starts(week_start, n) AS (
+            SELECT ?, 1
+            UNION ALL
+            SELECT date(week_start, '+7 days'), n + 1 FROM week_starts WHERE n < ?
+        )
+        SELECT week_starts.week_start, COALESCE(profile_weekly_counts.count, 0) AS count
+        FROM week_starts LEFT JOIN profile_weekly_counts USING (week_start)
+        ORDER BY week_starts.week_start
+        """,
+        (first_week.isoformat(), weeks),
+    )
+    profiles_per_week = [{"week_start": row["week_start"], "count": row["count"]} for row in cursor.fetchall()]
+
+    blocks_by_type = {block_type: 0 for block_type in BLOCK_TYPES}
+    for name, value in counters.items():
+        if name.startswith(BLOCK_COUNTER_PREFIX):
+            blocks_by_type[name[len(BLOCK_COUNTER_PREFIX):]] = value
+
+    return {
+        "consultants": counters.get("consultants", 0),
+        "profiles": counters.get("profiles", 0),
+        "blocks": counters.get("blocks", 0),
+        "access_links": counters.get("access_links", 0),
+        "active_access_links": active_links,
+        "blocks_by_type": blocks_by_type,
+        "profiles_per_week": profiles_per_week,
+    }
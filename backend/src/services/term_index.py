@@ -0,0 +1,256 @@
+"""Normalized technology and skill term index (``block_terms``).
+
+Project technologies and skill titles are canonicalized (NFKC, case-folded,
+whitespace collapsed, common aliases resolved) into one posting per
+(term, block). Skill postings carry the rank of the proficiency level as
+exported profiles display it, so "Senior" ranks as Advanced. Block writes keep
+the postings current inside their own transaction, and staffing queries
+intersect the postings of the requested terms instead of scanning blocks.
+
+Postings are also aggregated into one sparse term vector per consultant
+(``consultant_terms``: best skill level, project count, project months, the
+start of open-ended projects and last use per term), refreshed for the affected consultants whenever their
+postings change. Each refresh is appended to ``consultant_term_changes`` so
+the matching service's in-process index can apply just those consultants.
+
+Postings also carry what the skill analytics aggregate: the display level of
+a skill (as exported profiles show it) and the start year of a project.
+Triggers on ``block_terms`` keep the analytics tables in step with them. Parts
+split off a skill title are flagged so that only the whole title is counted;
+they still match staffing queries.
+"""
+
+import json
+import re
+import sqlite3
+import unicodedata
+from typing import Iterable, Sequence
+
+from ..core.database import list_from_rows
+from .block_types import SKILL_DISPLAY_LEVELS, display_skill_level, parse_list_like
+
+# Proficiency levels offered by the editor, lowest first.
+SKILL_LEVELS = {"basic": 1, "intermediate": 2, "advanced": 3, "expert": 4}
+
+# Ranks of the levels profiles display (Proficient stands for the editor's Intermediate).
+_DISPLAY_LEVEL_RANKS = {level: rank for rank, level in enumerate(reversed(SKILL_DISPLAY_LEVELS), start=1)}
+
+# Spellings folded onto one canonical term.
+TERM_ALIASES = {
+    "k8s": "kubernetes",
+    "golang": "go",
+    "js": "javascript",
+    "ts": "typescript",
+    "postgres": "postgresql",
+    "node": "node.js",
+    "nodejs": "node.js",
+}
+
+# Skill titles such as "Kubernetes and Container Platforms" also index their parts.
+_SKILL_TITLE_SEPARATORS = re.compile(r"\s*(?:[,/&;+]|\band\b)\s*")
+_WHITESPACE = re.compile(r"\s+")
+
+# Change log entries kept for lagging match indexes; older ones force a full reload.
+CHANGE_LOG_RETENTION = 10_000
+
+_INSERT_TERM = """
+    INSERT OR IGNORE INTO block_terms (term, block_id, consultant_id, kind, level, label, year, is_title_part)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Project end for recency: open-ended while ongoing, else the end date or start plus duration.
+_PROJECT_LAST_USED = """
+    CASE WHEN b.is_ongoing THEN '9999-12-31'
+         ELSE COALESCE(b.end_date, date(b.start_date, '+' || b.duration_months || ' months'), b.start_date)
+    END
+"""
+# Projects without duration or end date run until today; scoring adds their months for the day.
+_OPEN_ENDED = "(b.duration_months IS NULL AND b.end_date IS NULL AND b.start_date IS NOT NULL)"
+_PROJECT_MONTHS = """
+    COALESCE(b.duration_months, CAST((julianday(b.end_date) - julianday(b.start_date)) / 30.44 AS INTEGER), 0)
+"""
+
+
+def canonical_term(text: str) -> str:
+    """Canonical, case-folded spelling of a technology or skill name."""
+    term = _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", str(text)).casefold()).strip()
+    return TERM_ALIASES.get(term, term)
+
+
+def skill_level_rank(level: str | None) -> int | None:
+    """Rank of a named proficiency level (Basic=1 .. Expert=4), or None for other names."""
+    if not level:
+        return None
+    return SKILL_LEVELS.get(str(level).strip().casefold())
+
+
+def proficiency_rank(level: str | None) -> int:
+    """Rank of a block's free-text proficiency level, as exported profiles display it."""
+    return _DISPLAY_LEVEL_RANKS[display_skill_level(level)]
+
+
+def block_term_rows(block: dict) -> list[tuple]:
+    """Postings (term, block_id, consultant_id, kind, level) for one active block row."""
+    if not block.get("is_active", True):
+        return []
+    if block["block_type"] == "project":
+        kind, level = "technology", None
+        names = parse_list_like(block.get("technologies"))
+    elif block["block_type"] == "skill":
+        kind, level = "skill", proficiency_rank(block.get("proficiency_level"))
+        title = block.get("title") or ""
+        names = [title, *_SKILL_TITLE_SEPARATORS.split(title)]
+    else:
+        return []
+
+    terms = dict.fromkeys(term for term in map(canonical_term, names) if term)
+    return [(term, block["id"], block["consultant_id"], kind, level) for term in terms]
+
+
+def _start_year(block: dict) -> int | None:
+    """Year a project started (its end year when only that is known)."""
+    value = block.get("start_date") or block.get("end_date")
+    return int(str(value)[:4]) if value else None
+
+
+def posting_rows(block: dict) -> list[tuple]:
+    """Postings of one block as stored: ``block_term_rows`` plus the analytics attributes.
+
+    These are the skill display level or project year, and whether the term is
+    only a part of the skill title.
+    """
+    rows = block_term_rows(block)
+    if not rows:
+        return rows
+    if block["block_type"] == "skill":
+        label, year = display_skill_level(block.get("proficiency_level")), None
+        title = canonical_term(block.get("title") or "")
+        return [(*row, label, year, row[0] != title) for row in rows]
+    year = _start_year(block)
+    return [(*row, None, year, False) for row in rows]
+
+
+def consultant_terms_select(where: str = "") -> str:
+    """SELECT producing ``consultant_terms`` rows from the postings, optionally filtered by ``where``."""
+    return f"""
+        SELECT bt.term, bt.consultant_id,
+               MAX(CASE WHEN bt.kind = 'skill' THEN COALESCE(bt.level, 1) END),
+               SUM(bt.kind = 'technology'),
+               SUM(CASE WHEN bt.kind = 'technology' AND NOT {_OPEN_ENDED} THEN {_PROJECT_MONTHS} ELSE 0 END),
+               MIN(CASE WHEN bt.kind = 'technology' AND {_OPEN_ENDED} THEN date(b.start_date) END),
+               MAX(CASE WHEN bt.kind = 'technology' THEN {_PROJECT_LAST_USED} END)
+        FROM block_terms AS bt JOIN blocks AS b ON b.id = bt.block_id
+        {where}
+        GROUP BY bt.term, bt.consultant_id
+    """
+
+
+def refresh_consultant_terms(conn: sqlite3.Connection, consultant_ids: Iterable[int]) -> None:
+    """Rebuild the term vectors of some consultants from their current postings."""
+    ids = json.dumps(sorted(set(consultant_ids)))
+    if ids == "[]":
+        return
+    conn.execute("DELETE FROM consultant_terms WHERE consultant_id IN (SELECT value FROM json_each(?))", (ids,))
+    conn.execute(
+        "INSERT INTO consultant_terms "
+        "(term, consultant_id, skill_level, project_count, project_months, ongoing_since, last_used)"
+        + consultant_terms_select("WHERE bt.consultant_id IN (SELECT value FROM json_each(?))"),
+        (ids,),
+    )
+    conn.execute("INSERT INTO consultant_term_changes (consultant_id) SELECT value FROM json_each(?)", (ids,))
+    conn.execute(
+        "DELETE FROM consultant_term_changes WHERE seq <= (SELECT MAX(seq) FROM consultant_term_changes) - ?",
+        (CHANGE_LOG_RETENTION,),
+    )
+
+
+def _drop_postings(conn: sqlite3.Connection, block_ids: Iterable[int]) -> set[int]:
+    """Delete the postings of blocks and return the consultants they belonged to."""
+    ids = json.dumps(list(block_ids))
+    cursor = conn.execute(
+        "SELECT DISTINCT consultant_id FROM block_terms WHERE block_id IN (SELECT value FROM json_each(?))", (ids,)
+    )
+    consultant_ids = {row[0] for row in cursor.fetchall()}
+    if consultant_ids:
+        conn.execute("DELETE FROM block_terms WHERE block_id IN (SELECT value FROM json_each(?))", (ids,))
+    return consultant_ids
+
+
+def unindex_blocks(conn: sqlite3.Connection, block_ids: Iterable[int]) -> None:
+    """Drop the postings of deleted blocks and refresh their consultants' term vectors."""
+    refresh_consultant_terms(conn, _drop_postings(conn, block_ids))
+
+
+def index_blocks(conn: sqlite3.Connection, blocks: Sequence[dict]) -> None:
+    """Replace the postings of block rows, and their consultants' term vectors, in the caller's transaction."""
+    if not blocks:
+        return
+    consultant_ids = _drop_postings(conn, [block["id"] for block in blocks])
+    conn.executemany(_INSERT_TERM, [row for block in blocks for row in posting_rows(block)])
+    refresh_consultant_terms(conn, consultant_ids | {block["consultant_id"] for block in blocks})
+
+
+def rebuild_postings(conn: sqlite3.Connection, batch_size: int = 1000) -> int:
+    """Re-derive every posting and term vector from the blocks table; return the postings written."""
+    conn.execute("DELETE FROM block_terms")
+    cursor = conn.execute("SELECT * FROM blocks WHERE is_active = 1 AND block_type IN ('project', 'skill')")
+    postings = 0
+    while blocks := list_from_rows(cursor.fetchmany(batch_size)):
+        rows = [row for block in blocks for row in posting_rows(block)]
+        conn.executemany(_INSERT_TERM, rows)
+        postings += len(rows)
+    conn.execute("DELETE FROM consultant_terms")
+    refresh_consultant_terms(conn, [row[0] for row in conn.execute("SELECT id FROM consultants").fetchall()])
+    return postings
+
+
+async def find_consultants(
+    conn: sqlite3.Connection,
+    terms: Sequence[str],
+    min_level: str | None = None,
+    limit: int = 100,
+) -> list[dict]:
+    """Consultants holding every term (skill terms at ``min_level`` or above when given), with matching blocks."""
+    canonical = list(dict.fromkeys(term for term in map(canonical_term, terms) if term))
+    if not canonical:
+        raise ValueError("Provide at least one term.")
+    rank = None
+    if min_level is not None:
+        rank = skill_level_rank(min_level)
+        if rank is None:
+            raise ValueError(f"Unknown level: {min_level}. Use one of: {', '.join(SKILL_LEVELS)}.")
+
+    placeholders = ", ".join(["?"] * len(canonical))
+    query = f"""
+        SELECT bt.term, bt.kind, bt.block_id, bt.consultant_id, b.block_type, b.title, b.proficiency_level
+        FROM block_terms AS bt JOIN blocks AS b ON b.id = bt.block_id
+        WHERE bt.term IN ({placeholders})
+    """
+    params: list = list(canonical)
+    if rank is not None:
+        query += " AND bt.level >= ?"
+        params.append(rank)
+    postings = list_from_rows(conn.execute(query + " ORDER BY bt.term, bt.block_id", params).fetchall())
+
+    # Intersect the per-term consultant sets.
+    consultants_by_term: dict[str, set[int]] = {term: set() for term in canonical}
+    for posting in postings:
+        consultants_by_term[posting["term"]].add(posting["consultant_id"])
+    matched = set.intersection(*consultants_by_term.values())
+    if not matched:
+        return []
+
+    consultants = list_from_rows(conn.execute(
+        """SELECT id, first_name, last_name, email, title FROM consultants
+           WHERE id IN (SELECT value FROM json_each(?))
+           ORDER BY last_name, first_name, id LIMIT ?""",
+        (json.dumps(sorted(matched)), limit),
+    ).fetchall())
+    matches_by_consultant: dict[int, list[dict]] = {consultant["id"]: [] for consultant in consultants}
+    for posting in postings:
+        consultant_matches = matches_by_consultant.get(posting.pop("consultant_id"))
+        if consultant_matches is not None:
+            consultant_matches.append(posting)
+    for consultant in consultants:
+        consultant["matches"] = matches_by_consultant[consultant["id"]]
+    return consultants
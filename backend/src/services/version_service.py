@@ -0,0 +1,27 @@
+import sqlite3
+
+
+def consultant_scope(consultant_id: int) -> str:
+    return f"consultant:{consultant_id}"
+
+
+def consultant_blocks_scope(consultant_id: int) -> str:
+    return f"blocks:{consultant_id}"
+
+
+def consultant_profiles_scope(consultant_id: int) -> str:
+    return f"profiles:{consultant_id}"
+
+
+def profile_scope(profile_id: int) -> str:
+    return f"profile:{profile_id}"
+
+
+CONSULTANTS_SCOPE = "consultants"
+PROFILES_SCOPE = "profiles"
+
+
+async def get_version(conn: sqlite3.Connection, scope: str) -> int:
+    """Return the trigger-maintained write counter for a scope (0 before its first write)."""
+    row = conn.execute("SELECT version FROM resource_versions WHERE scope = ?", (scope,)).fetchone()
+    return row["version"] if row else 0
@@ -22,11 +22,34 @@ export const useBlocksStore = defineStore('blocks', () => {
     return grouped
   })
 
+  // Delta-sync state: the listing the blocks came from and its X-Sync-Cursor.
+  let syncUrl = null
+  let syncCursor = null
+
+  function sortBlocks(list) {
+    return list.sort((a, b) => a.order - b.order || b.created_at.localeCompare(a.created_at))
+  }
+
+  function mergeChanges(changes) {
+    const byId = new Map(blocks.value.map((block) => [block.id, block]))
+    for (const block of changes) {
+      if (block.is_active) {
+        byId.set(block.id, block)
+      } else {
+        byId.delete(block.id)
+      }
+    }
+    return sortBlocks([...byId.values()])
+  }
+
   async function fetchBlocks(consultantId, viaToken = null) {
     try {
       const url = viaToken ? `/blocks/edit/${viaToken}` : `/blocks/consultant/${consultantId}`
-      const response = await api.get(url)
-      blocks.value = response.data
+      const delta = url === syncUrl && syncCursor
+      const response = await api.get(url, delta ? { params: { since: syncCursor } } : undefined)
+      blocks.value = delta ? mergeChanges(response.data) : response.data
+      syncUrl = url
+      syncCursor = response.headers['x-sync-cursor'] || null
       return blocks.value
     } catch (error) {
       console.error('Error fetching blocks:', error)
@@ -72,6 +95,28 @@ export const useBlocksStore = defineStore('blocks', () => {
     }
   }
 
+  async function applyBatch(operations, viaToken) {
+    try {
+      const response = await api.post(`/blocks/edit/${viaToken}/batch`, { operations })
+      for (const result of response.data.results) {
+        if (result.status === 'created') {
+          blocks.value.push(result.block)
+        } else if (result.status === 'updated') {
+          const index = blocks.value.findIndex((b) => b.id === result.id)
+          if (index !== -1) {
+            blocks.value[index] = result.block
+          }
+        } else if (result.status === 'deleted') {
+          blocks.value = blocks.value.filter((b) => b.id !== result.id)
+        }
+      }
+      return response.data.results
+    } catch (error) {
+      console.error('Error applying block batch:', error)
+      throw error
+    }
+  }
+
   async function reorderBlocks(blockOrders, viaToken = null) {
     try {
       const url = viaToken ? `/blocks/edit/${viaToken}/reorder` : `/blocks/reorder`
@@ -82,6 +127,16 @@ export const useBlocksStore = defineStore('blocks', () => {
     }
   }
 
+  async function moveBlock(blockId, afterId, viaToken = null) {
+    try {
+      const url = viaToken ? `/blocks/edit/${viaToken}/reorder` : `/blocks/reorder`
+      await api.post(url, { moves: [{ id: blockId, after_id: afterId }] })
+    } catch (error) {
+      console.error('Error moving block:', error)
+      throw error
+    }
+  }
+
   return {
     blocks,
     blocksByType,
@@ -89,6 +144,8 @@ export const useBlocksStore = defineStore('blocks', () => {
     createBlock,
     updateBlock,
     deleteBlock,
-    reorderBlocks
+    applyBatch,
+    reorderBlocks,
+    moveBlock
   }
 })
@@ -55,9 +55,9 @@ export const useProfilesStore = defineStore('profiles', () => {
     }
   }
 
-  async function fetchConsultantProfiles(consultantId) {
+  async function fetchConsultantProfiles(consultantId, { view = 'full' } = {}) {
     try {
-      const response = await api.get(`/profiles/consultant/${consultantId}`)
+      const response = await api.get(`/profiles/consultant/${consultantId}`, { params: { view } })
       return response.data
     } catch (error) {
       console.error('Error fetching consultant profiles:', error)
@@ -87,6 +87,20 @@ export const useProfilesStore = defineStore('profiles', () => {
     }
   }
 
+  async function suggestBlocks(consultantId, { skills, maxPages = 2 }) {
+    try {
+      const response = await api.post('/profiles/suggest-blocks', {
+        consultant_id: consultantId,
+        skills,
+        max_pages: maxPages
+      })
+      return response.data
+    } catch (error) {
+      console.error('Error suggesting profile blocks:', error)
+      throw error
+    }
+  }
+
   async function deleteProfile(id) {
     try {
       await api.delete(`/profiles/${id}`)
@@ -174,6 +188,7 @@ export const useProfilesStore = defineStore('profiles', () => {
     fetchConsultantProfiles,
     fetchProfile,
     createProfile,
+    suggestBlocks,
     updateProfile,
     deleteProfile,
     duplicateProfile,